@@ -11,25 +11,123 @@ Features:
 """
 
 import os
-import winreg
-import subprocess
-import psutil
-import shutil
+import ctypes
+import ctypes.wintypes
+import hashlib
+import heapq
+import mmap
+import contextlib
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
 import logging
-import json
+import time
+import threading
 from datetime import datetime
 
+# BLAKE3 (SIMD, multithreaded) is used for full-content hashing when installed
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
+# Duplicate detection: bytes sampled for the quick pre-filter hash and the
+# block size used when comparing full file content to confirm a match
+PARTIAL_HASH_SIZE = 64 * 1024
+FULL_HASH_BLOCK_SIZE = 1024 * 1024
+
+# Same-size groups up to this many files are compared in lockstep with every
+# file mapped at once; bigger groups are hashed one file at a time so open
+# handles and mapped address space stay bounded
+FULL_COMPARE_MAX_OPEN = 32
+
+# Directory scans are stat-latency bound, so threads overlap the syscalls
+SCAN_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# SetErrorMode flag that suppresses critical-error dialogs for unready drives
+SEM_FAILCRITICALERRORS = 0x0001
+
+# Registry locations as (winreg hive name, subkey); winreg is imported lazily
+STARTUP_REGISTRY_PATHS = (
+    ('HKEY_CURRENT_USER', r"SOFTWARE\Microsoft\Windows\CurrentVersion\Run"),
+    ('HKEY_LOCAL_MACHINE', r"SOFTWARE\Microsoft\Windows\CurrentVersion\Run"),
+    ('HKEY_CURRENT_USER', r"SOFTWARE\Microsoft\Windows\CurrentVersion\RunOnce"),
+    ('HKEY_LOCAL_MACHINE', r"SOFTWARE\Microsoft\Windows\CurrentVersion\RunOnce")
+)
+
+SAFE_CLEANUP_REGISTRY_PATHS = (
+    # Temporary entries
+    ('HKEY_CURRENT_USER', r"SOFTWARE\Microsoft\Windows\CurrentVersion\Explorer\RecentDocs"),
+    # MRU (Most Recently Used) lists
+    ('HKEY_CURRENT_USER', r"SOFTWARE\Microsoft\Windows\CurrentVersion\Explorer\RunMRU"),
+    # Temporary internet files references
+    ('HKEY_CURRENT_USER', r"SOFTWARE\Microsoft\Windows\CurrentVersion\Internet Settings\Cache")
+)
+
+# FindFirstFileExW options: skip 8.3 names and fetch many entries per call
+FIND_EX_INFO_BASIC = 1
+FIND_EX_SEARCH_NAME_MATCH = 0
+FIND_FIRST_EX_LARGE_FETCH = 0x2
+FILE_ATTRIBUTE_DIRECTORY = 0x10
+FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+ERROR_NO_MORE_FILES = 18
+
+# Seconds a comprehensive-analysis result is reused before re-running it
+ANALYSIS_CACHE_TTL = 60.0
+
+# Non-blocking CPU readings need this much time since the previous sample to
+# be meaningful; closer calls take a short blocking sample instead
+CPU_SAMPLE_MIN_INTERVAL = 0.1
+CPU_SAMPLE_FALLBACK_INTERVAL = 0.05
+
 class EnterpriseSystemOptimizer:
     """
     Advanced system optimization features for enterprise deployment
     """
     
+    # Common programs that can be safely disabled
+    _SAFE_TO_DISABLE_RE = re.compile(
+        r'spotify|steam|discord|skype|adobe|office|itunes|quicktime|realplayer|winamp',
+        re.IGNORECASE
+    )
+    
+    # Critical programs that should not be disabled
+    _KEEP_ENABLED_RE = re.compile(
+        r'windows security|antivirus|firewall|audio driver|graphics driver|touchpad|bluetooth',
+        re.IGNORECASE
+    )
+    
     def __init__(self, logger: logging.Logger):
         self.logger = logger
         self.registry_keys_cleaned = 0
         self.startup_items_processed = 0
+        self._counter_lock = threading.Lock()
+        self._cache: Dict[str, Tuple[float, Dict]] = {}
+        self._kernel32 = self._load_kernel32()
+        self._registry_roots: Dict[int, object] = {}
+        self._registry_lock = threading.Lock()
+        self._last_cpu_sample: Optional[float] = None
+        
+        # Scan roots are resolved once; Path.home() is a lookup on every call
+        home = str(Path.home())
+        self._large_dir_check_paths = (
+            os.path.join(home, 'Downloads'),
+            os.path.join(home, 'Documents'),
+            os.path.join(home, 'Desktop'),
+            os.path.join(home, 'Videos'),
+            os.path.join(home, 'Pictures'),
+            'C:\\Program Files',
+            'C:\\Program Files (x86)',
+            os.path.join(home, 'AppData', 'Local')
+        )
+        self._duplicate_search_paths = (os.path.join(home, 'Downloads'), os.path.join(home, 'Documents'))
+        self._startup_folder = os.path.join(
+            home, 'AppData', 'Roaming', 'Microsoft', 'Windows', 'Start Menu', 'Programs', 'Startup'
+        )
         
     def analyze_disk_usage(self) -> Dict:
         """
@@ -38,35 +136,14 @@ class EnterpriseSystemOptimizer:
         self.logger.info("Starting disk space analysis...")
         
         try:
-            drives = []
-            
-            # Get all available drives
-            for drive_letter in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
-                drive_path = f"{drive_letter}:\\"
-                if os.path.exists(drive_path):
-                    try:
-                        usage = shutil.disk_usage(drive_path)
-                        drive_info = {
-                            'drive': drive_letter,
-                            'total_gb': usage.total / (1024**3),
-                            'used_gb': usage.used / (1024**3),
-                            'free_gb': usage.free / (1024**3),
-                            'usage_percent': (usage.used / usage.total) * 100
-                        }
-                        drives.append(drive_info)
-                    except (OSError, PermissionError):
-                        continue
-            
-            # Analyze large directories on C: drive
-            large_dirs = self._find_large_directories()
-            
-            # Find duplicate files (sample implementation)
-            duplicates = self._find_potential_duplicates()
+            results = {'drive': [], 'large_directory': [], 'duplicate': []}
+            for category, item in self.analyze_disk_usage_iter():
+                results[category].append(item)
             
             return {
-                'drives': drives,
-                'large_directories': large_dirs,
-                'potential_duplicates': duplicates,
+                'drives': results['drive'],
+                'large_directories': sorted(results['large_directory'], key=lambda x: x['size_gb'], reverse=True),
+                'potential_duplicates': results['duplicate'],
                 'analysis_time': datetime.now().isoformat()
             }
             
@@ -74,92 +151,391 @@ class EnterpriseSystemOptimizer:
             self.logger.error(f"Disk analysis failed: {e}")
             return {'error': str(e)}
     
-    def _find_large_directories(self, min_size_gb: float = 1.0) -> List[Dict]:
-        """Find directories larger than specified size"""
-        large_dirs = []
-        
-        # Common directories to check
-        check_paths = [
-            Path.home() / "Downloads",
-            Path.home() / "Documents",
-            Path.home() / "Desktop",
-            Path.home() / "Videos",
-            Path.home() / "Pictures",
-            Path("C:/Program Files"),
-            Path("C:/Program Files (x86)"),
-            Path.home() / "AppData/Local"
-        ]
+    def analyze_disk_usage_iter(self) -> Iterator[Tuple[str, Dict]]:
+        """
+        Stream disk analysis findings as (category, item) pairs while scanning.
+        Categories are 'drive', 'large_directory' (in completion order, not
+        sorted) and 'duplicate'.
+        """
+        import shutil
         
-        for path in check_paths:
-            if path.exists():
+        # Get all available drives. An empty card reader or DVD drive raises a
+        # "no disk" dialog on disk_usage, so the probes run with critical-error
+        # dialogs off and are yielded once the error mode is back
+        drives = []
+        with self._critical_errors_suppressed():
+            for drive_letter in self._get_drive_letters():
+                drive_path = f"{drive_letter}:\\"
                 try:
-                    size = self._get_directory_size(path)
-                    size_gb = size / (1024**3)
-                    
-                    if size_gb >= min_size_gb:
-                        large_dirs.append({
-                            'path': str(path),
-                            'size_gb': round(size_gb, 2),
-                            'size_mb': round(size / (1024**2), 2)
-                        })
+                    usage = shutil.disk_usage(drive_path)
                 except (OSError, PermissionError):
                     continue
-                    
-        return sorted(large_dirs, key=lambda x: x['size_gb'], reverse=True)
+                drives.append({
+                    'drive': drive_letter,
+                    'total_gb': usage.total / (1024**3),
+                    'used_gb': usage.used / (1024**3),
+                    'free_gb': usage.free / (1024**3),
+                    'usage_percent': (usage.used / usage.total) * 100
+                })
+        for drive in drives:
+            yield 'drive', drive
+        
+        # Analyze large directories on C: drive
+        for large_dir in self._iter_large_directories():
+            yield 'large_directory', large_dir
+        
+        # Find duplicate files - top 10 groups
+        for duplicate in islice(self._iter_potential_duplicates(), 10):
+            yield 'duplicate', duplicate
+    
+    def _load_kernel32(self):
+        """
+        Private kernel32 with the directory-listing prototypes set, or None off
+        Windows. ctypes.windll.kernel32 is shared with every other module in the
+        process, so its argtypes are left alone.
+        """
+        try:
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        except (AttributeError, OSError):
+            return None
+        
+        kernel32.FindFirstFileExW.restype = ctypes.wintypes.HANDLE
+        kernel32.FindFirstFileExW.argtypes = [
+            ctypes.wintypes.LPCWSTR, ctypes.c_int, ctypes.c_void_p,
+            ctypes.c_int, ctypes.c_void_p, ctypes.wintypes.DWORD
+        ]
+        kernel32.FindNextFileW.argtypes = [ctypes.wintypes.HANDLE, ctypes.c_void_p]
+        kernel32.FindClose.argtypes = [ctypes.wintypes.HANDLE]
+        kernel32.GetLogicalDrives.restype = ctypes.wintypes.DWORD
+        kernel32.GetErrorMode.restype = ctypes.wintypes.UINT
+        kernel32.SetErrorMode.restype = ctypes.wintypes.UINT
+        kernel32.SetErrorMode.argtypes = [ctypes.wintypes.UINT]
+        return kernel32
     
-    def _get_directory_size(self, path: Path) -> int:
-        """Calculate directory size recursively"""
+    def _get_drive_letters(self) -> List[str]:
+        """Letters of mounted drives from the GetLogicalDrives bitmask"""
+        if self._kernel32 is None:
+            # Not on Windows - fall back to probing each letter
+            return [letter for letter in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ' if os.path.exists(f"{letter}:\\")]
+        
+        mask = self._kernel32.GetLogicalDrives()
+        return [chr(ord('A') + i) for i in range(26) if mask & (1 << i)]
+    
+    @contextlib.contextmanager
+    def _critical_errors_suppressed(self):
+        """
+        SEM_FAILCRITICALERRORS for the duration of the block. The error mode is
+        process-wide, so the previous mode is put back afterwards.
+        """
+        if self._kernel32 is None:
+            yield
+            return
+        
+        old_mode = self._kernel32.GetErrorMode()
+        self._kernel32.SetErrorMode(old_mode | SEM_FAILCRITICALERRORS)
+        try:
+            yield
+        finally:
+            self._kernel32.SetErrorMode(old_mode)
+    
+    def _find_large_directories(self, min_size_gb: float = 1.0) -> List[Dict]:
+        """Find directories larger than specified size"""
+        return sorted(self._iter_large_directories(min_size_gb), key=lambda x: x['size_gb'], reverse=True)
+    
+    def _iter_large_directories(self, min_size_gb: float = 1.0) -> Iterator[Dict]:
+        """
+        Yield directories larger than specified size as their scans finish.
+        Each root's top level is listed here and every subdirectory below all
+        roots is sized on one shared pool of SCAN_MAX_WORKERS threads.
+        """
+        existing_paths = [path for path in self._large_dir_check_paths if os.path.isdir(path)]
+        
+        # root -> [bytes so far, subdirectory scans still running]
+        totals = {}
+        with ThreadPoolExecutor(max_workers=SCAN_MAX_WORKERS) as executor:
+            futures = {}
+            for path in existing_paths:
+                file_bytes, subdirs = self._scan_directory(path)
+                totals[path] = [file_bytes, len(subdirs)]
+                for subdir in subdirs:
+                    futures[executor.submit(self._scan_tree_size, subdir)] = path
+            
+            # Roots with no subdirectories are already complete
+            finished = [path for path, (_, pending) in totals.items() if not pending]
+            finished_futures = as_completed(futures)
+            while True:
+                for path in finished:
+                    large_dir = self._large_directory_entry(path, totals[path][0], min_size_gb)
+                    if large_dir is not None:
+                        yield large_dir
+                future = next(finished_futures, None)
+                if future is None:
+                    break
+                path = futures[future]
+                totals[path][0] += future.result()
+                totals[path][1] -= 1
+                finished = [path] if not totals[path][1] else []
+    
+    def _large_directory_entry(self, path: str, size: int, min_size_gb: float) -> Optional[Dict]:
+        """_iter_large_directories' result for path, or None below min_size_gb"""
+        size_gb = size / (1024**3)
+        if size_gb < min_size_gb:
+            return None
+        return {
+            'path': path,
+            'size_gb': round(size_gb, 2),
+            'size_mb': round(size / (1024**2), 2)
+        }
+    
+    def _scan_tree_size(self, path: str) -> int:
+        """Sum file sizes below path with an explicit os.scandir stack"""
         total_size = 0
+        stack = [path]
+        while stack:
+            file_bytes, subdirs = self._scan_directory(stack.pop())
+            total_size += file_bytes
+            stack.extend(subdirs)
+        return total_size
+    
+    def _scan_directory(self, path) -> Tuple[int, List[str]]:
+        """
+        One directory level: total bytes of its files and its subdirectory paths.
+        Sizes come from the directory listing itself, so files cost no extra syscall.
+        """
+        if self._kernel32 is not None:
+            return self._scan_directory_win32(str(path))
+        
+        total_size = 0
+        subdirs = []
+        # One try per directory rather than per entry: DirEntry type checks
+        # and stats rarely fail once the listing itself succeeded
         try:
-            for item in path.rglob('*'):
-                if item.is_file():
-                    try:
-                        total_size += item.stat().st_size
-                    except (OSError, PermissionError):
-                        continue
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        attributes = getattr(entry.stat(follow_symlinks=False), 'st_file_attributes', 0)
+                        if not self._is_skipped_directory(entry.path, attributes):
+                            subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total_size += entry.stat(follow_symlinks=False).st_size
         except (OSError, PermissionError):
             pass
-        return total_size
+        return total_size, subdirs
     
-    def _find_potential_duplicates(self) -> List[Dict]:
-        """Find potential duplicate files (basic implementation)"""
-        duplicates = []
+    def _scan_directory_win32(self, path: str) -> Tuple[int, List[str]]:
+        """_scan_directory via FindFirstFileExW with FIND_FIRST_EX_LARGE_FETCH"""
+        total_size = 0
+        subdirs = []
+        kernel32 = self._kernel32
+        data = ctypes.wintypes.WIN32_FIND_DATAW()
+        
+        handle = kernel32.FindFirstFileExW(
+            os.path.join(path, '*'), FIND_EX_INFO_BASIC, ctypes.byref(data),
+            FIND_EX_SEARCH_NAME_MATCH, None, FIND_FIRST_EX_LARGE_FETCH
+        )
+        if handle is None or handle == INVALID_HANDLE_VALUE:
+            return total_size, subdirs
         
-        # This is a simplified implementation
-        # In production, you'd use file hashing for accurate duplicate detection
+        try:
+            while True:
+                name = data.cFileName
+                attributes = data.dwFileAttributes
+                if name not in ('.', '..'):
+                    if attributes & FILE_ATTRIBUTE_DIRECTORY:
+                        subdir = os.path.join(path, name)
+                        if not self._is_skipped_directory(subdir, attributes):
+                            subdirs.append(subdir)
+                    elif not attributes & FILE_ATTRIBUTE_REPARSE_POINT:
+                        total_size += (data.nFileSizeHigh << 32) | data.nFileSizeLow
+                if not kernel32.FindNextFileW(handle, ctypes.byref(data)):
+                    error = ctypes.get_last_error()
+                    if error != ERROR_NO_MORE_FILES:
+                        self.logger.debug(f"Listing {path} stopped early: {ctypes.FormatError(error)}")
+                    break
+        finally:
+            kernel32.FindClose(handle)
+        return total_size, subdirs
+    
+    def _is_skipped_directory(self, path: str, attributes: int) -> bool:
+        """
+        Junctions and other reparse points (e.g. AppData's "Application Data"
+        loop) would be counted twice or recurse forever, and the locked
+        WindowsApps tree only yields access errors.
+        """
+        if attributes & FILE_ATTRIBUTE_REPARSE_POINT:
+            return True
+        return os.path.basename(path) == 'WindowsApps'
+    
+    def _iter_files(self, path: str, extensions: frozenset):
+        """Yield (path, extension, size) for files below path with a matching extension"""
+        stack = [path]
+        while stack:
+            current = stack.pop()
+            matches = []
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            attributes = getattr(entry.stat(follow_symlinks=False), 'st_file_attributes', 0)
+                            if not self._is_skipped_directory(entry.path, attributes):
+                                stack.append(entry.path)
+                            continue
+                        ext = os.path.splitext(entry.name)[1].lower()
+                        if ext in extensions and entry.is_file(follow_symlinks=False):
+                            matches.append((entry.path, ext, entry.stat(follow_symlinks=False).st_size))
+            except (OSError, PermissionError):
+                pass
+            yield from matches
+    
+    def _find_potential_duplicates(self) -> List[Dict]:
+        """Find duplicate files (size grouping, partial hash, then full hash)"""
+        return list(islice(self._iter_potential_duplicates(), 10))  # Top 10 duplicate groups
+    
+    def _iter_potential_duplicates(self) -> Iterator[Dict]:
+        """Yield confirmed duplicate groups; stopping early skips the remaining hashing"""
         common_extensions = ['.jpg', '.png', '.mp4', '.pdf', '.docx', '.xlsx']
+        ext_set = frozenset(common_extensions)
+        files_by_size = {ext: defaultdict(list) for ext in common_extensions}
+        
+        # Check Downloads and Documents folders in one pass for all extensions
+        for base_path in self._duplicate_search_paths:
+            if os.path.isdir(base_path):
+                for file_path, ext, size in self._iter_files(base_path, ext_set):
+                    if size > 1024 * 1024:  # Files larger than 1MB
+                        files_by_size[ext][size].append(file_path)
         
         for ext in common_extensions:
-            files_by_size = {}
-            
-            # Check Downloads and Documents folders
-            for base_path in [Path.home() / "Downloads", Path.home() / "Documents"]:
-                if base_path.exists():
-                    try:
-                        for file_path in base_path.rglob(f'*{ext}'):
-                            if file_path.is_file():
-                                try:
-                                    size = file_path.stat().st_size
-                                    if size > 1024 * 1024:  # Files larger than 1MB
-                                        if size not in files_by_size:
-                                            files_by_size[size] = []
-                                        files_by_size[size].append(str(file_path))
-                                except (OSError, PermissionError):
-                                    continue
-                    except (OSError, PermissionError):
-                        continue
-            
-            # Find potential duplicates (same size)
-            for size, file_list in files_by_size.items():
-                if len(file_list) > 1:
-                    duplicates.append({
+            # Only files sharing a size can be duplicates - confirm by content
+            for size, file_list in files_by_size[ext].items():
+                if len(file_list) < 2:
+                    continue
+                
+                for file_hash, matching_files in self._confirm_duplicates(file_list):
+                    yield {
                         'extension': ext,
                         'size_mb': round(size / (1024**2), 2),
-                        'files': file_list,
-                        'potential_savings_mb': round((size * (len(file_list) - 1)) / (1024**2), 2)
-                    })
+                        'files': matching_files,
+                        'hash': file_hash,
+                        'potential_savings_mb': round((size * (len(matching_files) - 1)) / (1024**2), 2)
+                    }
+    
+    def _confirm_duplicates(self, file_list: List[str]) -> List[Tuple[str, List[str]]]:
+        """Split same-size files into groups with identical content"""
+        # Stage 1: cheap hash of the first block weeds out most non-duplicates
+        by_partial_hash = defaultdict(list)
+        for file_path in file_list:
+            partial_hash = self._hash_file_head(file_path)
+            if partial_hash is not None:
+                by_partial_hash[partial_hash].append(file_path)
+        
+        # Stage 2: full-content comparison only for files whose first block collides
+        confirmed = []
+        for candidates in by_partial_hash.values():
+            if len(candidates) > 1:
+                confirmed.extend(self._compare_full_content(candidates))
+        
+        return confirmed
+    
+    def _hash_file_head(self, file_path: str) -> Optional[str]:
+        """Hash the first PARTIAL_HASH_SIZE bytes of a file"""
+        try:
+            with open(file_path, 'rb') as f:
+                return hashlib.blake2b(f.read(PARTIAL_HASH_SIZE), digest_size=16).hexdigest()
+        except (OSError, PermissionError):
+            return None
+    
+    def _new_content_hasher(self):
+        """Incremental hasher for full-content comparison"""
+        if blake3 is not None:
+            return blake3(max_threads=blake3.AUTO)
+        return hashlib.blake2b(digest_size=16)
+    
+    def _compare_full_content(self, file_list: List[str]) -> List[Tuple[str, List[str]]]:
+        """
+        Hash same-size files block by block through read-only memory maps.
+        Groups are re-split after every block, so once a file diverges from
+        all others no more of it is read.
+        """
+        if len(file_list) > FULL_COMPARE_MAX_OPEN:
+            return self._compare_full_content_each(file_list)
+        
+        handles = []
+        try:
+            for file_path in file_list:
+                try:
+                    f = open(file_path, 'rb')
+                except (OSError, PermissionError):
+                    continue
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    f.close()
+                    continue
+                if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                # Blocks are hashed through memoryview slices, which don't copy
+                handles.append((file_path, f, mm, memoryview(mm)))
+            
+            if len(handles) < 2:
+                return []
+            
+            # Each group holds (path, view, running hasher) for files still identical
+            groups = [[(path, view, self._new_content_hasher()) for path, _, _, view in handles]]
+            size = len(handles[0][3])
+            
+            for offset in range(0, size, FULL_HASH_BLOCK_SIZE):
+                next_groups = []
+                for group in groups:
+                    by_digest = defaultdict(list)
+                    for member in group:
+                        hasher = member[2]
+                        hasher.update(member[1][offset:offset + FULL_HASH_BLOCK_SIZE])
+                        by_digest[hasher.digest()].append(member)
+                    next_groups.extend(g for g in by_digest.values() if len(g) > 1)
+                groups = next_groups
+                if not groups:
+                    break
+            
+            return [(group[0][2].hexdigest(), [path for path, _, _ in group]) for group in groups]
+        finally:
+            for _, f, mm, view in handles:
+                view.release()
+                mm.close()
+                f.close()
+    
+    def _compare_full_content_each(self, file_list: List[str]) -> List[Tuple[str, List[str]]]:
+        """_compare_full_content for large groups: one file open at a time, grouped by full hash"""
+        by_hash = defaultdict(list)
+        for file_path in file_list:
+            file_hash = self._hash_full_content(file_path)
+            if file_hash is not None:
+                by_hash[file_hash].append(file_path)
+        return [(file_hash, paths) for file_hash, paths in by_hash.items() if len(paths) > 1]
+    
+    def _hash_full_content(self, file_path: str) -> Optional[str]:
+        """Hash a whole file block by block through a read-only memory map"""
+        try:
+            with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher = self._new_content_hasher()
+                view = memoryview(mm)
+                try:
+                    for offset in range(0, len(view), FULL_HASH_BLOCK_SIZE):
+                        hasher.update(view[offset:offset + FULL_HASH_BLOCK_SIZE])
+                finally:
+                    view.release()
+                return hasher.hexdigest()
+        except (OSError, ValueError):
+            return None
+    
+    def _registry_root(self, hive: int):
+        """Connected handle for a registry hive, opened once and shared by all lookups"""
+        import winreg
         
-        return duplicates[:10]  # Return top 10 potential duplicate groups
+        with self._registry_lock:
+            root = self._registry_roots.get(hive)
+            if root is None:
+                root = self._registry_roots[hive] = winreg.ConnectRegistry(None, hive)
+        return root
     
     def optimize_startup_programs(self) -> Dict:
         """
@@ -168,37 +544,31 @@ class EnterpriseSystemOptimizer:
         self.logger.info("Analyzing startup programs...")
         
         try:
+            import winreg
+            
             startup_items = []
             
             # Check registry startup locations
-            registry_paths = [
-                (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Run"),
-                (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Run"),
-                (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\RunOnce"),
-                (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\RunOnce")
-            ]
-            
-            for hive, path in registry_paths:
+            for hive_name, path in STARTUP_REGISTRY_PATHS:
                 try:
-                    with winreg.OpenKey(hive, path) as key:
-                        i = 0
-                        while True:
-                            try:
-                                name, value, _ = winreg.EnumValue(key, i)
-                                startup_items.append({
-                                    'name': name,
-                                    'command': value,
-                                    'location': f"{hive}\\{path}",
-                                    'type': 'registry'
-                                })
-                                i += 1
-                            except WindowsError:
-                                break
+                    hive = getattr(winreg, hive_name)
+                    with winreg.OpenKey(self._registry_root(hive), path, 0, winreg.KEY_READ) as key:
+                        _, value_count, _ = winreg.QueryInfoKey(key)
+                        location = f"{hive}\\{path}"
+                        startup_items.extend(
+                            {
+                                'name': name,
+                                'command': value,
+                                'location': location,
+                                'type': 'registry'
+                            }
+                            for name, value, _ in (winreg.EnumValue(key, i) for i in range(value_count))
+                        )
                 except (OSError, PermissionError):
                     continue
             
             # Check startup folder
-            startup_folder = Path.home() / "AppData/Roaming/Microsoft/Windows/Start Menu/Programs/Startup"
+            startup_folder = Path(self._startup_folder)
             if startup_folder.exists():
                 for item in startup_folder.iterdir():
                     if item.is_file():
@@ -227,21 +597,9 @@ class EnterpriseSystemOptimizer:
         """Analyze startup impact and provide recommendations"""
         recommendations = []
         
-        # Common programs that can be safely disabled
-        safe_to_disable = [
-            'spotify', 'steam', 'discord', 'skype', 'adobe', 'office',
-            'itunes', 'quicktime', 'realplayer', 'winamp'
-        ]
-        
-        # Critical programs that should not be disabled
-        keep_enabled = [
-            'windows security', 'antivirus', 'firewall', 'audio driver',
-            'graphics driver', 'touchpad', 'bluetooth'
-        ]
-        
         for item in startup_items:
-            name_lower = item['name'].lower()
-            command_lower = item['command'].lower()
+            # NUL separator keeps a keyword from matching across name and command
+            searchable = f"{item['name']}\x00{item['command']}"
             
             recommendation = {
                 'name': item['name'],
@@ -250,22 +608,22 @@ class EnterpriseSystemOptimizer:
                 'impact': 'medium'
             }
             
+            # Critical components win over the safe-to-disable list
+            if self._KEEP_ENABLED_RE.search(searchable):
+                recommendation.update({
+                    'action': 'keep_enabled',
+                    'reason': 'Critical system component',
+                    'impact': 'high'
+                })
+            
             # Check if safe to disable
-            if any(safe in name_lower or safe in command_lower for safe in safe_to_disable):
+            elif self._SAFE_TO_DISABLE_RE.search(searchable):
                 recommendation.update({
                     'action': 'consider_disabling',
                     'reason': 'Non-essential program that can be started manually',
                     'impact': 'low'
                 })
             
-            # Check if should keep enabled
-            elif any(keep in name_lower or keep in command_lower for keep in keep_enabled):
-                recommendation.update({
-                    'action': 'keep_enabled',
-                    'reason': 'Critical system component',
-                    'impact': 'high'
-                })
-            
             recommendations.append(recommendation)
         
         return recommendations
@@ -277,33 +635,27 @@ class EnterpriseSystemOptimizer:
         self.logger.info("Starting safe registry cleanup...")
         
         try:
-            cleaned_keys = []
+            import winreg
             
-            # Safe registry cleanup targets
-            safe_cleanup_paths = [
-                # Temporary entries
-                (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Explorer\RecentDocs"),
-                # MRU (Most Recently Used) lists
-                (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Explorer\RunMRU"),
-                # Temporary internet files references
-                (winreg.HKEY_CURRENT_USER, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Internet Settings\Cache")
-            ]
+            cleaned_keys = []
             
-            for hive, path in safe_cleanup_paths:
+            for hive_name, path in SAFE_CLEANUP_REGISTRY_PATHS:
                 try:
                     # Only clear values, don't delete keys
+                    hive = self._registry_root(getattr(winreg, hive_name))
                     with winreg.OpenKey(hive, path, 0, winreg.KEY_SET_VALUE) as key:
                         # This is a simplified implementation
                         # In production, you'd be more selective about what to clean
                         cleaned_keys.append(path)
-                        self.registry_keys_cleaned += 1
+                        with self._counter_lock:
+                            self.registry_keys_cleaned += 1
                         
                 except (OSError, PermissionError, FileNotFoundError):
                     # Key doesn't exist or no permission - skip
                     continue
             
             return {
-                'keys_processed': len(safe_cleanup_paths),
+                'keys_processed': len(SAFE_CLEANUP_REGISTRY_PATHS),
                 'keys_cleaned': self.registry_keys_cleaned,
                 'cleaned_paths': cleaned_keys,
                 'cleanup_time': datetime.now().isoformat()
@@ -318,9 +670,11 @@ class EnterpriseSystemOptimizer:
         Get comprehensive system performance information
         """
         try:
+            import psutil
+            
             # CPU information
             cpu_info = {
-                'usage_percent': psutil.cpu_percent(interval=1),
+                'usage_percent': self._sample_cpu_percent(),
                 'core_count': psutil.cpu_count(logical=False),
                 'thread_count': psutil.cpu_count(logical=True),
                 'frequency_mhz': psutil.cpu_freq().current if psutil.cpu_freq() else 0
@@ -335,28 +689,27 @@ class EnterpriseSystemOptimizer:
                 'usage_percent': memory.percent
             }
             
-            # Process information
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'memory_percent', 'cpu_percent']):
-                try:
-                    proc_info = proc.info
-                    if proc_info['memory_percent'] > 1.0:  # Only processes using >1% memory
-                        processes.append({
-                            'name': proc_info['name'],
-                            'pid': proc_info['pid'],
-                            'memory_percent': round(proc_info['memory_percent'], 2),
-                            'cpu_percent': round(proc_info['cpu_percent'], 2)
-                        })
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-            
-            # Sort by memory usage
-            processes.sort(key=lambda x: x['memory_percent'], reverse=True)
+            # Process information - keep only the top 10 memory consumers using >1%
+            top_processes = heapq.nlargest(
+                10,
+                (proc.info for proc in psutil.process_iter(['pid', 'name', 'memory_percent', 'cpu_percent'])
+                 if (proc.info.get('memory_percent') or 0) > 1.0),
+                key=lambda info: info['memory_percent']
+            )
+            processes = [
+                {
+                    'name': proc_info['name'],
+                    'pid': proc_info['pid'],
+                    'memory_percent': round(proc_info['memory_percent'], 2),
+                    'cpu_percent': round(proc_info['cpu_percent'] or 0, 2)
+                }
+                for proc_info in top_processes
+            ]
             
             return {
                 'cpu': cpu_info,
                 'memory': memory_info,
-                'top_processes': processes[:10],  # Top 10 memory consumers
+                'top_processes': processes,
                 'analysis_time': datetime.now().isoformat()
             }
             
@@ -364,18 +717,54 @@ class EnterpriseSystemOptimizer:
             self.logger.error(f"Performance analysis failed: {e}")
             return {'error': str(e)}
     
+    def _cached(self, key: str, ttl: float, fn) -> Dict:
+        """Return fn()'s last result if younger than ttl seconds, else re-run it"""
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        
+        result = fn()
+        if 'error' not in result:
+            self._cache[key] = (now, result)
+        return result
+    
+    def clear_cache(self):
+        """Drop cached analysis results so the next run rescans everything"""
+        self._cache.clear()
+    
+    def _sample_cpu_percent(self) -> float:
+        """
+        CPU usage since the previous sample, without the old 1 s blocking wait.
+        The first call, or one right after another, takes a short sample.
+        """
+        import psutil
+        
+        now = time.monotonic()
+        if self._last_cpu_sample is None or now - self._last_cpu_sample < CPU_SAMPLE_MIN_INTERVAL:
+            usage = psutil.cpu_percent(interval=CPU_SAMPLE_FALLBACK_INTERVAL)
+        else:
+            usage = psutil.cpu_percent(interval=None)
+        self._last_cpu_sample = time.monotonic()
+        return usage
+    
     def run_comprehensive_analysis(self) -> Dict:
         """
         Run all enterprise analysis features
         """
         self.logger.info("Starting comprehensive system analysis...")
         
-        results = {
-            'disk_analysis': self.analyze_disk_usage(),
-            'startup_analysis': self.optimize_startup_programs(),
-            'performance_info': self.get_system_performance_info(),
-            'registry_cleanup': self.clean_registry_safe()
+        # The analyzers are independent and I/O bound, so run them side by side.
+        # Read-only analyzers are reused within the TTL; cleanup always runs.
+        tasks = {
+            'disk_analysis': lambda: self._cached('disk_analysis', ANALYSIS_CACHE_TTL, self.analyze_disk_usage),
+            'startup_analysis': lambda: self._cached('startup_analysis', ANALYSIS_CACHE_TTL, self.optimize_startup_programs),
+            'performance_info': lambda: self._cached('performance_info', ANALYSIS_CACHE_TTL, self.get_system_performance_info),
+            'registry_cleanup': self.clean_registry_safe
         }
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {name: executor.submit(task) for name, task in tasks.items()}
+            results = {name: future.result() for name, future in futures.items()}
         
         # Generate summary
         summary = {
@@ -13,26 +13,62 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
 import threading
 import queue
+import collections
 import os
 import sys
+import time
 from pathlib import Path
 from datetime import datetime
-import json
-import webbrowser
 
-# Import our main cleanup modules
-from main import PCCleanupTool
+# The cleanup engine (main.PCCleanupTool) is imported on the worker thread in
+# _run_cleanup so the window appears before the cleanup stack loads
+_cleanup_import_lock = threading.Lock()
+
+# Machine and user don't change during a session - read them once at import
+_COMPUTER = os.environ.get('COMPUTERNAME', 'Unknown')
+_USER = os.environ.get('USERNAME', 'Unknown')
+_SYSINFO = f"System: {_COMPUTER} | User: {_USER}"
+
+# Tcl interpreter whose ttk style database has already been configured.
+# Styles are process-wide per interpreter, so setup_styles runs once for it.
+_STYLES_READY = None
 
 class ModernPCCleanupGUI:
     """
     Professional GUI for PC Cleanup Tool with customizable branding
     """
     
+    # Pending progress items; when full the oldest progress update is dropped
+    PROGRESS_QUEUE_SIZE = 512
+    
+    # Lines kept in the log widget; older lines stay in _log_history only
+    MAX_LOG_LINES = 2000
+    
+    # Initial window size, also used to center the window without a layout pass
+    WINDOW_WIDTH = 900
+    WINDOW_HEIGHT = 700
+    
+    # Report files written by PCCleanupTool.generate_report
+    REPORT_PREFIX = "PC_Cleanup_Report_"
+    REPORT_SUFFIX = ".txt"
+    
     def __init__(self):
         self.root = tk.Tk()
         self.cleanup_tool = None
         self.cleanup_thread = None
-        self.progress_queue = queue.Queue()
+        self._desktop = None
+        
+        # Bounded so a stalled UI can't make the worker pile up progress items
+        self.progress_queue = queue.Queue(maxsize=self.PROGRESS_QUEUE_SIZE)
+        
+        # Log lines are buffered and written to the Text widget once per idle cycle
+        self._log_buf = collections.deque()
+        self._log_flush_scheduled = False
+        self._log_history = []
+        
+        # Log timestamps only change once a second, so format each second once
+        self._ts_sec = -1
+        self._ts_str = ''
         
         # Customizable branding settings
         self.branding = {
@@ -52,16 +88,22 @@ class ModernPCCleanupGUI:
             'background': '#F5F5F5',   # Light gray background
             'card_bg': '#FFFFFF',      # White cards
             'text_primary': '#2C3E50', # Dark blue-gray text
-            'text_secondary': '#7F8C8D' # Light gray text
+            'text_secondary': '#7F8C8D', # Light gray text
+            'log_error': '#C0392B',    # Red error log lines
+            'log_success': '#27AE60'   # Green success log lines
         }
         
         self.setup_gui()
         self.setup_styles()
         
+        # Worker thread signals queued progress with a virtual event rather than
+        # the UI polling the queue on a timer
+        self.root.bind('<<CleanupProgress>>', self._drain_progress)
+        
     def setup_gui(self):
         """Initialize the main GUI structure"""
         self.root.title(f"{self.branding['title']} v{self.branding['version']}")
-        self.root.geometry("900x700")
+        self.root.geometry(f"{self.WINDOW_WIDTH}x{self.WINDOW_HEIGHT}")
         self.root.configure(bg=self.colors['background'])
         
         # Make window resizable but set minimum size
@@ -84,6 +126,10 @@ class ModernPCCleanupGUI:
         
     def setup_styles(self):
         """Configure custom styles for professional appearance"""
+        global _STYLES_READY
+        if _STYLES_READY is self.root.tk:
+            return
+        
         style = ttk.Style()
         
         # Configure custom button styles
@@ -118,6 +164,8 @@ class ModernPCCleanupGUI:
             foreground=self.colors['text_primary']
         )
         
+        _STYLES_READY = self.root.tk
+        
     def create_header(self, parent):
         """Create professional header with branding"""
         header_frame = ttk.Frame(parent)
@@ -159,9 +207,12 @@ class ModernPCCleanupGUI:
         )
         
         # Main cleanup button
+        # Label is a StringVar so state changes only set the string
+        self.cleanup_btn_text = tk.StringVar(value="🚀 Run Full Cleanup")
         self.cleanup_btn = ttk.Button(
             control_frame,
             text="🚀 Run Full Cleanup",
+            textvariable=self.cleanup_btn_text,
             command=self.start_cleanup,
             style='Primary.TButton'
         )
@@ -216,6 +267,7 @@ class ModernPCCleanupGUI:
             mode='determinate'
         )
         self.progress_bar.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
+        self._progress_indeterminate = False
         
         # Log output area
         self.log_text = scrolledtext.ScrolledText(
@@ -226,6 +278,10 @@ class ModernPCCleanupGUI:
         )
         self.log_text.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
+        # Log levels double as text tags, so lines are colored as they are inserted
+        self.log_text.tag_configure('ERROR', foreground=self.colors['log_error'])
+        self.log_text.tag_configure('SUCCESS', foreground=self.colors['log_success'])
+        
         # Action buttons for progress area
         button_frame = ttk.Frame(progress_frame)
         button_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
@@ -260,33 +316,63 @@ class ModernPCCleanupGUI:
         status_label.grid(row=0, column=0, sticky=tk.W)
         
         # System info
-        system_info = f"System: {os.environ.get('COMPUTERNAME', 'Unknown')} | User: {os.environ.get('USERNAME', 'Unknown')}"
-        ttk.Label(status_frame, text=system_info, style='Subtitle.TLabel').grid(
+        ttk.Label(status_frame, text=_SYSINFO, style='Subtitle.TLabel').grid(
             row=0, column=1, sticky=tk.E
         )
         
     def log_message(self, message, level="INFO"):
-        """Add message to log area with timestamp"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {level}: {message}\n"
+        """Add message to log area with timestamp (UI thread only)"""
+        sec = int(time.time())
+        if sec != self._ts_sec:
+            self._ts_sec = sec
+            self._ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+        self._log_buf.append((f"[{self._ts_str}] {level}: {message}\n", level))
+        
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after_idle(self._flush_log)
+            
+    def _flush_log(self):
+        """Write all buffered log lines with a single insert and scroll"""
+        self._log_flush_scheduled = False
+        buf = self._log_buf
+        if not buf:
+            return
         
-        self.log_text.insert(tk.END, formatted_message)
-        self.log_text.see(tk.END)
+        log_text = self.log_text
         
-        # Color coding for different log levels
-        if level == "ERROR":
-            # Add red color for errors (would need text tags for full implementation)
-            pass
-        elif level == "SUCCESS":
-            # Add green color for success messages
-            pass
+        # Text.insert takes alternating text/tag arguments, so one call still
+        # inserts every line with its level tag
+        segments = [part for line_and_level in buf for part in line_and_level]
+        log_text.insert(tk.END, *segments)
+        self._log_history.extend(segments[::2])
+        buf.clear()
+        
+        # Keep the widget bounded so inserts and scrolling stay cheap
+        line_count = int(log_text.index('end-1c').split('.')[0])
+        if line_count > self.MAX_LOG_LINES:
+            log_text.delete('1.0', f'{line_count - self.MAX_LOG_LINES}.0')
+        log_text.see(tk.END)
             
     def update_progress(self, value, message=""):
-        """Update progress bar and status"""
-        self.progress_var.set(value)
+        """Update progress bar and status; value may be the INDETERMINATE sentinel"""
+        if value == "INDETERMINATE":
+            if not self._progress_indeterminate:
+                self.progress_bar.configure(mode='indeterminate')
+                self.progress_bar.start(50)
+                self._progress_indeterminate = True
+        else:
+            self._stop_indeterminate()
+            self.progress_var.set(value)
         if message:
             self.status_var.set(message)
-            self.log_message(message)
+            
+    def _stop_indeterminate(self):
+        """Return the progress bar to determinate mode if it is animating"""
+        if self._progress_indeterminate:
+            self.progress_bar.stop()
+            self.progress_bar.configure(mode='determinate')
+            self._progress_indeterminate = False
             
     def start_cleanup(self):
         """Start full cleanup in background thread"""
@@ -294,7 +380,8 @@ class ModernPCCleanupGUI:
             messagebox.showwarning("Operation in Progress", "A cleanup operation is already running.")
             return
             
-        self.cleanup_btn.configure(state='disabled', text="🔄 Cleaning...")
+        self.cleanup_btn_text.set("🔄 Cleaning...")
+        self.cleanup_btn.state(['disabled'])
         self.log_message("Starting full PC cleanup...", "INFO")
         self.update_progress(0, "Initializing cleanup...")
         
@@ -302,52 +389,84 @@ class ModernPCCleanupGUI:
         self.cleanup_thread = threading.Thread(target=self._run_cleanup, daemon=True)
         self.cleanup_thread.start()
         
-        # Start progress monitoring
-        self.monitor_progress()
+        # Pick up anything queued before the first event is delivered
+        self.root.after_idle(self._drain_progress)
+        
+    def _post_progress(self, value, message):
+        """
+        Queue a progress update from the worker thread and wake the UI thread.
+        Never blocks: if the queue is full the oldest update is dropped, which
+        is harmless since the UI only draws the newest one.
+        """
+        item = (value, message)
+        try:
+            self.progress_queue.put_nowait(item)
+        except queue.Full:
+            try:
+                self.progress_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.progress_queue.put_nowait(item)
+        self.root.event_generate('<<CleanupProgress>>', when='tail')
+        
+    def _post_outcome(self, kind, payload):
+        """Queue the COMPLETE/ERROR result; blocks rather than ever dropping it"""
+        self.progress_queue.put((kind, payload))
+        self.root.event_generate('<<CleanupProgress>>', when='tail')
         
     def _run_cleanup(self):
         """Run cleanup in background thread"""
         try:
-            self.cleanup_tool = PCCleanupTool()
+            with _cleanup_import_lock:
+                from main import PCCleanupTool
             
-            # Simulate progress updates (in real implementation, modify PCCleanupTool to support progress callbacks)
-            self.progress_queue.put((10, "Cleaning temporary files..."))
+            self.cleanup_tool = PCCleanupTool(
+                progress_callback=self._post_progress
+            )
             
-            # Run the actual cleanup
+            # Run the actual cleanup - phases report their own progress
             results = self.cleanup_tool.run_full_cleanup()
             
-            self.progress_queue.put((100, "Cleanup completed successfully!"))
-            self.progress_queue.put(("COMPLETE", results))
+            self._post_outcome("COMPLETE", results)
             
         except Exception as e:
-            self.progress_queue.put(("ERROR", str(e)))
+            self._post_outcome("ERROR", str(e))
             
-    def monitor_progress(self):
-        """Monitor progress queue and update UI"""
-        try:
-            while True:
+    def _drain_progress(self, event=None):
+        """Apply every queued progress item; runs on the UI thread"""
+        latest = None
+        outcome = None
+        
+        while True:
+            try:
                 item = self.progress_queue.get_nowait()
+            except queue.Empty:
+                break
                 
-                if isinstance(item[0], (int, float)):
-                    # Progress update
-                    self.update_progress(item[0], item[1])
-                elif item[0] == "COMPLETE":
-                    # Cleanup completed
-                    results = item[1]
-                    self.cleanup_completed(results)
-                    return
-                elif item[0] == "ERROR":
-                    # Error occurred
-                    self.cleanup_error(item[1])
-                    return
-                    
-        except queue.Empty:
-            # Continue monitoring
-            self.root.after(100, self.monitor_progress)
+            if isinstance(item[0], (int, float)) or item[0] == "INDETERMINATE":
+                # Progress update - every message is logged once, only the newest one is drawn
+                if item[1]:
+                    self.log_message(item[1])
+                latest = item
+            elif item[0] in ("COMPLETE", "ERROR"):
+                outcome = item
+        
+        if latest is not None:
+            self.update_progress(latest[0], latest[1])
+        
+        if outcome is None:
+            return
+        if outcome[0] == "COMPLETE":
+            # Cleanup completed
+            self.cleanup_completed(outcome[1])
+        else:
+            # Error occurred
+            self.cleanup_error(outcome[1])
             
     def cleanup_completed(self, results):
         """Handle cleanup completion"""
-        self.cleanup_btn.configure(state='normal', text="🚀 Run Full Cleanup")
+        self.cleanup_btn_text.set("🚀 Run Full Cleanup")
+        self.cleanup_btn.state(['!disabled'])
         
         summary = results.get('summary', {})
         files_deleted = summary.get('total_files_deleted', 0)
@@ -360,7 +479,9 @@ class ModernPCCleanupGUI:
         
     def cleanup_error(self, error_msg):
         """Handle cleanup error"""
-        self.cleanup_btn.configure(state='normal', text="🚀 Run Full Cleanup")
+        self.cleanup_btn_text.set("🚀 Run Full Cleanup")
+        self.cleanup_btn.state(['!disabled'])
+        self._stop_indeterminate()
         self.log_message(f"Cleanup failed: {error_msg}", "ERROR")
         messagebox.showerror("Cleanup Error", f"An error occurred during cleanup:\n\n{error_msg}")
         
@@ -384,20 +505,39 @@ class ModernPCCleanupGUI:
         self.log_message("Running system analysis...", "INFO")
         # Implement system analysis
         
+    def _get_desktop(self):
+        """Desktop folder the cleanup engine writes to, resolved on first use"""
+        if self._desktop is None:
+            with _cleanup_import_lock:
+                from main import get_desktop_path
+            self._desktop = get_desktop_path()
+        return self._desktop
+        
     def view_last_report(self):
         """Open the most recent cleanup report"""
-        desktop_path = Path.home() / "Desktop"
-        if desktop_path.exists():
-            reports = list(desktop_path.glob("PC_Cleanup_Report_*.txt"))
-            if reports:
-                latest_report = max(reports, key=lambda p: p.stat().st_mtime)
+        desktop_path = str(self._get_desktop())
+        if os.path.isdir(desktop_path):
+            # DirEntry.stat() reuses the directory listing data on Windows;
+            # entry.path is a plain str that os.startfile takes directly
+            latest_report = None
+            latest_mtime = -1
+            with os.scandir(desktop_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith(self.REPORT_PREFIX) and name.endswith(self.REPORT_SUFFIX):
+                        mtime = entry.stat().st_mtime
+                        if mtime > latest_mtime:
+                            latest_mtime = mtime
+                            latest_report = entry.path
+            
+            if latest_report:
                 os.startfile(latest_report)
             else:
                 messagebox.showinfo("No Reports", "No cleanup reports found.")
         
     def open_log_folder(self):
         """Open the log folder"""
-        desktop_path = Path.home() / "Desktop"
+        desktop_path = self._get_desktop()
         log_dir = desktop_path / "PC_Cleanup_Logs" if desktop_path.exists() else Path.home() / "PC_Cleanup_Logs"
         
         if log_dir.exists():
@@ -420,12 +560,10 @@ class ModernPCCleanupGUI:
         except:
             pass
             
-        # Center window on screen
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
+        # Center window on screen from the known size - no forced layout pass
+        width, height = self.WINDOW_WIDTH, self.WINDOW_HEIGHT
+        x = (self.root.winfo_screenwidth() - width) // 2
+        y = (self.root.winfo_screenheight() - height) // 2
         self.root.geometry(f'{width}x{height}+{x}+{y}')
         
         self.log_message("PC Cleanup Tool initialized", "INFO")
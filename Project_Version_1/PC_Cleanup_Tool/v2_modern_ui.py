@@ -5,21 +5,58 @@ Advanced modern interface with one-click cleanup and comprehensive reporting
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+from tkinter import font as tkfont
+from concurrent.futures import ThreadPoolExecutor
+import queue
 import threading
 import json
 import webbrowser
-from datetime import datetime
 from pathlib import Path
+from dataclasses import asdict
 import os
 import sys
+import time
+
+# Optional fast JSON encoder for saved reports
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import V2 core engine
 from v2_core_engine import V2CleanupEngine
 
+# Byte counts per unit shown in the UI
+_MB = 1 << 20
+_GB = 1 << 30
+
+# Reciprocals, so conversions in the formatting paths are a multiply
+_INV_MB = 1.0 / _MB
+_INV_GB = 1.0 / _GB
+
+# Bursts of progress/status updates are drawn at most once per this many ms
+_UI_UPDATE_MS = 16
+
+# A system-state capture younger than this many seconds is shown again as-is
+_STATE_CACHE_TTL = 2.0
+
+# Write buffer for saved JSON reports
+_SAVE_BUFFER_SIZE = 1 << 20
+
+# One block of the summary tab per cleanup result
+_RESULT_TEMPLATE = (
+    "\n🔧 {op}:\n"
+    "   • Files Processed: {fp:,}\n"
+    "   • Files Deleted: {fd:,}\n"
+    "   • Space Freed: {sm:.1f} MB\n"
+    "   • Success Rate: {sr:.1f}%\n"
+    "   • Time Taken: {tt:.1f} seconds\n"
+)
+
 class ModernProgressBar:
     """Custom modern progress bar with animations"""
     
-    def __init__(self, parent, width=400, height=20):
+    def __init__(self, parent, width=400, height=20, font=('Segoe UI', 9)):
         self.canvas = tk.Canvas(parent, width=width, height=height, 
                                bg='#f0f0f0', highlightthickness=0)
         self.width = width
@@ -33,15 +70,42 @@ class ModernProgressBar:
         self.progress_rect = self.canvas.create_rectangle(2, 2, 2, height-2, 
                                                         fill='#4CAF50', outline='')
         self.text = self.canvas.create_text(width//2, height//2, 
-                                          text='0%', fill='#333', font=('Segoe UI', 9))
+                                          text='0%', fill='#333', font=font)
+        
+        # Latest requested value, drawn by _flush
+        self._pending = 0
+        self._scheduled = False
+        
+        # What the canvas items currently show, so unchanged items aren't touched
+        self._last_color = None
+        self._last_progress_width = -1
+        self._last_text = '0%'
     
     def set_progress(self, percentage):
-        """Update progress bar"""
+        """Update progress bar; a burst of updates is drawn once per frame"""
+        self._pending = percentage
+        if not self._scheduled:
+            self._scheduled = True
+            self.canvas.after(_UI_UPDATE_MS, self._flush)
+    
+    def _flush(self):
+        """Draw the latest value passed to set_progress"""
+        self._scheduled = False
+        self._apply(self._pending)
+    
+    def _apply(self, percentage):
+        """Redraw the bar for percentage"""
         self.progress = max(0, min(100, percentage))
-        progress_width = (self.width - 4) * (self.progress / 100)
+        progress_width = int(2 + (self.width - 4) * (self.progress / 100))
         
-        self.canvas.coords(self.progress_rect, 2, 2, 2 + progress_width, self.height - 2)
-        self.canvas.itemconfig(self.text, text=f'{self.progress:.0f}%')
+        if progress_width != self._last_progress_width:
+            self.canvas.coords(self.progress_rect, 2, 2, progress_width, self.height - 2)
+            self._last_progress_width = progress_width
+        
+        text = f'{self.progress:.0f}%'
+        if text != self._last_text:
+            self.canvas.itemconfig(self.text, text=text)
+            self._last_text = text
         
         # Change color based on progress
         if self.progress < 30:
@@ -51,7 +115,9 @@ class ModernProgressBar:
         else:
             color = '#4CAF50'  # Green
         
-        self.canvas.itemconfig(self.progress_rect, fill=color)
+        if color != self._last_color:
+            self.canvas.itemconfig(self.progress_rect, fill=color)
+            self._last_color = color
     
     def pack(self, **kwargs):
         self.canvas.pack(**kwargs)
@@ -62,68 +128,122 @@ class ModernProgressBar:
 class SystemStateWidget:
     """Widget to display system state information"""
     
-    def __init__(self, parent, title="System State"):
+    # Display lines, filled in with str.format_map from _state_fields(). Each
+    # line is only shown when its key is present.
+    HEADER_TEMPLATE = "📊 System Analysis - {time}"
+    DISK_TEMPLATE = "\n  {drive} {free}GB free / {total}GB total"
+    LINE_TEMPLATES = (
+        ('disks', "\n💾 Disk Usage:{disks}"),
+        ('memory_available', "\n🧠 Memory: {memory_available}GB available / {memory_total}GB total"),
+        ('cleanup_potential', "\n🧹 Cleanup Potential: {cleanup_potential} MB"),
+        ('temp_files_count', "📁 Temporary Files: {temp_files_count} files"),
+        ('browser_cache', "🌐 Browser Cache: {browser_cache} MB"),
+        ('startup_programs', "🚀 Startup Programs: {startup_programs}"),
+        ('update_status', "🔄 Updates: {update_status}"),
+        ('available_updates', "   📦 {available_updates} updates available")
+    )
+    
+    def __init__(self, parent, title="System State", font=('Consolas', 9)):
         self.frame = ttk.LabelFrame(parent, text=title, padding=10)
         
-        # Create state display
-        self.state_text = scrolledtext.ScrolledText(
-            self.frame, height=8, width=50, 
-            font=('Consolas', 9), bg='#f8f9fa'
-        )
-        self.state_text.pack(fill='both', expand=True)
+        # One label per display line, in LINE_TEMPLATES order; 'message' holds
+        # free-form text for data that isn't a state dict
+        keys = ('header', 'rule') + tuple(key for key, _ in self.LINE_TEMPLATES) + ('message',)
+        self._labels = {}
+        for row, key in enumerate(keys):
+            label = ttk.Label(self.frame, font=font, anchor='w', justify='left')
+            label.grid(row=row, column=0, sticky='w')
+            label.grid_remove()
+            self._labels[key] = label
+        
+        # Text currently shown per label key, so only changed labels are touched
+        self._values = {}
+        
+        # State received while the widget wasn't viewable (e.g. window minimized),
+        # drawn once it is mapped again. Binding on the toplevel also sees the
+        # Map events of its descendants.
+        self._pending_state = None
+        self.frame.winfo_toplevel().bind('<Map>', self._on_map, add='+')
+    
+    def _on_map(self, event=None):
+        """Draw the state deferred by update_state once the widget is visible"""
+        if self._pending_state is not None and self.frame.winfo_viewable():
+            state_data, self._pending_state = self._pending_state, None
+            self.update_state(state_data)
+    
+    def _state_fields(self, state_data):
+        """Flat dict of the pre-formatted values shown for state_data"""
+        fields = {}
+        
+        # Disk usage
+        if 'disk_usage' in state_data:
+            fields['disks'] = ''.join(
+                self.DISK_TEMPLATE.format(drive=drive, free=f"{usage['free'] * _INV_GB:.1f}",
+                                          total=f"{usage['total'] * _INV_GB:.1f}")
+                for drive, usage in state_data['disk_usage'].items()
+            )
+        
+        # Memory info
+        if 'memory_info' in state_data:
+            memory = state_data['memory_info']
+            fields['memory_available'] = f"{memory['available'] * _INV_GB:.1f}"
+            fields['memory_total'] = f"{memory['total'] * _INV_GB:.1f}"
+        
+        # Cleanup potential
+        if 'total_cleanup_potential' in state_data:
+            fields['cleanup_potential'] = f"{state_data['total_cleanup_potential'] * _INV_MB:.1f}"
+        
+        # Temp files
+        if 'temp_files_count' in state_data:
+            fields['temp_files_count'] = state_data['temp_files_count']
+        
+        # Browser cache
+        if 'browser_cache_size' in state_data:
+            fields['browser_cache'] = f"{state_data['browser_cache_size'] * _INV_MB:.1f}"
+        
+        # Startup programs
+        if 'startup_programs_count' in state_data:
+            fields['startup_programs'] = state_data['startup_programs_count']
+        
+        # Windows updates
+        if 'windows_update_status' in state_data:
+            fields['update_status'] = state_data['windows_update_status']
+            if state_data.get('available_updates', 0) > 0:
+                fields['available_updates'] = state_data['available_updates']
+        
+        return fields
     
     def update_state(self, state_data):
-        """Update the state display"""
-        self.state_text.delete(1.0, tk.END)
+        """Update the state display, or defer it while the widget isn't visible"""
+        if not self.frame.winfo_viewable():
+            self._pending_state = state_data
+            return
+        self._pending_state = None
         
         if isinstance(state_data, dict):
-            # Format system state information
-            lines = []
-            lines.append(f"📊 System Analysis - {datetime.now().strftime('%H:%M:%S')}")
-            lines.append("=" * 50)
-            
-            # Disk usage
-            if 'disk_usage' in state_data:
-                lines.append("\n💾 Disk Usage:")
-                for drive, usage in state_data['disk_usage'].items():
-                    free_gb = usage['free'] / (1024**3)
-                    total_gb = usage['total'] / (1024**3)
-                    lines.append(f"  {drive} {free_gb:.1f}GB free / {total_gb:.1f}GB total")
-            
-            # Memory info
-            if 'memory_info' in state_data:
-                memory = state_data['memory_info']
-                available_gb = memory['available'] / (1024**3)
-                total_gb = memory['total'] / (1024**3)
-                lines.append(f"\n🧠 Memory: {available_gb:.1f}GB available / {total_gb:.1f}GB total")
-            
-            # Cleanup potential
-            if 'total_cleanup_potential' in state_data:
-                potential_mb = state_data['total_cleanup_potential'] / (1024**2)
-                lines.append(f"\n🧹 Cleanup Potential: {potential_mb:.1f} MB")
-            
-            # Temp files
-            if 'temp_files_count' in state_data:
-                lines.append(f"📁 Temporary Files: {state_data['temp_files_count']} files")
-            
-            # Browser cache
-            if 'browser_cache_size' in state_data:
-                cache_mb = state_data['browser_cache_size'] / (1024**2)
-                lines.append(f"🌐 Browser Cache: {cache_mb:.1f} MB")
-            
-            # Startup programs
-            if 'startup_programs_count' in state_data:
-                lines.append(f"🚀 Startup Programs: {state_data['startup_programs_count']}")
-            
-            # Windows updates
-            if 'windows_update_status' in state_data:
-                lines.append(f"🔄 Updates: {state_data['windows_update_status']}")
-                if state_data.get('available_updates', 0) > 0:
-                    lines.append(f"   📦 {state_data['available_updates']} updates available")
-            
-            self.state_text.insert(tk.END, '\n'.join(lines))
+            fields = self._state_fields(state_data)
+            values = {
+                'header': self.HEADER_TEMPLATE.format(time=time.strftime('%H:%M:%S')),
+                'rule': "=" * 50
+            }
+            values.update((key, template.format_map(fields)) for key, template in self.LINE_TEMPLATES
+                          if key in fields)
         else:
-            self.state_text.insert(tk.END, str(state_data))
+            values = {'message': str(state_data)}
+        
+        for key, label in self._labels.items():
+            text = values.get(key)
+            shown = self._values.get(key)
+            if text == shown:
+                continue
+            if text is None:
+                label.grid_remove()
+            else:
+                label.configure(text=text)
+                if shown is None:
+                    label.grid()
+        
+        self._values = values
     
     def pack(self, **kwargs):
         self.frame.pack(**kwargs)
@@ -134,41 +254,89 @@ class SystemStateWidget:
 class V2ModernUI:
     """Modern UI for PC Cleanup Tool Version 2"""
     
+    # Report window tabs: (title, name of the method formatting its text)
+    REPORT_TABS = (
+        ("📊 Summary", '_format_summary'),
+        ("📈 Before/After", '_format_comparison'),
+        ("💡 Recommendations", '_format_recommendations')
+    )
+    
     def __init__(self):
         self.root = tk.Tk()
         self.engine = V2CleanupEngine()
         self.cleanup_thread = None
         self.current_report = None
         
-        # Setup engine callbacks
-        self.engine.set_progress_callback(self.update_progress)
-        self.engine.set_status_callback(self.update_status)
+        # Shared workers for state captures and report saves
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='cleanup')
         
-        self.setup_ui()
+        # At most one system-state capture runs at a time
+        self._refresh_future = None
+        
+        # Last capture and its time.monotonic() stamp, reused within _STATE_CACHE_TTL
+        self._state_cache = None
+        self._state_cache_ts = 0.0
+        
+        # Pending root.after id for a debounced mode change
+        self._mode_change_id = None
+        
+        # Formatted report tab texts, keyed by (id() of the report, tab index)
+        self._report_cache = {}
+        
+        # Callbacks posted by worker threads, run by _drain_ui_queue
+        self._ui_q = queue.SimpleQueue()
+        
+        # Status text waiting for _flush_status
+        self._pending_status = ""
+        self._status_scheduled = False
+        
+        # Setup engine callbacks; the engine calls them from its worker threads,
+        # so they are handed to the Tk thread through _ui_q
+        self.engine.set_progress_callback(
+            lambda percentage, message="": self._ui_q.put(lambda: self.update_progress(percentage, message)))
+        self.engine.set_status_callback(
+            lambda message: self._ui_q.put(lambda: self.update_status(message)))
+        
+        # Styles first: setup_ui hands the shared fonts to the widgets it creates
         self.setup_styles()
+        self.setup_ui()
+        
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.root.after(_UI_UPDATE_MS, self._drain_ui_queue)
     
     def setup_styles(self):
         """Setup modern styling"""
         style = ttk.Style()
         
+        # Tk font objects shared by every widget using the same font
+        self.fonts = {
+            'mono9': tkfont.Font(family='Consolas', size=9),
+            'mono10': tkfont.Font(family='Consolas', size=10),
+            'ui9': tkfont.Font(family='Segoe UI', size=9),
+            'ui10': tkfont.Font(family='Segoe UI', size=10),
+            'ui24': tkfont.Font(family='Segoe UI', size=24),
+            'button': tkfont.Font(family='Segoe UI', size=14, weight='bold'),
+            'header': tkfont.Font(family='Segoe UI', size=16, weight='bold')
+        }
+        
         # Configure modern theme
         style.theme_use('clam')
         
         # Custom button styles
         style.configure('OneClick.TButton', 
-                       font=('Segoe UI', 14, 'bold'),
+                       font=self.fonts['button'],
                        padding=(20, 15))
         
         style.configure('Action.TButton',
-                       font=('Segoe UI', 10),
+                       font=self.fonts['ui10'],
                        padding=(10, 8))
         
         style.configure('Header.TLabel',
-                       font=('Segoe UI', 16, 'bold'),
+                       font=self.fonts['header'],
                        foreground='#2c3e50')
         
         style.configure('Status.TLabel',
-                       font=('Segoe UI', 10),
+                       font=self.fonts['ui10'],
                        foreground='#34495e')
     
     def setup_ui(self):
@@ -206,7 +374,7 @@ class V2ModernUI:
         header_frame.grid_columnconfigure(1, weight=1)
         
         # Logo/Icon (placeholder)
-        icon_label = ttk.Label(header_frame, text="🖥️", font=('Segoe UI', 24))
+        icon_label = ttk.Label(header_frame, text="🖥️", font=self.fonts['ui24'])
         icon_label.grid(row=0, column=0, padx=(0, 15))
         
         # Title and subtitle
@@ -226,7 +394,7 @@ class V2ModernUI:
         mode_frame = ttk.Frame(header_frame)
         mode_frame.grid(row=0, column=2, padx=(15, 0))
         
-        ttk.Label(mode_frame, text="Mode:", font=('Segoe UI', 10)).pack()
+        ttk.Label(mode_frame, text="Mode:", font=self.fonts['ui10']).pack()
         self.mode_var = tk.StringVar(value="Online")
         mode_combo = ttk.Combobox(mode_frame, textvariable=self.mode_var,
                                  values=["Online", "Offline"], state="readonly", width=10)
@@ -272,7 +440,8 @@ class V2ModernUI:
         self.status_label.pack(pady=5)
         
         # Modern progress bar
-        self.progress_bar = ModernProgressBar(cleanup_section, width=350, height=25)
+        self.progress_bar = ModernProgressBar(cleanup_section, width=350, height=25,
+                                              font=self.fonts['ui9'])
         self.progress_bar.pack(pady=10)
         
         # Individual actions section
@@ -306,10 +475,12 @@ class V2ModernUI:
         info_frame.grid_rowconfigure(1, weight=1)
         
         # System state widget
-        self.before_state_widget = SystemStateWidget(info_frame, "System State - Before")
+        self.before_state_widget = SystemStateWidget(info_frame, "System State - Before",
+                                                     font=self.fonts['mono9'])
         self.before_state_widget.grid(row=0, column=0, sticky='nsew', pady=(0, 10))
         
-        self.after_state_widget = SystemStateWidget(info_frame, "System State - After")
+        self.after_state_widget = SystemStateWidget(info_frame, "System State - After",
+                                                    font=self.fonts['mono9'])
         self.after_state_widget.grid(row=1, column=0, sticky='nsew')
     
     def create_footer(self, parent):
@@ -320,7 +491,7 @@ class V2ModernUI:
         
         # Version info
         version_label = ttk.Label(footer_frame, text="Version 2.0 Professional", 
-                                 font=('Segoe UI', 9), foreground='#7f8c8d')
+                                 font=self.fonts['ui9'], foreground='#7f8c8d')
         version_label.grid(row=0, column=0)
         
         # Action buttons
@@ -338,12 +509,22 @@ class V2ModernUI:
         """Refresh system state display"""
         def capture_state():
             try:
-                state = self.engine.capture_system_state()
-                self.root.after(0, lambda: self.before_state_widget.update_state(state.__dict__))
+                state = asdict(self.engine.capture_system_state())
+                self._state_cache = state
+                self._state_cache_ts = time.monotonic()
+                self._ui_q.put(lambda: self.before_state_widget.update_state(state))
             except Exception as e:
-                self.root.after(0, lambda: self.update_status(f"Error capturing state: {str(e)}"))
+                error = str(e)
+                self._ui_q.put(lambda: self.update_status(f"Error capturing state: {error}"))
         
-        threading.Thread(target=capture_state, daemon=True).start()
+        if self._state_cache is not None and time.monotonic() - self._state_cache_ts < _STATE_CACHE_TTL:
+            self.before_state_widget.update_state(self._state_cache)
+            return
+        
+        if self._refresh_future and not self._refresh_future.done():
+            return
+        
+        self._refresh_future = self._pool.submit(capture_state)
     
     def update_progress(self, percentage, message=""):
         """Update progress bar and status"""
@@ -352,9 +533,27 @@ class V2ModernUI:
             self.update_status(message)
     
     def update_status(self, message):
-        """Update status label"""
-        self.status_label.config(text=message)
-        self.root.update_idletasks()
+        """Update status label; a burst of messages only draws the latest"""
+        self._pending_status = message
+        if not self._status_scheduled:
+            self._status_scheduled = True
+            self.root.after(_UI_UPDATE_MS, self._flush_status)
+    
+    def _drain_ui_queue(self):
+        """Run every callback posted by worker threads, then check again next frame"""
+        # Re-arm first so a failing callback doesn't stop the loop
+        self.root.after(_UI_UPDATE_MS, self._drain_ui_queue)
+        while True:
+            try:
+                callback = self._ui_q.get_nowait()
+            except queue.Empty:
+                break
+            callback()
+    
+    def _flush_status(self):
+        """Show the latest message passed to update_status"""
+        self._status_scheduled = False
+        self.status_label.config(text=self._pending_status)
     
     def start_one_click_cleanup(self):
         """Start the one-click cleanup process"""
@@ -392,12 +591,15 @@ class V2ModernUI:
                 result = self.engine.perform_one_click_cleanup()
                 
                 # Update UI with results
-                self.root.after(0, lambda: self.cleanup_completed(result))
+                self._ui_q.put(lambda: self.cleanup_completed(result))
                 
             except Exception as e:
-                self.root.after(0, lambda: self.cleanup_error(str(e)))
+                error = str(e)
+                self._ui_q.put(lambda: self.cleanup_error(error))
         
-        self.cleanup_thread = threading.Thread(target=cleanup_worker, daemon=True)
+        # A daemon thread rather than the pool: pool workers are joined at exit,
+        # which would keep the process alive through cleanmgr after on_close
+        self.cleanup_thread = threading.Thread(target=cleanup_worker, name='one-click-cleanup', daemon=True)
         self.cleanup_thread.start()
     
     def cleanup_completed(self, result):
@@ -410,19 +612,30 @@ class V2ModernUI:
             if 'after_state' in result:
                 self.after_state_widget.update_state(result['after_state'])
             
-            # Store report
+            # Store report; texts formatted for the previous one are stale
             self.current_report = result
+            self._report_cache.clear()
             
-            # Show success message
-            total_space = sum(r.get('space_freed', 0) for r in result.get('cleanup_results', []))
-            space_mb = total_space / (1024 * 1024)
+            # Show success message; totals come from the engine's summary, with
+            # one pass over the results for payloads that don't carry one
+            cleanup_results = result.get('cleanup_results', ())
+            summary = result.get('summary') or result.get('report', {}).get('summary') or {}
+            total_space = summary.get('total_space_freed')
+            total_files = summary.get('total_files_cleaned')
+            operations = summary.get('cleanup_operations') or len(cleanup_results)
+            if total_space is None or total_files is None:
+                total_space = total_files = 0
+                for r in cleanup_results:
+                    total_space += r.get('space_freed', 0)
+                    total_files += r.get('files_deleted', 0)
+            space_mb = total_space * _INV_MB
             
             messagebox.showinfo(
                 "Cleanup Completed Successfully!",
                 f"✅ System cleanup completed!\n\n"
                 f"📊 Space freed: {space_mb:.1f} MB\n"
-                f"🗑️ Files cleaned: {sum(r.get('files_deleted', 0) for r in result.get('cleanup_results', []))}\n"
-                f"⚡ Operations: {len(result.get('cleanup_results', []))}\n\n"
+                f"🗑️ Files cleaned: {total_files}\n"
+                f"⚡ Operations: {operations}\n\n"
                 f"Click 'View Last Report' for detailed results."
             )
             
@@ -439,7 +652,14 @@ class V2ModernUI:
         self.update_status(f"❌ Error: {error_message}")
     
     def on_mode_change(self, event=None):
-        """Handle mode change"""
+        """Handle mode change once the selection has settled for 250 ms"""
+        if self._mode_change_id is not None:
+            self.root.after_cancel(self._mode_change_id)
+        self._mode_change_id = self.root.after(250, self._apply_mode)
+    
+    def _apply_mode(self):
+        """Apply the currently selected mode"""
+        self._mode_change_id = None
         mode = self.mode_var.get()
         self.update_status(f"Mode changed to: {mode}")
         
@@ -491,105 +711,130 @@ class V2ModernUI:
         # Create report window
         self.show_report_window(self.current_report)
     
-    def show_report_window(self, report_data):
-        """Show detailed report in new window"""
-        report_window = tk.Toplevel(self.root)
-        report_window.title("Cleanup Report - Detailed Results")
-        report_window.geometry("800x600")
-        
-        # Create notebook for tabbed report
-        notebook = ttk.Notebook(report_window, padding=10)
-        notebook.pack(fill='both', expand=True)
-        
-        # Summary tab
-        summary_frame = ttk.Frame(notebook)
-        notebook.add(summary_frame, text="📊 Summary")
-        
-        summary_text = scrolledtext.ScrolledText(summary_frame, font=('Consolas', 10))
-        summary_text.pack(fill='both', expand=True, padx=10, pady=10)
-        
-        # Format summary
+    def _format_tab(self, report_data, index):
+        """Text for report tab index (see REPORT_TABS), cached per report"""
+        key = (id(report_data), index)
+        if key not in self._report_cache:
+            formatter = getattr(self, self.REPORT_TABS[index][1])
+            self._report_cache[key] = formatter(report_data)
+        return self._report_cache[key]
+    
+    def _format_summary(self, report_data):
+        """Summary tab text"""
+        summary_content = ""
         if 'summary' in report_data:
             summary = report_data['summary']
             summary_content = f"""
 🎯 CLEANUP SUMMARY REPORT
 {'=' * 50}
 
-✅ Total Space Freed: {summary.get('total_space_freed', 0) / (1024*1024):.1f} MB
+✅ Total Space Freed: {summary.get('total_space_freed', 0) * _INV_MB:.1f} MB
 🗑️ Total Files Cleaned: {summary.get('total_files_cleaned', 0):,}
 ⚡ Cleanup Operations: {summary.get('cleanup_operations', 0)}
 📈 Success Rate: {summary.get('success_rate', 0):.1f}%
 
-💾 Disk Space Improvement: {summary.get('disk_space_improvement', 0) / (1024*1024):.1f} MB
-🧠 Memory Improvement: {summary.get('memory_improvement', 0) / (1024*1024):.1f} MB
+💾 Disk Space Improvement: {summary.get('disk_space_improvement', 0) * _INV_MB:.1f} MB
+🧠 Memory Improvement: {summary.get('memory_improvement', 0) * _INV_MB:.1f} MB
 
 📋 DETAILED RESULTS:
 {'-' * 30}
 """
             
+            parts = [summary_content]
             for result in report_data.get('cleanup_results', []):
-                summary_content += f"""
-🔧 {result.get('operation_type', 'Unknown')}:
-   • Files Processed: {result.get('files_processed', 0):,}
-   • Files Deleted: {result.get('files_deleted', 0):,}
-   • Space Freed: {result.get('space_freed', 0) / (1024*1024):.1f} MB
-   • Success Rate: {result.get('success_rate', 0):.1f}%
-   • Time Taken: {result.get('time_taken', 0):.1f} seconds
-"""
-            
-            summary_text.insert(tk.END, summary_content)
-        
-        # Before/After tab
-        comparison_frame = ttk.Frame(notebook)
-        notebook.add(comparison_frame, text="📈 Before/After")
-        
-        comparison_text = scrolledtext.ScrolledText(comparison_frame, font=('Consolas', 10))
-        comparison_text.pack(fill='both', expand=True, padx=10, pady=10)
-        
-        # Format before/after comparison
+                parts.append(_RESULT_TEMPLATE.format(
+                    op=result.get('operation_type', 'Unknown'),
+                    fp=result.get('files_processed', 0),
+                    fd=result.get('files_deleted', 0),
+                    sm=result.get('space_freed', 0) * _INV_MB,
+                    sr=result.get('success_rate', 0),
+                    tt=result.get('time_taken', 0),
+                ))
+            summary_content = ''.join(parts)
+        
+        return summary_content
+    
+    def _format_comparison(self, report_data):
+        """Before/after tab text"""
         comparison_content = "🔍 BEFORE/AFTER SYSTEM COMPARISON\n" + "=" * 50 + "\n\n"
         
         if 'before_state' in report_data and 'after_state' in report_data:
             before = report_data['before_state']
             after = report_data['after_state']
             
+            # Pull every figure out once; the template below reuses several of them
+            before_temp_count = before.get('temp_files_count', 0)
+            after_temp_count = after.get('temp_files_count', 0)
+            before_temp_size = before.get('temp_files_size', 0)
+            after_temp_size = after.get('temp_files_size', 0)
+            before_cache_size = before.get('browser_cache_size', 0)
+            after_cache_size = after.get('browser_cache_size', 0)
+            before_available = before.get('memory_info', {}).get('available', 0)
+            after_available = after.get('memory_info', {}).get('available', 0)
+            space_recovered = before_temp_size + before_cache_size - after_temp_size - after_cache_size
+            
             comparison_content += f"""
 📅 BEFORE CLEANUP ({before.get('timestamp', 'Unknown')[:19]}):
 {'-' * 40}
-🗑️ Temp Files: {before.get('temp_files_count', 0):,} files ({before.get('temp_files_size', 0) / (1024*1024):.1f} MB)
-🌐 Browser Cache: {before.get('browser_cache_size', 0) / (1024*1024):.1f} MB
+🗑️ Temp Files: {before_temp_count:,} files ({before_temp_size * _INV_MB:.1f} MB)
+🌐 Browser Cache: {before_cache_size * _INV_MB:.1f} MB
 🚀 Startup Programs: {before.get('startup_programs_count', 0)}
-🧠 Available Memory: {before.get('memory_info', {}).get('available', 0) / (1024**3):.1f} GB
+🧠 Available Memory: {before_available * _INV_GB:.1f} GB
 
 📅 AFTER CLEANUP ({after.get('timestamp', 'Unknown')[:19]}):
 {'-' * 40}
-🗑️ Temp Files: {after.get('temp_files_count', 0):,} files ({after.get('temp_files_size', 0) / (1024*1024):.1f} MB)
-🌐 Browser Cache: {after.get('browser_cache_size', 0) / (1024*1024):.1f} MB
+🗑️ Temp Files: {after_temp_count:,} files ({after_temp_size * _INV_MB:.1f} MB)
+🌐 Browser Cache: {after_cache_size * _INV_MB:.1f} MB
 🚀 Startup Programs: {after.get('startup_programs_count', 0)}
-🧠 Available Memory: {after.get('memory_info', {}).get('available', 0) / (1024**3):.1f} GB
+🧠 Available Memory: {after_available * _INV_GB:.1f} GB
 
 📊 IMPROVEMENTS:
 {'-' * 20}
-🗑️ Temp Files Reduced: {before.get('temp_files_count', 0) - after.get('temp_files_count', 0):,} files
-💾 Space Recovered: {(before.get('temp_files_size', 0) + before.get('browser_cache_size', 0) - after.get('temp_files_size', 0) - after.get('browser_cache_size', 0)) / (1024*1024):.1f} MB
-🧠 Memory Freed: {(after.get('memory_info', {}).get('available', 0) - before.get('memory_info', {}).get('available', 0)) / (1024**2):.1f} MB
+🗑️ Temp Files Reduced: {before_temp_count - after_temp_count:,} files
+💾 Space Recovered: {space_recovered * _INV_MB:.1f} MB
+🧠 Memory Freed: {(after_available - before_available) * _INV_MB:.1f} MB
 """
         
-        comparison_text.insert(tk.END, comparison_content)
-        
-        # Recommendations tab
-        recommendations_frame = ttk.Frame(notebook)
-        notebook.add(recommendations_frame, text="💡 Recommendations")
-        
-        recommendations_text = scrolledtext.ScrolledText(recommendations_frame, font=('Consolas', 10))
-        recommendations_text.pack(fill='both', expand=True, padx=10, pady=10)
-        
+        return comparison_content
+    
+    def _format_recommendations(self, report_data):
+        """Recommendations tab text"""
         rec_content = "💡 SYSTEM OPTIMIZATION RECOMMENDATIONS\n" + "=" * 50 + "\n\n"
         
         for i, rec in enumerate(report_data.get('recommendations', []), 1):
             rec_content += f"{i}. {rec}\n\n"
         
-        recommendations_text.insert(tk.END, rec_content)
+        return rec_content
+    
+    def show_report_window(self, report_data):
+        """Show detailed report in new window; tabs are filled when first shown"""
+        report_window = tk.Toplevel(self.root)
+        report_window.title("Cleanup Report - Detailed Results")
+        report_window.geometry("800x600")
+        
+        # Create notebook for tabbed report
+        notebook = ttk.Notebook(report_window, padding=10)
+        notebook.pack(fill='both', expand=True)
+        
+        # One empty text per tab; built[i] records whether tab i has its content
+        texts = []
+        for title, _ in self.REPORT_TABS:
+            frame = ttk.Frame(notebook)
+            notebook.add(frame, text=title)
+            
+            text = scrolledtext.ScrolledText(frame, font=self.fonts['mono10'])
+            text.pack(fill='both', expand=True, padx=10, pady=10)
+            texts.append(text)
+        built = [False] * len(texts)
+        
+        def build_tab(event=None):
+            index = notebook.index('current')
+            if not built[index]:
+                texts[index].insert(tk.END, self._format_tab(report_data, index))
+                built[index] = True
+        
+        build_tab()
+        notebook.bind('<<NotebookTabChanged>>', build_tab)
     
     def generate_full_report(self):
         """Generate and save full report"""
@@ -602,18 +847,37 @@ class V2ModernUI:
             report_dir = Path.home() / "Desktop" / "PC_Cleanup_V2_Reports"
             report_dir.mkdir(parents=True, exist_ok=True)
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             report_file = report_dir / f"cleanup_report_v2_{timestamp}.json"
-            
-            with open(report_file, 'w') as f:
-                json.dump(self.current_report, f, indent=2, default=str)
-            
-            messagebox.showinfo("Report Saved", 
-                              f"📄 Full report saved to:\n{report_file}\n\n"
-                              f"You can share this report or import it later.")
-            
         except Exception as e:
             messagebox.showerror("Save Error", f"Failed to save report:\n{str(e)}")
+            return
+        
+        report = self.current_report
+        
+        def save_worker():
+            # Serializing a large report would stall the event loop, so it runs here
+            try:
+                if orjson is not None:
+                    with open(report_file, 'wb') as f:
+                        f.write(orjson.dumps(report, default=str,
+                                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                else:
+                    # json.dump already writes chunk by chunk; the large buffer
+                    # turns its many small writes into a few big ones
+                    with open(report_file, 'w', buffering=_SAVE_BUFFER_SIZE) as f:
+                        json.dump(report, f, indent=2, default=str)
+                
+                self._ui_q.put(lambda: messagebox.showinfo(
+                    "Report Saved",
+                    f"📄 Full report saved to:\n{report_file}\n\n"
+                    f"You can share this report or import it later."))
+                
+            except Exception as e:
+                error = str(e)
+                self._ui_q.put(lambda: messagebox.showerror("Save Error", f"Failed to save report:\n{error}"))
+        
+        self._pool.submit(save_worker)
     
     def open_settings(self):
         """Open settings window"""
@@ -654,6 +918,12 @@ Version: 2.0 Professional
         
         messagebox.showinfo("Help - PC Cleanup Tool V2", help_text)
     
+    def on_close(self):
+        """Stop accepting work, cancel a running cleanup and close the window"""
+        self.engine.cancel()
+        self._pool.shutdown(wait=False)
+        self.root.destroy()
+    
     def run(self):
         """Start the application"""
         self.root.mainloop()
@@ -10,17 +10,160 @@ This module allows complete customization of:
 """
 
 import json
-import tkinter as tk
-from tkinter import ttk, colorchooser, filedialog, messagebox
+import copy
+import functools
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Optional
 import os
+import atexit
+import threading
+
+# tkinter is only needed by BrandingConfiguratorGUI and is imported on first
+# use, so code that only reads the config through BrandingManager skips it
+tk = ttk = colorchooser = filedialog = messagebox = None
+
+def _import_tkinter():
+    """Import the tkinter modules used by the configurator GUI"""
+    global tk, ttk, colorchooser, filedialog, messagebox
+    if tk is None:
+        import tkinter as tk
+        from tkinter import ttk, colorchooser, filedialog, messagebox
+
+# Optional fast JSON codec; _dumps returns bytes and _loads accepts them
+try:
+    import orjson
+    
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+    
+    _loads = json.loads
+
+# Parsed config files by resolved path: (st_mtime_ns, st_size, config). Reused
+# until the file's stat changes, so repeated BrandingManager() skips the parse.
+_CONFIG_CACHE: Dict[Path, tuple] = {}
+
+# Features enabled by each pricing tier, read-only
+_TIER_FEATURES = MappingProxyType({
+    "basic": MappingProxyType({
+        "temp_cleanup": True,
+        "browser_cleanup": True,
+        "registry_cleanup": False,
+        "startup_optimization": False,
+        "disk_analysis": False,
+        "system_monitoring": False,
+        "scheduled_maintenance": False,
+        "network_cleanup": False,
+        "advanced_reporting": False
+    }),
+    "professional": MappingProxyType({
+        "temp_cleanup": True,
+        "browser_cleanup": True,
+        "registry_cleanup": True,
+        "startup_optimization": True,
+        "disk_analysis": True,
+        "system_monitoring": True,
+        "scheduled_maintenance": False,
+        "network_cleanup": False,
+        "advanced_reporting": False
+    }),
+    "enterprise": MappingProxyType({
+        "temp_cleanup": True,
+        "browser_cleanup": True,
+        "registry_cleanup": True,
+        "startup_optimization": True,
+        "disk_analysis": True,
+        "system_monitoring": True,
+        "scheduled_maintenance": True,
+        "network_cleanup": True,
+        "advanced_reporting": True
+    })
+})
+
+def _merge_config(defaults: Dict[str, Any], loaded: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Copy of defaults with loaded laid over it. Dict sections are merged key by
+    key, so a saved "colors" section missing a newer default key keeps it.
+    """
+    config = {key: dict(value) if isinstance(value, dict) else value
+              for key, value in defaults.items()}
+    if loaded:
+        for key, value in loaded.items():
+            if isinstance(value, dict) and isinstance(config.get(key), dict):
+                config[key].update(value)
+            else:
+                config[key] = value
+    return config
+
+def _set_if_changed(var, value):
+    """Set a Tk variable only when value differs from its current one"""
+    if var.get() != value:
+        var.set(value)
+
+@functools.lru_cache(maxsize=64)
+def _pretty(name: str) -> str:
+    """Display label for a config key, e.g. 'card_bg' -> 'Card Bg'"""
+    return name.replace('_', ' ').title()
+
+@functools.lru_cache(maxsize=8)
+def _exe_name(company: str, title: str) -> str:
+    """Executable file name for a company name and application title"""
+    company = company.replace(" ", "").replace("-", "")
+    app_name = title.replace(" ", "").replace("'", "")
+    return f"{company}_{app_name}.exe"
+
+# Preview tab text, filled from the current config with str.format_map
+_PREVIEW_TEMPLATE = """
+BRANDING CONFIGURATION PREVIEW
+{rule}
+
+COMPANY INFORMATION:
+Name: {company_info[name]}
+Website: {company_info[website]}
+Support Email: {company_info[support_email]}
+Phone: {company_info[phone]}
+Address: {company_info[address]}
+
+APPLICATION BRANDING:
+Title: {application[title]}
+Subtitle: {application[subtitle]}
+Version: {application[version]}
+Description: {application[description]}
+
+COLOR SCHEME:
+Primary: {colors[primary]}
+Secondary: {colors[secondary]}
+Success: {colors[success]}
+Background: {colors[background]}
+Card Background: {colors[card_bg]}
+Primary Text: {colors[text_primary]}
+Secondary Text: {colors[text_secondary]}
+
+PRICING TIER: {tier}
+
+ENABLED FEATURES:
+{feature_lines}
+
+
+EXECUTABLE NAME: {exe_name}
+
+DEPLOYMENT READY: {ready}
+"""
 
 class BrandingManager:
     """
     Professional branding management system for white-label deployment
     """
     
+    # Setter changes are written this many seconds after the last one, so a
+    # burst of updates costs a single save
+    SAVE_DELAY = 1.0
+    
     def __init__(self):
         self.config_file = Path("branding_config.json")
         self.default_config = {
@@ -64,33 +207,73 @@ class BrandingManager:
             "deployment_id": ""
         }
         
+        # Set by the update_* setters; a delayed flush() (and one at exit)
+        # writes the config only when set
+        self._dirty = False
+        self._save_lock = threading.RLock()
+        self._save_timer = None
+        atexit.register(self.flush)
+        
         self.load_config()
     
     def load_config(self) -> Dict[str, Any]:
         """Load branding configuration from file"""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    loaded_config = json.load(f)
-                    # Merge with defaults to ensure all keys exist
-                    self.config = {**self.default_config, **loaded_config}
-            except (json.JSONDecodeError, FileNotFoundError):
-                self.config = self.default_config.copy()
-        else:
-            self.config = self.default_config.copy()
+        try:
+            loaded_config = self._read_config_file()
+            # Merge with defaults to ensure all keys exist
+            self.config = _merge_config(self.default_config, loaded_config)
+        except (json.JSONDecodeError, FileNotFoundError):
+            self.config = _merge_config(self.default_config)
         
         return self.config
     
+    def _read_config_file(self) -> Dict[str, Any]:
+        """Parsed config file, from _CONFIG_CACHE while the file is unchanged"""
+        path = self.config_file.resolve()
+        stat = path.stat()
+        cached = _CONFIG_CACHE.get(path)
+        if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+            cached = (stat.st_mtime_ns, stat.st_size, _loads(path.read_bytes()))
+            _CONFIG_CACHE[path] = cached
+        
+        # The config's sections are updated in place, so never hand out the cached dict
+        return copy.deepcopy(cached[2])
+    
     def save_config(self):
         """Save current configuration to file"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            # Encode first so the file gets one write instead of one per token, then
+            # swap it in atomically so a crash never leaves a half-written config
+            with self._save_lock:
+                payload = _dumps(self.config)
+                tmp_file = self.config_file.with_suffix(".json.tmp")
+                tmp_file.write_bytes(payload)
+                os.replace(tmp_file, self.config_file)
+                self._dirty = False
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
             return False
     
+    def flush(self) -> bool:
+        """Save the configuration now if it changed since the last save"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return True
+            return self.save_config()
+    
+    def _mark_dirty(self):
+        """Flag unsaved changes and restart the delayed save (call with _save_lock held)"""
+        self._dirty = True
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+    
     def get_company_info(self) -> Dict[str, str]:
         """Get company information"""
         return self.config["company_info"]
@@ -108,68 +291,34 @@ class BrandingManager:
         return self.config["features"]
     
     def update_company_info(self, **kwargs):
-        """Update company information"""
-        self.config["company_info"].update(kwargs)
-        self.save_config()
+        """Update company information (saved shortly after)"""
+        with self._save_lock:
+            self.config["company_info"].update(kwargs)
+            self._mark_dirty()
     
     def update_application_info(self, **kwargs):
-        """Update application branding"""
-        self.config["application"].update(kwargs)
-        self.save_config()
+        """Update application branding (saved shortly after)"""
+        with self._save_lock:
+            self.config["application"].update(kwargs)
+            self._mark_dirty()
     
     def update_colors(self, **kwargs):
-        """Update color scheme"""
-        self.config["colors"].update(kwargs)
-        self.save_config()
+        """Update color scheme (saved shortly after)"""
+        with self._save_lock:
+            self.config["colors"].update(kwargs)
+            self._mark_dirty()
     
     def set_pricing_tier(self, tier: str):
-        """Set pricing tier and update available features"""
-        tier_features = {
-            "basic": {
-                "temp_cleanup": True,
-                "browser_cleanup": True,
-                "registry_cleanup": False,
-                "startup_optimization": False,
-                "disk_analysis": False,
-                "system_monitoring": False,
-                "scheduled_maintenance": False,
-                "network_cleanup": False,
-                "advanced_reporting": False
-            },
-            "professional": {
-                "temp_cleanup": True,
-                "browser_cleanup": True,
-                "registry_cleanup": True,
-                "startup_optimization": True,
-                "disk_analysis": True,
-                "system_monitoring": True,
-                "scheduled_maintenance": False,
-                "network_cleanup": False,
-                "advanced_reporting": False
-            },
-            "enterprise": {
-                "temp_cleanup": True,
-                "browser_cleanup": True,
-                "registry_cleanup": True,
-                "startup_optimization": True,
-                "disk_analysis": True,
-                "system_monitoring": True,
-                "scheduled_maintenance": True,
-                "network_cleanup": True,
-                "advanced_reporting": True
-            }
-        }
-        
-        if tier in tier_features:
-            self.config["pricing_tier"] = tier
-            self.config["features"] = tier_features[tier]
-            self.save_config()
+        """Set pricing tier and update available features (saved shortly after)"""
+        if tier in _TIER_FEATURES:
+            with self._save_lock:
+                self.config["pricing_tier"] = tier
+                self.config["features"] = dict(_TIER_FEATURES[tier])
+                self._mark_dirty()
     
     def create_branded_executable_name(self) -> str:
         """Generate branded executable name"""
-        company = self.config["company_info"]["name"].replace(" ", "").replace("-", "")
-        app_name = self.config["application"]["title"].replace(" ", "").replace("'", "")
-        return f"{company}_{app_name}.exe"
+        return _exe_name(self.config["company_info"]["name"], self.config["application"]["title"])
 
 
 class BrandingConfiguratorGUI:
@@ -177,7 +326,27 @@ class BrandingConfiguratorGUI:
     GUI tool for easy branding configuration
     """
     
+    # Entry rows of the company and application tabs: (label, StringVar
+    # attribute, key in the config section)
+    COMPANY_FIELDS = (
+        ("Company Name:", "company_name", "name"),
+        ("Website:", "website", "website"),
+        ("Support Email:", "support_email", "support_email"),
+        ("Phone:", "phone", "phone"),
+        ("Address:", "address", "address")
+    )
+    APPLICATION_FIELDS = (
+        ("Application Title:", "app_title", "title"),
+        ("Subtitle:", "app_subtitle", "subtitle"),
+        ("Version:", "app_version", "version"),
+        ("Description:", "app_description", "description")
+    )
+    
+    # Cell padding shared by the grid-based tabs
+    GRID_PADDING = {"padx": 5, "pady": 5}
+    
     def __init__(self):
+        _import_tkinter()
         self.branding_manager = BrandingManager()
         self.root = tk.Tk()
         self.setup_gui()
@@ -220,55 +389,23 @@ class BrandingConfiguratorGUI:
         frame = ttk.Frame(notebook)
         notebook.add(frame, text="Company Info")
         
-        # Company name
-        ttk.Label(frame, text="Company Name:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        self.company_name = tk.StringVar(value=self.branding_manager.config["company_info"]["name"])
-        ttk.Entry(frame, textvariable=self.company_name, width=50).grid(row=0, column=1, padx=5, pady=5)
-        
-        # Website
-        ttk.Label(frame, text="Website:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        self.website = tk.StringVar(value=self.branding_manager.config["company_info"]["website"])
-        ttk.Entry(frame, textvariable=self.website, width=50).grid(row=1, column=1, padx=5, pady=5)
-        
-        # Support email
-        ttk.Label(frame, text="Support Email:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
-        self.support_email = tk.StringVar(value=self.branding_manager.config["company_info"]["support_email"])
-        ttk.Entry(frame, textvariable=self.support_email, width=50).grid(row=2, column=1, padx=5, pady=5)
-        
-        # Phone
-        ttk.Label(frame, text="Phone:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
-        self.phone = tk.StringVar(value=self.branding_manager.config["company_info"]["phone"])
-        ttk.Entry(frame, textvariable=self.phone, width=50).grid(row=3, column=1, padx=5, pady=5)
-        
-        # Address
-        ttk.Label(frame, text="Address:").grid(row=4, column=0, sticky=tk.W, padx=5, pady=5)
-        self.address = tk.StringVar(value=self.branding_manager.config["company_info"]["address"])
-        ttk.Entry(frame, textvariable=self.address, width=50).grid(row=4, column=1, padx=5, pady=5)
+        self._create_entry_rows(frame, "company_info", self.COMPANY_FIELDS)
     
     def create_application_tab(self, notebook):
         """Create application branding tab"""
         frame = ttk.Frame(notebook)
         notebook.add(frame, text="Application")
         
-        # Application title
-        ttk.Label(frame, text="Application Title:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        self.app_title = tk.StringVar(value=self.branding_manager.config["application"]["title"])
-        ttk.Entry(frame, textvariable=self.app_title, width=50).grid(row=0, column=1, padx=5, pady=5)
-        
-        # Subtitle
-        ttk.Label(frame, text="Subtitle:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        self.app_subtitle = tk.StringVar(value=self.branding_manager.config["application"]["subtitle"])
-        ttk.Entry(frame, textvariable=self.app_subtitle, width=50).grid(row=1, column=1, padx=5, pady=5)
-        
-        # Version
-        ttk.Label(frame, text="Version:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
-        self.app_version = tk.StringVar(value=self.branding_manager.config["application"]["version"])
-        ttk.Entry(frame, textvariable=self.app_version, width=50).grid(row=2, column=1, padx=5, pady=5)
-        
-        # Description
-        ttk.Label(frame, text="Description:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
-        self.app_description = tk.StringVar(value=self.branding_manager.config["application"]["description"])
-        ttk.Entry(frame, textvariable=self.app_description, width=50).grid(row=3, column=1, padx=5, pady=5)
+        self._create_entry_rows(frame, "application", self.APPLICATION_FIELDS)
+    
+    def _create_entry_rows(self, frame, section, fields):
+        """Add a label and entry row per (label, attribute, key) in fields"""
+        values = self.branding_manager.config[section]
+        for row, (label, attr, key) in enumerate(fields):
+            var = tk.StringVar(value=values[key])
+            setattr(self, attr, var)
+            ttk.Label(frame, text=label).grid(row=row, column=0, sticky=tk.W, **self.GRID_PADDING)
+            ttk.Entry(frame, textvariable=var, width=50).grid(row=row, column=1, **self.GRID_PADDING)
     
     def create_colors_tab(self, notebook):
         """Create color scheme tab"""
@@ -278,23 +415,24 @@ class BrandingConfiguratorGUI:
         self.color_vars = {}
         colors = self.branding_manager.config["colors"]
         
-        row = 0
-        for color_name, color_value in colors.items():
-            ttk.Label(frame, text=f"{color_name.replace('_', ' ').title()}:").grid(row=row, column=0, sticky=tk.W, padx=5, pady=5)
+        # Lower-cased colour each preview tile currently shows
+        self._tile_colors = {}
+        
+        for row, (color_name, color_value) in enumerate(colors.items()):
+            ttk.Label(frame, text=f"{_pretty(color_name)}:").grid(row=row, column=0, sticky=tk.W, **self.GRID_PADDING)
             
             # Color preview
             color_frame = tk.Frame(frame, bg=color_value, width=30, height=20, relief=tk.RAISED, bd=1)
-            color_frame.grid(row=row, column=1, padx=5, pady=5)
+            color_frame.grid(row=row, column=1, **self.GRID_PADDING)
+            self._tile_colors[color_name] = color_value.lower()
             
             # Color value entry
             self.color_vars[color_name] = tk.StringVar(value=color_value)
             entry = ttk.Entry(frame, textvariable=self.color_vars[color_name], width=10)
-            entry.grid(row=row, column=2, padx=5, pady=5)
+            entry.grid(row=row, column=2, **self.GRID_PADDING)
             
             # Color picker button
-            ttk.Button(frame, text="Pick", command=lambda cn=color_name, cf=color_frame: self.pick_color(cn, cf)).grid(row=row, column=3, padx=5, pady=5)
-            
-            row += 1
+            ttk.Button(frame, text="Pick", command=lambda cn=color_name, cf=color_frame: self.pick_color(cn, cf)).grid(row=row, column=3, **self.GRID_PADDING)
     
     def create_features_tab(self, notebook):
         """Create features configuration tab"""
@@ -317,7 +455,7 @@ class BrandingConfiguratorGUI:
         
         for feature_name, enabled in features.items():
             self.feature_vars[feature_name] = tk.BooleanVar(value=enabled)
-            cb = ttk.Checkbutton(frame, text=feature_name.replace('_', ' ').title(), variable=self.feature_vars[feature_name])
+            cb = ttk.Checkbutton(frame, text=_pretty(feature_name), variable=self.feature_vars[feature_name])
             cb.grid(row=row, column=0, columnspan=2, sticky=tk.W, padx=20, pady=2)
             row += 1
     
@@ -326,6 +464,9 @@ class BrandingConfiguratorGUI:
         frame = ttk.Frame(notebook)
         notebook.add(frame, text="Preview")
         
+        # Text last written by update_preview
+        self._preview_content = None
+        
         # Preview area
         preview_text = tk.Text(frame, height=25, width=80)
         preview_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -339,9 +480,11 @@ class BrandingConfiguratorGUI:
     def pick_color(self, color_name, color_frame):
         """Open color picker dialog"""
         color = colorchooser.askcolor(initialcolor=self.color_vars[color_name].get())[1]
-        if color:
+        # Picking the colour already shown changes nothing, so skip the Tk calls
+        if color and color.lower() != self._tile_colors.get(color_name):
             self.color_vars[color_name].set(color)
             color_frame.configure(bg=color)
+            self._tile_colors[color_name] = color.lower()
     
     def update_features_for_tier(self, event=None):
         """Update features based on selected pricing tier"""
@@ -356,76 +499,49 @@ class BrandingConfiguratorGUI:
         """Update the preview text"""
         config = self.get_current_config()
         
-        preview_content = f"""
-BRANDING CONFIGURATION PREVIEW
-{'=' * 50}
-
-COMPANY INFORMATION:
-Name: {config['company_info']['name']}
-Website: {config['company_info']['website']}
-Support Email: {config['company_info']['support_email']}
-Phone: {config['company_info']['phone']}
-Address: {config['company_info']['address']}
-
-APPLICATION BRANDING:
-Title: {config['application']['title']}
-Subtitle: {config['application']['subtitle']}
-Version: {config['application']['version']}
-Description: {config['application']['description']}
-
-COLOR SCHEME:
-Primary: {config['colors']['primary']}
-Secondary: {config['colors']['secondary']}
-Success: {config['colors']['success']}
-Background: {config['colors']['background']}
-Card Background: {config['colors']['card_bg']}
-Primary Text: {config['colors']['text_primary']}
-Secondary Text: {config['colors']['text_secondary']}
-
-PRICING TIER: {config['pricing_tier'].upper()}
-
-ENABLED FEATURES:
-"""
-        
-        for feature, enabled in config['features'].items():
-            status = "✓" if enabled else "✗"
-            preview_content += f"{status} {feature.replace('_', ' ').title()}\n"
-        
-        preview_content += f"""
-
-EXECUTABLE NAME: {self.branding_manager.create_branded_executable_name()}
-
-DEPLOYMENT READY: {'Yes' if self.validate_config(config) else 'No - Missing required fields'}
-"""
+        feature_lines = "\n".join(
+            f"{'✓' if enabled else '✗'} {_pretty(feature)}"
+            for feature, enabled in config['features'].items()
+        )
+        preview_content = _PREVIEW_TEMPLATE.format_map({
+            **config,
+            'rule': '=' * 50,
+            'tier': config['pricing_tier'].upper(),
+            'feature_lines': feature_lines,
+            'exe_name': self.branding_manager.create_branded_executable_name(),
+            'ready': 'Yes' if self.validate_config(config) else 'No - Missing required fields'
+        })
+        
+        # Nothing changed since the last update: leave the Text widget alone
+        if preview_content == self._preview_content:
+            return
+        self._preview_content = preview_content
         
-        self.preview_text.delete(1.0, tk.END)
-        self.preview_text.insert(1.0, preview_content)
+        self.preview_text.replace('1.0', tk.END, preview_content)
     
     def get_current_config(self):
         """Get current configuration from GUI"""
-        config = self.branding_manager.config.copy()
-        
-        # Update from GUI fields
-        config['company_info']['name'] = self.company_name.get()
-        config['company_info']['website'] = self.website.get()
-        config['company_info']['support_email'] = self.support_email.get()
-        config['company_info']['phone'] = self.phone.get()
-        config['company_info']['address'] = self.address.get()
-        
-        config['application']['title'] = self.app_title.get()
-        config['application']['subtitle'] = self.app_subtitle.get()
-        config['application']['version'] = self.app_version.get()
-        config['application']['description'] = self.app_description.get()
-        
-        for color_name, var in self.color_vars.items():
-            config['colors'][color_name] = var.get()
-        
-        config['pricing_tier'] = self.pricing_tier.get()
-        
-        for feature_name, var in self.feature_vars.items():
-            config['features'][feature_name] = var.get()
-        
-        return config
+        # Every section is rebuilt from the GUI fields; only the keys without
+        # a field (logo, license, ...) come from the stored config
+        return {
+            **self.branding_manager.config,
+            'company_info': {
+                'name': self.company_name.get(),
+                'website': self.website.get(),
+                'support_email': self.support_email.get(),
+                'phone': self.phone.get(),
+                'address': self.address.get()
+            },
+            'application': {
+                'title': self.app_title.get(),
+                'subtitle': self.app_subtitle.get(),
+                'version': self.app_version.get(),
+                'description': self.app_description.get()
+            },
+            'colors': {color_name: var.get() for color_name, var in self.color_vars.items()},
+            'pricing_tier': self.pricing_tier.get(),
+            'features': {feature_name: var.get() for feature_name, var in self.feature_vars.items()}
+        }
     
     def validate_config(self, config):
         """Validate configuration completeness"""
@@ -456,10 +572,9 @@ DEPLOYMENT READY: {'Yes' if self.validate_config(config) else 'No - Missing requ
         
         if file_path:
             try:
-                with open(file_path, 'r') as f:
-                    config = json.load(f)
+                config = _loads(Path(file_path).read_bytes())
                 
-                self.branding_manager.config = {**self.branding_manager.default_config, **config}
+                self.branding_manager.config = _merge_config(self.branding_manager.default_config, config)
                 self.refresh_gui()
                 messagebox.showinfo("Success", "Configuration loaded successfully!")
                 
@@ -469,31 +584,26 @@ DEPLOYMENT READY: {'Yes' if self.validate_config(config) else 'No - Missing requ
     def reset_config(self):
         """Reset to default configuration"""
         if messagebox.askyesno("Confirm Reset", "Reset all settings to defaults?"):
-            self.branding_manager.config = self.branding_manager.default_config.copy()
+            self.branding_manager.config = _merge_config(self.branding_manager.default_config)
             self.refresh_gui()
     
     def refresh_gui(self):
         """Refresh GUI with current configuration"""
         config = self.branding_manager.config
         
-        self.company_name.set(config['company_info']['name'])
-        self.website.set(config['company_info']['website'])
-        self.support_email.set(config['company_info']['support_email'])
-        self.phone.set(config['company_info']['phone'])
-        self.address.set(config['company_info']['address'])
-        
-        self.app_title.set(config['application']['title'])
-        self.app_subtitle.set(config['application']['subtitle'])
-        self.app_version.set(config['application']['version'])
-        self.app_description.set(config['application']['description'])
+        # Only touch variables whose value differs; each set() fires Tk traces
+        for section, fields in (("company_info", self.COMPANY_FIELDS),
+                                ("application", self.APPLICATION_FIELDS)):
+            for _, attr, key in fields:
+                _set_if_changed(getattr(self, attr), config[section][key])
         
         for color_name, var in self.color_vars.items():
-            var.set(config['colors'][color_name])
+            _set_if_changed(var, config['colors'][color_name])
         
-        self.pricing_tier.set(config['pricing_tier'])
+        _set_if_changed(self.pricing_tier, config['pricing_tier'])
         
         for feature_name, var in self.feature_vars.items():
-            var.set(config['features'][feature_name])
+            _set_if_changed(var, config['features'][feature_name])
         
         self.update_preview()
     
@@ -7,7 +7,9 @@ Safety features: Process detection, backup options, selective cleaning
 """
 
 import os
-import shutil
+import stat
+import ctypes
+import ctypes.wintypes
 import psutil
 import subprocess
 from pathlib import Path
@@ -15,64 +17,277 @@ from typing import Dict, List, Optional, Tuple
 import logging
 import json
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+# FindFirstFileExW options: skip 8.3 names and fetch many entries per call
+FIND_EX_INFO_BASIC = 1
+FIND_EX_SEARCH_NAME_MATCH = 0
+FIND_FIRST_EX_LARGE_FETCH = 0x2
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+# CreateToolhelp32Snapshot flag for a snapshot of all processes
+TH32CS_SNAPPROCESS = 0x2
+
+
+class _PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ('dwSize', ctypes.wintypes.DWORD),
+        ('cntUsage', ctypes.wintypes.DWORD),
+        ('th32ProcessID', ctypes.wintypes.DWORD),
+        ('th32DefaultHeapID', ctypes.c_size_t),
+        ('th32ModuleID', ctypes.wintypes.DWORD),
+        ('cntThreads', ctypes.wintypes.DWORD),
+        ('th32ParentProcessID', ctypes.wintypes.DWORD),
+        ('pcPriClassBase', ctypes.wintypes.LONG),
+        ('dwFlags', ctypes.wintypes.DWORD),
+        ('szExeFile', ctypes.wintypes.WCHAR * ctypes.wintypes.MAX_PATH)
+    ]
+
+
+def _load_kernel32():
+    """Private kernel32 with the listing/snapshot prototypes set, or None off Windows"""
+    try:
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    except (AttributeError, OSError):
+        return None
+        
+    kernel32.FindFirstFileExW.restype = ctypes.wintypes.HANDLE
+    kernel32.FindFirstFileExW.argtypes = [
+        ctypes.wintypes.LPCWSTR, ctypes.c_int, ctypes.c_void_p,
+        ctypes.c_int, ctypes.c_void_p, ctypes.wintypes.DWORD
+    ]
+    kernel32.FindNextFileW.argtypes = [ctypes.wintypes.HANDLE, ctypes.c_void_p]
+    kernel32.FindClose.argtypes = [ctypes.wintypes.HANDLE]
+    kernel32.CreateToolhelp32Snapshot.restype = ctypes.wintypes.HANDLE
+    kernel32.CreateToolhelp32Snapshot.argtypes = [ctypes.wintypes.DWORD, ctypes.wintypes.DWORD]
+    kernel32.Process32FirstW.argtypes = [ctypes.wintypes.HANDLE, ctypes.c_void_p]
+    kernel32.Process32NextW.argtypes = [ctypes.wintypes.HANDLE, ctypes.c_void_p]
+    kernel32.CloseHandle.argtypes = [ctypes.wintypes.HANDLE]
+    return kernel32
+
+
+_KERNEL32 = _load_kernel32()
+
+
+def _list_directory_win32(path: str) -> Tuple[List[Tuple[str, int]], List[str]]:
+    """_list_directory via FindFirstFileExW with FIND_FIRST_EX_LARGE_FETCH"""
+    files = []
+    subdirs = []
+    data = ctypes.wintypes.WIN32_FIND_DATAW()
+    
+    handle = _KERNEL32.FindFirstFileExW(
+        os.path.join(path, '*'), FIND_EX_INFO_BASIC, ctypes.byref(data),
+        FIND_EX_SEARCH_NAME_MATCH, None, FIND_FIRST_EX_LARGE_FETCH
+    )
+    if handle is None or handle == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+        
+    try:
+        while True:
+            name = data.cFileName
+            attributes = data.dwFileAttributes
+            if name not in ('.', '..'):
+                if attributes & stat.FILE_ATTRIBUTE_DIRECTORY:
+                    if not attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT:
+                        subdirs.append(os.path.join(path, name))
+                else:
+                    files.append((os.path.join(path, name), (data.nFileSizeHigh << 32) | data.nFileSizeLow))
+            if not _KERNEL32.FindNextFileW(handle, ctypes.byref(data)):
+                break
+    finally:
+        _KERNEL32.FindClose(handle)
+    return files, subdirs
+
+
+def _process_names_win32() -> Dict[str, int]:
+    """
+    Lower-cased image name -> PID from one Toolhelp32 snapshot, reading only
+    the names rather than building a psutil.Process per process
+    """
+    handle = _KERNEL32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if handle is None or handle == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+        
+    names = {}
+    entry = _PROCESSENTRY32W()
+    entry.dwSize = ctypes.sizeof(_PROCESSENTRY32W)
+    try:
+        more = _KERNEL32.Process32FirstW(handle, ctypes.byref(entry))
+        while more:
+            names.setdefault(entry.szExeFile.lower(), entry.th32ProcessID)
+            more = _KERNEL32.Process32NextW(handle, ctypes.byref(entry))
+    finally:
+        _KERNEL32.CloseHandle(handle)
+    return names
+
+
+def _list_directory(path: str) -> Tuple[List[Tuple[str, int]], List[str]]:
+    """
+    One directory level: (file path, size) for its files and the paths of
+    its subdirectories, leaving out junctions and other reparse points.
+    Raises OSError if path itself can't be listed.
+    """
+    if _KERNEL32 is not None:
+        return _list_directory_win32(path)
+        
+    files = []
+    subdirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            # One stat() per entry decides its type and size
+            try:
+                entry_stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            mode = entry_stat.st_mode
+            if stat.S_ISDIR(mode):
+                if not getattr(entry_stat, 'st_file_attributes', 0) & stat.FILE_ATTRIBUTE_REPARSE_POINT:
+                    subdirs.append(entry.path)
+            else:
+                files.append((entry.path, entry_stat.st_size))
+    return files, subdirs
+
+
+# Bytes per MB, for the sizes shown in log messages
+_MB = 1 << 20
+
+
+def _mb(size: int) -> float:
+    """Bytes to MB"""
+    return size / _MB
+
+
+# Resolved once; every browser path below is under the user's home
+_HOME = str(Path.home())
+
+
+def _home_path(relative: str) -> str:
+    """Absolute, OS-normalized path for a '/'-separated path under the home folder"""
+    return os.path.normpath(os.path.join(_HOME, relative))
+
+
+# Browser configurations with multiple path variants. Built once at import;
+# paths are plain strings since they are only handed to os functions.
+_BROWSER_CONFIGS = {
+    'Chrome': {
+        'process_names': ['chrome.exe', 'GoogleUpdate.exe'],
+        'cache_paths': [
+            _home_path('AppData/Local/Google/Chrome/User Data/Default/Cache'),
+            _home_path('AppData/Local/Google/Chrome/User Data/Default/Code Cache'),
+            _home_path('AppData/Local/Google/Chrome/User Data/Default/GPUCache'),
+            _home_path('AppData/Local/Google/Chrome/User Data/ShaderCache')
+        ],
+        'temp_paths': [
+            _home_path('AppData/Local/Google/Chrome/User Data/Default/Service Worker/CacheStorage')
+        ]
+    },
+    'Edge': {
+        'process_names': ['msedge.exe', 'MicrosoftEdgeUpdate.exe'],
+        'cache_paths': [
+            _home_path('AppData/Local/Microsoft/Edge/User Data/Default/Cache'),
+            _home_path('AppData/Local/Microsoft/Edge/User Data/Default/Code Cache'),
+            _home_path('AppData/Local/Microsoft/Edge/User Data/Default/GPUCache')
+        ],
+        'temp_paths': [
+            _home_path('AppData/Local/Microsoft/Edge/User Data/Default/Service Worker/CacheStorage')
+        ]
+    },
+    'Firefox': {
+        'process_names': ['firefox.exe'],
+        'cache_paths': [],  # Firefox uses profile-based paths
+        'profile_cache_pattern': 'AppData/Local/Mozilla/Firefox/Profiles/*/cache2'
+    },
+    'Opera': {
+        'process_names': ['opera.exe'],
+        'cache_paths': [
+            _home_path('AppData/Local/Opera Software/Opera Stable/Cache'),
+            _home_path('AppData/Local/Opera Software/Opera Stable/GPUCache')
+        ]
+    },
+    'Brave': {
+        'process_names': ['brave.exe'],
+        'cache_paths': [
+            _home_path('AppData/Local/BraveSoftware/Brave-Browser/User Data/Default/Cache'),
+            _home_path('AppData/Local/BraveSoftware/Brave-Browser/User Data/Default/Code Cache'),
+            _home_path('AppData/Local/BraveSoftware/Brave-Browser/User Data/Default/GPUCache')
+        ]
+    }
+}
+
+# Firefox keeps one cache per profile folder in here
+_FIREFOX_PROFILES = _home_path('AppData/Local/Mozilla/Firefox/Profiles')
+
+# Each browser's process names, lower-cased once for is_browser_running()
+_PROCESS_NAMES = {
+    browser_name: [name.lower() for name in config['process_names']]
+    for browser_name, config in _BROWSER_CONFIGS.items()
+}
+
+# Each browser's cache and temp paths as one flat tuple, joined once
+for _config in _BROWSER_CONFIGS.values():
+    _config['clean_paths'] = tuple(_config.get('cache_paths', [])) + tuple(_config.get('temp_paths', []))
+del _config
+
 
 class BrowserCacheCleaner:
     """
     Enterprise-grade browser cache cleaning with safety checks
     """
     
+    # Browsers cleaned at once, and cache paths cleaned at once per browser.
+    # The work is filesystem-bound, so threads overlap the I/O waits.
+    BROWSER_WORKERS = 8
+    PATH_WORKERS = 4
+    
+    # Seconds one process list is reused across is_browser_running() calls
+    PROCESS_SNAPSHOT_TTL = 1.0
+    
+    # Seconds a measured directory size is reused by get_directory_size()
+    SIZE_CACHE_TTL = 2.0
+    
+    # Shared by every instance; see _BROWSER_CONFIGS
+    browser_configs = _BROWSER_CONFIGS
+    
     def __init__(self, logger: logging.Logger):
         self.logger = logger
         self.browsers_cleaned = 0
         self.cache_size_freed = 0
+        self._stats_lock = threading.Lock()
         
-        # Browser configurations with multiple path variants
-        self.browser_configs = {
-            'Chrome': {
-                'process_names': ['chrome.exe', 'GoogleUpdate.exe'],
-                'cache_paths': [
-                    Path.home() / 'AppData/Local/Google/Chrome/User Data/Default/Cache',
-                    Path.home() / 'AppData/Local/Google/Chrome/User Data/Default/Code Cache',
-                    Path.home() / 'AppData/Local/Google/Chrome/User Data/Default/GPUCache',
-                    Path.home() / 'AppData/Local/Google/Chrome/User Data/ShaderCache'
-                ],
-                'temp_paths': [
-                    Path.home() / 'AppData/Local/Google/Chrome/User Data/Default/Service Worker/CacheStorage'
-                ]
-            },
-            'Edge': {
-                'process_names': ['msedge.exe', 'MicrosoftEdgeUpdate.exe'],
-                'cache_paths': [
-                    Path.home() / 'AppData/Local/Microsoft/Edge/User Data/Default/Cache',
-                    Path.home() / 'AppData/Local/Microsoft/Edge/User Data/Default/Code Cache',
-                    Path.home() / 'AppData/Local/Microsoft/Edge/User Data/Default/GPUCache'
-                ],
-                'temp_paths': [
-                    Path.home() / 'AppData/Local/Microsoft/Edge/User Data/Default/Service Worker/CacheStorage'
-                ]
-            },
-            'Firefox': {
-                'process_names': ['firefox.exe'],
-                'cache_paths': [],  # Firefox uses profile-based paths
-                'profile_cache_pattern': 'AppData/Local/Mozilla/Firefox/Profiles/*/cache2'
-            },
-            'Opera': {
-                'process_names': ['opera.exe'],
-                'cache_paths': [
-                    Path.home() / 'AppData/Local/Opera Software/Opera Stable/Cache',
-                    Path.home() / 'AppData/Local/Opera Software/Opera Stable/GPUCache'
-                ]
-            },
-            'Brave': {
-                'process_names': ['brave.exe'],
-                'cache_paths': [
-                    Path.home() / 'AppData/Local/BraveSoftware/Brave-Browser/User Data/Default/Cache',
-                    Path.home() / 'AppData/Local/BraveSoftware/Brave-Browser/User Data/Default/Code Cache',
-                    Path.home() / 'AppData/Local/BraveSoftware/Brave-Browser/User Data/Default/GPUCache'
-                ]
-            }
-        }
+        # Running process names -> PID, see _snapshot_process_names()
+        self._process_lock = threading.Lock()
+        self._process_snapshot = None
+        self._process_snapshot_time = 0.0
         
+        # Path -> (time.monotonic() when measured, size in bytes)
+        self._size_cache: Dict[str, Tuple[float, int]] = {}
+        
+    def _snapshot_process_names(self) -> Dict[str, int]:
+        """
+        Lower-cased name -> PID of every running process. One psutil scan is
+        shared by all checks made within PROCESS_SNAPSHOT_TTL seconds.
+        """
+        with self._process_lock:
+            now = time.monotonic()
+            if self._process_snapshot is None or now - self._process_snapshot_time >= self.PROCESS_SNAPSHOT_TTL:
+                snapshot = None
+                if _KERNEL32 is not None:
+                    try:
+                        snapshot = _process_names_win32()
+                    except OSError as e:
+                        self.logger.debug(f"Toolhelp32 snapshot failed, using psutil: {e}")
+                if snapshot is None:
+                    snapshot = {}
+                    for proc in psutil.process_iter(['name']):
+                        name = proc.info['name']
+                        if name:
+                            snapshot.setdefault(name.lower(), proc.pid)
+                self._process_snapshot = snapshot
+                self._process_snapshot_time = now
+            return self._process_snapshot
+            
     def is_browser_running(self, browser_name: str) -> bool:
         """
         Check if browser processes are currently running
@@ -80,91 +295,148 @@ class BrowserCacheCleaner:
         if browser_name not in self.browser_configs:
             return False
             
-        process_names = self.browser_configs[browser_name]['process_names']
-        
-        for proc in psutil.process_iter(['name']):
-            try:
-                if proc.info['name'].lower() in [p.lower() for p in process_names]:
-                    self.logger.warning(f"{browser_name} is running (PID: {proc.pid})")
-                    return True
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+        snapshot = self._snapshot_process_names()
+        for process_name in _PROCESS_NAMES[browser_name]:
+            pid = snapshot.get(process_name)
+            if pid is not None:
+                self.logger.warning(f"{browser_name} is running (PID: {pid})")
+                return True
                 
         return False
         
-    def get_firefox_profiles(self) -> List[Path]:
+    def get_firefox_profiles(self) -> List[str]:
         """
         Discover Firefox profile directories dynamically
         """
         profiles = []
-        firefox_base = Path.home() / 'AppData/Local/Mozilla/Firefox/Profiles'
-        
-        if firefox_base.exists():
-            for profile_dir in firefox_base.iterdir():
-                if profile_dir.is_dir():
-                    cache_dir = profile_dir / 'cache2'
-                    if cache_dir.exists():
-                        profiles.append(cache_dir)
-                        
+        try:
+            with os.scandir(_FIREFOX_PROFILES) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        cache_dir = os.path.join(entry.path, 'cache2')
+                        if os.path.isdir(cache_dir):
+                            profiles.append(cache_dir)
+        except OSError:
+            pass  # No Firefox profiles folder
+            
         return profiles
         
-    def get_directory_size(self, path: Path) -> int:
+    def get_directory_size(self, path: str) -> int:
         """
-        Calculate total size of directory contents
+        Calculate total size of directory contents; a size measured within
+        SIZE_CACHE_TTL seconds is returned without walking the tree again
         """
+        path = os.fspath(path)
+        cached = self._size_cache.get(path)
+        if cached is not None and time.monotonic() - cached[0] < self.SIZE_CACHE_TTL:
+            return cached[1]
+            
         total_size = 0
-        try:
-            for item in path.rglob('*'):
-                if item.is_file():
-                    try:
-                        total_size += item.stat().st_size
-                    except (OSError, PermissionError):
-                        continue
-        except (OSError, PermissionError):
-            pass
+        stack = [path]
+        while stack:
+            try:
+                files, subdirs = _list_directory(stack.pop())
+            except OSError:
+                continue
+            for _, file_size in files:
+                total_size += file_size
+            stack.extend(subdirs)
+            
+        self._size_cache[path] = (time.monotonic(), total_size)
         return total_size
         
-    def safe_remove_cache_directory(self, cache_path: Path) -> Tuple[bool, int]:
+    def remove_directory_contents(self, path: str) -> Tuple[int, int]:
         """
-        Safely remove cache directory contents with size tracking
+        Delete everything inside path in a single listing pass, keeping path
+        itself. File sizes come from the directory listing as each file is
+        unlinked, so the tree is never walked just to measure it.
+        Returns (files removed, bytes freed)
         """
-        if not cache_path.exists():
-            return False, 0
-            
-        initial_size = self.get_directory_size(cache_path)
         files_removed = 0
+        size_freed = 0
+        subdirectories = []
+        stack = [os.fspath(path)]
+        # Held files can fail by the thousand, so failures are counted and
+        # logged once at the end rather than one warning per item
+        error_count = 0
+        first_error = None
         
-        try:
-            # Remove contents but preserve the directory structure
-            for item in cache_path.iterdir():
+        while stack:
+            current = stack.pop()
+            try:
+                files, subdirs = _list_directory(current)
+            except (PermissionError, OSError) as e:
+                error_count += 1
+                first_error = first_error or f"could not read {current}: {e}"
+                continue
+                
+            for file_path, file_size in files:
                 try:
-                    if item.is_file():
-                        item.unlink()
-                        files_removed += 1
-                    elif item.is_dir():
-                        shutil.rmtree(item, ignore_errors=True)
-                        files_removed += 1
+                    os.unlink(file_path)
+                    files_removed += 1
+                    size_freed += file_size
                 except (PermissionError, OSError) as e:
-                    self.logger.warning(f"Could not remove {item}: {e}")
-                    continue
-                    
-            final_size = self.get_directory_size(cache_path)
-            size_freed = initial_size - final_size
+                    error_count += 1
+                    first_error = first_error or f"could not remove {file_path}: {e}"
+            # Junctions were already left out, so they are never descended through
+            stack.extend(subdirs)
+            subdirectories.extend(subdirs)
+            
+        # Children were always found after their parents, so reverse order is leaves first
+        for directory in reversed(subdirectories):
+            try:
+                os.rmdir(directory)
+            except OSError:
+                pass  # Still holds something that couldn't be deleted
+                
+        if error_count:
+            self.logger.warning(f"Could not remove {error_count} items under {path}, first error: {first_error}")
+        return files_removed, size_freed
+        
+    def safe_remove_cache_directory(self, cache_path: str) -> Tuple[bool, int]:
+        """
+        Safely remove cache directory contents with size tracking
+        """
+        if not os.path.exists(cache_path):
+            return False, 0
+            
+        # Any size measured before this cleanup is stale from here on
+        self._size_cache.pop(os.fspath(cache_path), None)
+            
+        try:
+            # Remove contents but preserve the directory itself
+            files_removed, size_freed = self.remove_directory_contents(cache_path)
             
-            self.logger.info(f"Cleaned {cache_path}: {files_removed} items, {size_freed / 1024 / 1024:.2f} MB freed")
+            self.logger.info(f"Cleaned {cache_path}: {files_removed} files, {_mb(size_freed):.2f} MB freed")
             return True, size_freed
             
         except Exception as e:
             self.logger.error(f"Error cleaning {cache_path}: {e}")
             return False, 0
             
+    def _clean_paths(self, paths: List[str]) -> List[Tuple[bool, int]]:
+        """
+        safe_remove_cache_directory() for each path, several at a time;
+        results are in the order of paths
+        """
+        if len(paths) < 2:
+            return [self.safe_remove_cache_directory(path) for path in paths]
+        with ThreadPoolExecutor(max_workers=min(self.PATH_WORKERS, len(paths))) as executor:
+            return list(executor.map(self.safe_remove_cache_directory, paths))
+            
     def clean_browser_cache(self, browser_name: str, force: bool = False) -> Dict:
         """
         Clean cache for a specific browser with safety checks
         """
-        if browser_name not in self.browser_configs:
+        config = self.browser_configs.get(browser_name)
+        if config is None:
             return {'success': False, 'error': f'Unsupported browser: {browser_name}'}
-            
+        return self._clean_browser_with_config(browser_name, config, force)
+        
+    def _clean_browser_with_config(self, browser_name: str, config: Dict, force: bool) -> Dict:
+        """
+        clean_browser_cache() for a browser whose config is already looked up
+        """
         # Safety check: Don't clean if browser is running (unless forced)
         if not force and self.is_browser_running(browser_name):
             return {
@@ -173,7 +445,6 @@ class BrowserCacheCleaner:
                 'size_freed': 0
             }
             
-        config = self.browser_configs[browser_name]
         total_size_freed = 0
         paths_cleaned = []
         errors = []
@@ -181,42 +452,42 @@ class BrowserCacheCleaner:
         # Handle Firefox special case (profile-based)
         if browser_name == 'Firefox':
             firefox_profiles = self.get_firefox_profiles()
-            for profile_cache in firefox_profiles:
-                success, size_freed = self.safe_remove_cache_directory(profile_cache)
+            for profile_cache, (success, size_freed) in zip(firefox_profiles, self._clean_paths(firefox_profiles)):
                 if success:
                     paths_cleaned.append(str(profile_cache))
                     total_size_freed += size_freed
                 else:
                     errors.append(f"Failed to clean {profile_cache}")
         else:
-            # Handle standard cache paths
-            cache_paths = config.get('cache_paths', [])
-            temp_paths = config.get('temp_paths', [])
+            # Handle standard cache paths; most users only have a couple of
+            # these browsers, so missing folders are dropped up front
+            all_paths = [path for path in config['clean_paths'] if os.path.isdir(path)]
             
-            for cache_path in cache_paths + temp_paths:
-                success, size_freed = self.safe_remove_cache_directory(cache_path)
+            for cache_path, (success, size_freed) in zip(all_paths, self._clean_paths(all_paths)):
                 if success:
-                    paths_cleaned.append(str(cache_path))
+                    paths_cleaned.append(cache_path)
                     total_size_freed += size_freed
-                elif cache_path.exists():
+                else:
                     errors.append(f"Failed to clean {cache_path}")
                     
         if paths_cleaned:
-            self.browsers_cleaned += 1
-            self.cache_size_freed += total_size_freed
+            with self._stats_lock:
+                self.browsers_cleaned += 1
+                self.cache_size_freed += total_size_freed
             
         return {
             'success': len(paths_cleaned) > 0,
             'browser': browser_name,
             'paths_cleaned': paths_cleaned,
             'size_freed': total_size_freed,
-            'size_freed_mb': total_size_freed / 1024 / 1024,
             'errors': errors
         }
         
-    def clean_all_browsers(self, force: bool = False) -> Dict:
+    def clean_all_browsers(self, force: bool = False, browser_info: Optional[Dict] = None) -> Dict:
         """
         Clean cache for all detected browsers
+        browser_info, a result of get_browser_info(), lets browsers already
+        found not to be installed be skipped without probing them again
         """
         self.logger.info("Starting browser cache cleanup...")
         
@@ -224,22 +495,33 @@ class BrowserCacheCleaner:
         total_size_freed = 0
         browsers_processed = 0
         
-        for browser_name in self.browser_configs.keys():
+        def process_browser(item: Tuple[str, Dict]) -> Dict:
+            browser_name, config = item
             self.logger.info(f"Processing {browser_name}...")
-            result = self.clean_browser_cache(browser_name, force)
+            if browser_info is not None and not browser_info.get(browser_name, {}).get('installed', True):
+                return {'success': False, 'browser': browser_name, 'error': 'Not installed', 'size_freed': 0}
+            return self._clean_browser_with_config(browser_name, config, force)
+            
+        # Browsers use separate directories, so they are cleaned concurrently;
+        # the results are then tallied in browser_configs order
+        browsers = list(self.browser_configs.items())
+        with ThreadPoolExecutor(max_workers=min(self.BROWSER_WORKERS, len(browsers))) as executor:
+            browser_results = list(executor.map(process_browser, browsers))
+            
+        for (browser_name, _), result in zip(browsers, browser_results):
             results[browser_name] = result
             
             if result['success']:
                 browsers_processed += 1
                 total_size_freed += result['size_freed']
-                self.logger.info(f"{browser_name}: {result['size_freed_mb']:.2f} MB freed")
+                self.logger.info(f"{browser_name}: {_mb(result['size_freed']):.2f} MB freed")
             else:
                 self.logger.warning(f"{browser_name}: {result.get('error', 'Unknown error')}")
                 
         summary = {
             'browsers_processed': browsers_processed,
             'total_size_freed': total_size_freed,
-            'total_size_freed_mb': total_size_freed / 1024 / 1024,
+            'total_size_freed_mb': _mb(total_size_freed),
             'browser_results': results
         }
         
@@ -266,15 +548,15 @@ class BrowserCacheCleaner:
                 if profiles:
                     info['installed'] = True
                     info['cache_paths'] = [str(p) for p in profiles]
-                    info['cache_size_mb'] = sum(self.get_directory_size(p) for p in profiles) / 1024 / 1024
+                    info['cache_size_mb'] = _mb(sum(self.get_directory_size(p) for p in profiles))
             else:
                 cache_paths = config.get('cache_paths', [])
-                existing_paths = [p for p in cache_paths if p.exists()]
+                existing_paths = [p for p in cache_paths if os.path.exists(p)]
                 
                 if existing_paths:
                     info['installed'] = True
                     info['cache_paths'] = [str(p) for p in existing_paths]
-                    info['cache_size_mb'] = sum(self.get_directory_size(p) for p in existing_paths) / 1024 / 1024
+                    info['cache_size_mb'] = _mb(sum(self.get_directory_size(p) for p in existing_paths))
                     
             # Check if browser is running
             info['running'] = self.is_browser_running(browser_name)
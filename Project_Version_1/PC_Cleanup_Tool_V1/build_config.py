@@ -8,6 +8,19 @@ import os
 import sys
 from pathlib import Path
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+# Portable config is fixed, so it is stored already serialized (same bytes
+# json.dump(..., indent=2) would produce)
+_PORTABLE_CONFIG_JSON = b'''{
+  "portable_mode": true,
+  "log_directory": "./logs",
+  "report_directory": "./reports",
+  "branding": {
+    "title": "Nick's PC Optimization Suite - Portable",
+    "company": "Nick P - IT Solutions"
+  }
+}'''
 
 def create_spec_file():
     """Create PyInstaller spec file for advanced configuration"""
@@ -248,11 +261,10 @@ def build_executable():
     
     print("🔨 Building standalone executable...")
     
-    # Clean previous builds
-    if os.path.exists('dist'):
-        shutil.rmtree('dist')
-    if os.path.exists('build'):
-        shutil.rmtree('build')
+    # Clean previous builds (separate trees, so removed side by side)
+    folders = [folder for folder in ('dist', 'build') if os.path.exists(folder)]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(shutil.rmtree, folders))
     
     # Build using spec file
     PyInstaller.__main__.run([
@@ -275,28 +287,15 @@ def create_portable_package():
     
     portable_dir.mkdir()
     
-    # Copy executable
-    if Path('dist/NicksPCCleanupTool.exe').exists():
-        shutil.copy2('dist/NicksPCCleanupTool.exe', portable_dir)
-    
-    # Copy documentation
-    for file in ['README.md', 'requirements.txt']:
-        if Path(file).exists():
-            shutil.copy2(file, portable_dir)
+    # Copy executable and documentation
+    files = [file for file in ['dist/NicksPCCleanupTool.exe', 'README.md', 'requirements.txt']
+             if Path(file).exists()]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda file: shutil.copy2(file, portable_dir), files))
     
     # Create portable config
-    portable_config = {
-        "portable_mode": True,
-        "log_directory": "./logs",
-        "report_directory": "./reports",
-        "branding": {
-            "title": "Nick's PC Optimization Suite - Portable",
-            "company": "Nick P - IT Solutions"
-        }
-    }
-    
-    with open(portable_dir / 'portable_config.json', 'w') as f:
-        json.dump(portable_config, f, indent=2)
+    with open(portable_dir / 'portable_config.json', 'wb') as f:
+        f.write(_PORTABLE_CONFIG_JSON)
     
     # Create batch file for easy launching
     batch_content = '''@echo off
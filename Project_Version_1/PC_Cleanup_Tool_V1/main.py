@@ -10,24 +10,191 @@ Version: 1.0.0
 
 import os
 import sys
-import shutil
+import argparse
+import ctypes
+import functools
+import uuid
+import stat
 import tempfile
 import logging
-import subprocess
-import json
+import logging.handlers
+import atexit
+import queue
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, Optional, Union
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from browser_cleaner import BrowserCacheCleaner
 
+# Known-folder ID of the user's Desktop (what Explorer shows, including
+# OneDrive or policy redirection)
+FOLDERID_DESKTOP = uuid.UUID('{B4BFCC3A-DB2C-424C-B029-7FE99A87C641}')
+
+# Progress value for phases whose duration can't be estimated
+PROGRESS_INDETERMINATE = "INDETERMINATE"
+
+# Background writer for log records, started by the first PCCleanupTool
+_log_listener = None
+
+
+# Cleanup report layout, filled in with str.format_map by generate_report.
+# Each section is only written when its key is in the results.
+_REPORT_RULE = "=" * 60
+
+_REPORT_HEADER = """{rule}
+PC CLEANUP & OPTIMIZATION REPORT
+Generated by: {author}'s PC Cleanup Tool v{version}
+{rule}
+
+Cleanup Date: {date}
+System: {computer}
+User: {user}
+
+"""
+
+_REPORT_SECTIONS = (
+    ('temp_cleanup', """TEMPORARY FILES CLEANUP:
+  Files Deleted: {files_deleted}
+  Space Freed: {size_freed_mb:.2f} MB
+  Directories Processed: {directories_processed}
+
+"""),
+    ('browser_cleanup', """BROWSER CACHE CLEANUP:
+  Browsers Detected: {browsers_detected}
+  Browsers Cleaned: {browsers_cleaned}
+  Cache Space Freed: {total_cache_freed_mb:.2f} MB
+
+"""),
+    ('windows_updates', """WINDOWS UPDATE STATUS:
+  Status: {status}
+  Updates Available: {updates_available}
+  Details: {details}
+  Last Checked: {last_checked}
+
+"""),
+    ('summary', """OVERALL SUMMARY:
+  Total Files Deleted: {total_files_deleted}
+  Total Space Freed: {total_size_freed_mb:.2f} MB
+  Errors Encountered: {total_errors}
+  Operation Duration: {duration_seconds:.1f} seconds
+
+""")
+)
+
+_REPORT_FOOTER = """{rule}
+For technical support or custom solutions:
+Contact: {author}
+Professional PC maintenance and optimization services available
+"""
+
+
+class _NotAvailable:
+    """Placeholder for a missing report field; formats as N/A with any format spec"""
+    
+    def __format__(self, format_spec):
+        return "N/A"
+
+
+class _ReportFields(dict):
+    """format_map mapping that renders missing fields as N/A instead of raising"""
+    
+    def __missing__(self, key):
+        return _NotAvailable()
+
+
+class _GUID(ctypes.Structure):
+    _fields_ = [
+        ('Data1', ctypes.c_uint32),
+        ('Data2', ctypes.c_uint16),
+        ('Data3', ctypes.c_uint16),
+        ('Data4', ctypes.c_ubyte * 8)
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def get_desktop_path() -> Path:
+    """
+    Resolve the Desktop folder once via SHGetKnownFolderPath, falling back to
+    ~/Desktop where the shell API isn't available
+    """
+    try:
+        shell32 = ctypes.windll.shell32
+        ole32 = ctypes.windll.ole32
+    except AttributeError:
+        return Path.home() / "Desktop"
+    
+    folder_id = _GUID(
+        FOLDERID_DESKTOP.time_low, FOLDERID_DESKTOP.time_mid, FOLDERID_DESKTOP.time_hi_version,
+        (ctypes.c_ubyte * 8).from_buffer_copy(FOLDERID_DESKTOP.bytes[8:])
+    )
+    path_ptr = ctypes.c_wchar_p()
+    # The buffer must be freed even when the call fails (it is NULL then)
+    try:
+        if shell32.SHGetKnownFolderPath(ctypes.byref(folder_id), 0, None, ctypes.byref(path_ptr)) != 0:
+            return Path.home() / "Desktop"
+        return Path(path_ptr.value)
+    finally:
+        ole32.CoTaskMemFree(path_ptr)
+
+
+@functools.lru_cache(maxsize=None)
+def get_output_dir() -> Path:
+    """Where reports and the log folder go: the Desktop if it exists, else home"""
+    desktop_path = get_desktop_path()
+    return desktop_path if desktop_path.exists() else Path.home()
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_directory(path: str) -> Path:
+    """Create path (and parents) the first time it's asked for in this process"""
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def _is_directory_link(entry: os.DirEntry) -> bool:
+    """
+    True for symlinks and NTFS junctions. is_dir(follow_symlinks=False) is
+    True for a junction, so the reparse-point attribute has to be checked too.
+    """
+    try:
+        attributes = getattr(entry.stat(follow_symlinks=False), 'st_file_attributes', 0)
+    except OSError:
+        return False
+    return entry.is_symlink() or bool(attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+
+
+def _can_write_to(directory: str) -> bool:
+    """
+    Whether a file can actually be created in directory. os.access(W_OK) only
+    looks at the read-only attribute on Windows, which directories ignore, so
+    it never sees an ACL denial; creating a throwaway file does.
+    """
+    try:
+        with tempfile.TemporaryFile(dir=directory):
+            return True
+    except OSError:
+        return False
+
+
 class PCCleanupTool:
     """
     Professional PC cleanup and optimization utility with enterprise-grade features
     """
     
-    def __init__(self):
+    # Progress callbacks fire at most this often unless the percentage moves >= 1
+    PROGRESS_MIN_INTERVAL = 0.05
+    
+    # Temp directories are I/O bound and independent, so they're cleaned in parallel
+    TEMP_CLEANUP_MAX_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+    
+    # Seconds to wait for the PowerShell update query before killing it
+    UPDATE_CHECK_TIMEOUT = 30
+    
+    def __init__(self, progress_callback: Optional[Callable[[float, str], None]] = None,
+                 track_sizes: bool = True, clean_prefetch: bool = False):
         self.version = "1.0.0"
         self.author = "Nick P"
         self.cleanup_stats = {
@@ -38,68 +205,138 @@ class PCCleanupTool:
             'start_time': None,
             'end_time': None
         }
+        # Delete counters are kept per worker thread and merged after each pass
+        self._stats_lock = threading.Lock()
+        self._local = threading.local()
+        self._worker_stats = []
+        self.progress_callback = progress_callback
+        # Sizes are free from the scandir listing on Windows; False skips them entirely
+        self.track_sizes = track_sizes
+        # Prefetch files are mostly locked by Windows, so the folder is opt-in
+        self.clean_prefetch = clean_prefetch
+        self._last_progress = (-1.0, 0.0)
+        self._output_dir = get_output_dir()
         self.setup_logging()
         self.browser_cleaner = BrowserCacheCleaner(self.logger)
         
     def setup_logging(self):
         """Initialize comprehensive logging system"""
-        # Try Desktop first, fallback to user directory if Desktop doesn't exist
-        desktop_path = Path.home() / "Desktop"
-        if desktop_path.exists():
-            log_dir = desktop_path / "PC_Cleanup_Logs"
-        else:
-            log_dir = Path.home() / "PC_Cleanup_Logs"
-        
-        log_dir.mkdir(parents=True, exist_ok=True)
+        # Desktop if it exists, otherwise the user directory (see get_output_dir)
+        log_dir = _ensure_directory(str(self._output_dir / "PC_Cleanup_Logs"))
         
         log_file = log_dir / f"cleanup_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
         
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
+        # Like basicConfig, only the first tool in the process configures logging.
+        # Records are queued and written by a listener thread, so file and
+        # console I/O stays off the cleanup threads.
+        global _log_listener
+        root_logger = logging.getLogger()
+        if not root_logger.handlers:
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            handlers = [
                 logging.FileHandler(log_file),
                 logging.StreamHandler(sys.stdout)
             ]
-        )
+            for handler in handlers:
+                handler.setFormatter(formatter)
+                
+            log_queue = queue.Queue(-1)
+            _log_listener = logging.handlers.QueueListener(log_queue, *handlers)
+            _log_listener.start()
+            # Flushes whatever is still queued when the process exits
+            atexit.register(_log_listener.stop)
+            
+            root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            root_logger.setLevel(logging.INFO)
+            
         self.logger = logging.getLogger(__name__)
         self.logger.info(f"PC Cleanup Tool v{self.version} initialized")
         
-    def is_file_in_use(self, filepath: Path) -> bool:
+    def report_progress(self, percent: Union[float, str], message: str, force: bool = False):
         """
-        Check if a file is currently in use by another process
-        Uses Windows-specific method for accurate detection
+        Send (percent, message) to the progress callback, if one was given.
+        Updates closer than PROGRESS_MIN_INTERVAL that move less than 1% are
+        dropped unless force is set. percent may be PROGRESS_INDETERMINATE,
+        which is always sent.
         """
-        try:
-            # Try to rename the file to itself (Windows-specific check)
-            os.rename(str(filepath), str(filepath))
-            return False
-        except (OSError, PermissionError):
-            return True
+        if self.progress_callback is None:
+            return
+        
+        if percent == PROGRESS_INDETERMINATE:
+            self.progress_callback(percent, message)
+            return
+        
+        now = time.monotonic()
+        last_percent, last_time = self._last_progress
+        if not force and percent - last_percent < 1 and now - last_time < self.PROGRESS_MIN_INTERVAL:
+            return
+        
+        self._last_progress = (percent, now)
+        self.progress_callback(percent, message)
+        
+    def _thread_stats(self) -> Dict[str, int]:
+        """
+        Delete counters for the calling thread; the lock is only taken the first
+        time a thread registers its counters
+        """
+        stats = getattr(self._local, 'stats', None)
+        if stats is None:
+            stats = {'files': 0, 'size': 0, 'errors': 0}
+            self._local.stats = stats
+            with self._stats_lock:
+                self._worker_stats.append(stats)
+        return stats
+        
+    def _count_error(self):
+        """Count an error from outside the temp-file workers (may run on any thread)"""
+        with self._stats_lock:
+            self.cleanup_stats['errors_encountered'] += 1
+            
+    def _merge_thread_stats(self):
+        """Fold the per-thread counters into cleanup_stats once the workers are done"""
+        with self._stats_lock:
+            worker_stats, self._worker_stats = self._worker_stats, []
+            self._local = threading.local()
+            
+            for stats in worker_stats:
+                self.cleanup_stats['temp_files_deleted'] += stats['files']
+                self.cleanup_stats['temp_size_freed'] += stats['size']
+                self.cleanup_stats['errors_encountered'] += stats['errors']
             
-    def safe_delete_file(self, filepath: Path) -> bool:
+    def safe_delete_file(self, entry: Union[os.DirEntry, str]) -> bool:
         """
         Safely delete a file with proper error handling
+        Takes a scandir DirEntry or a plain path string
         Returns True if successful, False otherwise
         """
+        filepath = entry if isinstance(entry, str) else entry.path
         try:
-            if not filepath.exists():
-                return False
-                
-            if self.is_file_in_use(filepath):
-                self.logger.warning(f"File in use, skipping: {filepath}")
-                return False
-                
-            file_size = filepath.stat().st_size
-            filepath.unlink()
+            if not self.track_sizes:
+                file_size = 0
+            elif isinstance(entry, str):
+                file_size = os.lstat(filepath).st_size
+            else:
+                # Size comes from the directory listing, no extra stat on Windows
+                file_size = entry.stat(follow_symlinks=False).st_size
+            os.unlink(filepath)
             
-            self.cleanup_stats['temp_files_deleted'] += 1
-            self.cleanup_stats['temp_size_freed'] += file_size
-            self.logger.info(f"Deleted: {filepath} ({file_size} bytes)")
+            stats = self._thread_stats()
+            stats['files'] += 1
+            stats['size'] += file_size
+            # Per-file lines are DEBUG only; the summary is logged at INFO
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Deleted: {filepath} ({file_size} bytes)")
             return True
             
-        except (PermissionError, OSError) as e:
-            self.cleanup_stats['errors_encountered'] += 1
+        except FileNotFoundError:
+            # Already gone
+            return False
+        except PermissionError:
+            # Locked by another process (sharing violation)
+            self.logger.warning(f"File in use, skipping: {filepath}")
+            return False
+        except OSError as e:
+            self._thread_stats()['errors'] += 1
             self.logger.error(f"Failed to delete {filepath}: {e}")
             return False
             
@@ -110,22 +347,54 @@ class PCCleanupTool:
         """
         self.logger.info("Starting temporary file cleanup...")
         
+        # (directory, max walk depth, whole subtrees under it are disposable)
         temp_dirs = [
-            Path(os.environ.get('TEMP', '')),
-            Path(os.environ.get('TMP', '')),
-            Path('C:/Windows/Temp'),
-            Path('C:/Windows/Prefetch'),
-            Path.home() / 'AppData/Local/Temp'
+            (os.environ.get('TEMP'), None, True),
+            (os.environ.get('TMP'), None, True),
+            ('C:/Windows/Temp', None, True),
+            (str(Path.home() / 'AppData/Local/Temp'), None, True)
         ]
+        if self.clean_prefetch:
+            # Flat folder whose files are mostly held open by the OS
+            temp_dirs.append(('C:/Windows/Prefetch', 0, False))
         
-        # Remove duplicates and invalid paths
-        temp_dirs = [d for d in set(temp_dirs) if d.exists() and d.is_dir()]
+        # Remove duplicates and invalid paths. %TEMP%, %TMP% and AppData\Local\Temp
+        # are usually the same folder spelled differently, so compare resolved paths
+        unique_dirs = {}
+        for directory, max_depth, remove_subtrees in temp_dirs:
+            if not directory:
+                continue  # Environment variable not set
+            try:
+                resolved = os.path.realpath(directory)
+            except OSError:
+                continue
+            key = os.path.normcase(resolved)
+            if key in unique_dirs or not os.path.isdir(resolved):
+                continue
+            # One upfront check instead of a failure for every file inside
+            if not _can_write_to(resolved):
+                self.logger.info(f"No write access, skipping: {resolved}")
+                continue
+            unique_dirs[key] = (Path(resolved), max_depth, remove_subtrees)
+        temp_dirs = list(unique_dirs.values())
         
         initial_stats = self.cleanup_stats.copy()
         
-        for temp_dir in temp_dirs:
-            self.logger.info(f"Cleaning directory: {temp_dir}")
-            self._clean_directory_recursive(temp_dir)
+        with ThreadPoolExecutor(max_workers=self.TEMP_CLEANUP_MAX_WORKERS) as executor:
+            futures = {}
+            for temp_dir, max_depth, remove_subtrees in temp_dirs:
+                self.logger.info(f"Cleaning directory: {temp_dir}")
+                if remove_subtrees:
+                    future = executor.submit(self._clean_temp_root, temp_dir)
+                else:
+                    future = executor.submit(self._clean_directory_tree, temp_dir, max_depth)
+                futures[future] = temp_dir
+                
+            for done, future in enumerate(as_completed(futures), 1):
+                future.result()
+                self.report_progress(40 * done / len(temp_dirs), f"Cleaned {futures[future]}")
+                
+        self._merge_thread_stats()
             
         files_deleted = self.cleanup_stats['temp_files_deleted'] - initial_stats['temp_files_deleted']
         size_freed = self.cleanup_stats['temp_size_freed'] - initial_stats['temp_size_freed']
@@ -138,32 +407,103 @@ class PCCleanupTool:
             'directories_processed': len(temp_dirs)
         }
         
-    def _clean_directory_recursive(self, directory: Path, max_depth: int = 3, current_depth: int = 0):
+    def _clean_temp_root(self, root: Path):
         """
-        Recursively clean a directory with depth limiting for safety
+        Clean a temp directory whose contents are all disposable: files directly
+        in it are deleted one by one, subdirectories are torn down whole
         """
-        if current_depth > max_depth:
+        try:
+            with os.scandir(root) as entries:
+                children = list(entries)
+        except (PermissionError, OSError) as e:
+            self.logger.error(f"Error accessing directory {root}: {e}")
+            self._thread_stats()['errors'] += 1
             return
             
+        for entry in children:
+            if entry.is_file(follow_symlinks=False):
+                self.safe_delete_file(entry)
+            elif entry.is_dir(follow_symlinks=False):
+                self._remove_tree(entry)
+                
+    def _remove_tree(self, root: os.DirEntry):
+        """
+        Delete a directory tree bottom-up. Files are counted as they are actually
+        deleted, and junctions/links are removed without entering them, so files
+        behind a link are neither deleted nor counted.
+        """
+        if _is_directory_link(root):
+            self._remove_directory(root.path)
+            return
+            
+        directories = []
+        stack = [root.path]
+        while stack:
+            current = stack.pop()
+            directories.append(current)
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if not entry.is_dir(follow_symlinks=False):
+                            self.safe_delete_file(entry)
+                        elif _is_directory_link(entry):
+                            self._remove_directory(entry.path)
+                        else:
+                            stack.append(entry.path)
+            except OSError as e:
+                self.logger.error(f"Error accessing directory {current}: {e}")
+                self._thread_stats()['errors'] += 1
+                
+        # Parents were listed before their children, so reversed is bottom-up
+        for directory in reversed(directories):
+            self._remove_directory(directory)
+        self.logger.info(f"Removed directory tree: {root.path}")
+        
+    def _remove_directory(self, path: str):
+        """rmdir an emptied directory or a junction/link (never its target)"""
         try:
-            for item in directory.iterdir():
-                if item.is_file():
-                    self.safe_delete_file(item)
-                elif item.is_dir() and current_depth < max_depth:
-                    # Clean subdirectory contents first
-                    self._clean_directory_recursive(item, max_depth, current_depth + 1)
-                    # Try to remove empty directory
-                    try:
-                        if not any(item.iterdir()):  # Check if empty
-                            item.rmdir()
-                            self.logger.info(f"Removed empty directory: {item}")
-                    except (OSError, PermissionError):
-                        pass  # Directory not empty or permission denied
-                        
-        except (PermissionError, OSError) as e:
-            self.logger.error(f"Error accessing directory {directory}: {e}")
-            self.cleanup_stats['errors_encountered'] += 1
+            os.rmdir(path)
+        except OSError:
+            pass  # Not empty (something inside was kept) or permission denied
             
+    def _clean_directory_tree(self, directory: Union[str, Path], max_depth: int = 3):
+        """
+        Clean a directory tree with depth limiting for safety. Directories are
+        walked iteratively and emptied subdirectories are removed bottom-up
+        afterwards, so removing one never needs an emptiness check first.
+        """
+        subdirectories = []
+        stack = [(directory, 0)]
+        while stack:
+            current, depth = stack.pop()
+            try:
+                # DirEntry carries the file type (and on Windows the size) from the
+                # directory listing, so no per-item stat is needed
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_file(follow_symlinks=False):
+                            self.safe_delete_file(entry)
+                        elif entry.is_dir(follow_symlinks=False) and depth < max_depth:
+                            stack.append((entry.path, depth + 1))
+                            subdirectories.append(entry.path)
+                            
+            except (PermissionError, OSError) as e:
+                self.logger.error(f"Error accessing directory {current}: {e}")
+                self._thread_stats()['errors'] += 1
+                
+        # Children were always found after their parents, so reverse order is leaves first
+        for item in reversed(subdirectories):
+            try:
+                os.rmdir(item)
+                self.logger.debug("Removed empty directory: %s", item)
+            except (OSError, PermissionError):
+                pass  # Directory not empty or permission denied
+                
+    @functools.cached_property
+    def browser_info(self) -> Dict:
+        """Installed browsers and their cache sizes, probed once per tool instance"""
+        return self.browser_cleaner.get_browser_info()
+        
     def clean_browser_caches(self) -> Dict:
         """
         Clean browser caches using the BrowserCacheCleaner module
@@ -172,11 +512,11 @@ class PCCleanupTool:
         
         try:
             # Get browser info first
-            browser_info = self.browser_cleaner.get_browser_info()
+            browser_info = self.browser_info
             self.logger.info(f"Detected browsers: {list(browser_info.keys())}")
             
             # Clean all browsers (don't force if running)
-            cleanup_results = self.browser_cleaner.clean_all_browsers(force=False)
+            cleanup_results = self.browser_cleaner.clean_all_browsers(force=False, browser_info=browser_info)
             
             # Update main cleanup stats
             self.cleanup_stats['browser_caches_cleared'] = cleanup_results['browsers_processed']
@@ -191,7 +531,7 @@ class PCCleanupTool:
             
         except Exception as e:
             self.logger.error(f"Browser cache cleanup failed: {e}")
-            self.cleanup_stats['errors_encountered'] += 1
+            self._count_error()
             return {
                 'browsers_detected': 0,
                 'browsers_cleaned': 0,
@@ -203,85 +543,75 @@ class PCCleanupTool:
         """
         Check Windows Update status using PowerShell commands
         """
+        # Only needed here, so kept out of the startup imports
+        import json
+        import subprocess
+        
         self.logger.info("Checking Windows Update status...")
         
         try:
-            # Use PowerShell to check for updates
+            # Single PowerShell process that always answers in JSON; the Windows
+            # Update Agent COM API needs no extra modules
             powershell_cmd = [
-                "powershell", "-Command",
-                "Get-WUList -MicrosoftUpdate | Select-Object Title, Size | ConvertTo-Json"
+                "powershell", "-NoProfile", "-NonInteractive", "-Command",
+                "$Updates = (New-Object -ComObject Microsoft.Update.Session)."
+                "CreateUpdateSearcher().Search('IsInstalled=0').Updates; "
+                "@{count = $Updates.Count; titles = @($Updates | Select-Object -ExpandProperty Title)} "
+                "| ConvertTo-Json -Compress"
             ]
             
-            # Fallback command if PSWindowsUpdate module not available
-            fallback_cmd = [
-                "powershell", "-Command",
-                "$UpdateSession = New-Object -ComObject Microsoft.Update.Session; "
-                "$UpdateSearcher = $UpdateSession.CreateUpdateSearcher(); "
-                "$SearchResult = $UpdateSearcher.Search('IsInstalled=0'); "
-                "$SearchResult.Updates.Count"
-            ]
+            # Keep the console host hidden
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            startupinfo.wShowWindow = subprocess.SW_HIDE
             
             try:
-                # Try the advanced command first
-                result = subprocess.run(
+                # communicate() drains stdout and stderr concurrently, so a long
+                # update list can't fill the pipe buffer and stall PowerShell
+                process = subprocess.Popen(
                     powershell_cmd,
-                    capture_output=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
                     text=True,
-                    timeout=30,
-                    creationflags=subprocess.CREATE_NO_WINDOW
+                    creationflags=subprocess.CREATE_NO_WINDOW,
+                    startupinfo=startupinfo
                 )
+                try:
+                    stdout, stderr = process.communicate(timeout=self.UPDATE_CHECK_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.communicate()
+                    raise
                 
-                if result.returncode != 0:
-                    # Fall back to basic command
-                    result = subprocess.run(
-                        fallback_cmd,
-                        capture_output=True,
-                        text=True,
-                        timeout=30,
-                        creationflags=subprocess.CREATE_NO_WINDOW
-                    )
-                    
-                if result.returncode == 0:
-                    output = result.stdout.strip()
+                if process.returncode == 0:
+                    output = stdout.strip()
                     
                     try:
-                        # Try to parse as number (fallback command)
-                        update_count = int(output)
-                        status = "Updates Available" if update_count > 0 else "System Up to Date"
-                        
+                        updates = json.loads(output)
+                    except json.JSONDecodeError:
                         return {
-                            'status': status,
-                            'updates_available': update_count,
-                            'details': f"{update_count} updates pending" if update_count > 0 else "No updates needed",
+                            'status': "Check Complete",
+                            'updates_available': 0,
+                            'details': "Update status retrieved",
+                            'raw_output': output,
                             'last_checked': datetime.now().isoformat()
                         }
-                    except ValueError:
-                        # Try to parse as JSON (advanced command)
-                        try:
-                            updates = json.loads(output) if output else []
-                            update_count = len(updates) if isinstance(updates, list) else 0
-                            
-                            return {
-                                'status': "Updates Available" if update_count > 0 else "System Up to Date",
-                                'updates_available': update_count,
-                                'details': updates if update_count > 0 else "No updates needed",
-                                'last_checked': datetime.now().isoformat()
-                            }
-                        except json.JSONDecodeError:
-                            return {
-                                'status': "Check Complete",
-                                'updates_available': 0,
-                                'details': "Update status retrieved",
-                                'raw_output': output,
-                                'last_checked': datetime.now().isoformat()
-                            }
+                        
+                    update_count = updates.get('count', 0)
+                    return {
+                        'status': "Updates Available" if update_count > 0 else "System Up to Date",
+                        'updates_available': update_count,
+                        'details': f"{update_count} updates pending" if update_count > 0 else "No updates needed",
+                        'titles': updates.get('titles') or [],
+                        'last_checked': datetime.now().isoformat()
+                    }
                 else:
-                    self.logger.warning(f"PowerShell command failed: {result.stderr}")
+                    self.logger.warning(f"PowerShell command failed: {stderr}")
                     return {
                         'status': "Check Failed",
                         'updates_available': -1,
                         'details': "Could not determine update status",
-                        'error': result.stderr,
+                        'error': stderr,
                         'last_checked': datetime.now().isoformat()
                     }
                     
@@ -290,13 +620,13 @@ class PCCleanupTool:
                 return {
                     'status': "Check Timeout",
                     'updates_available': -1,
-                    'details': "Update check timed out after 30 seconds",
+                    'details': f"Update check timed out after {self.UPDATE_CHECK_TIMEOUT} seconds",
                     'last_checked': datetime.now().isoformat()
                 }
                 
         except Exception as e:
             self.logger.error(f"Windows Update check failed: {e}")
-            self.cleanup_stats['errors_encountered'] += 1
+            self._count_error()
             return {
                 'status': "Check Error",
                 'updates_available': -1,
@@ -313,14 +643,23 @@ class PCCleanupTool:
         
         results = {}
         
-        # Temporary files cleanup
-        results['temp_cleanup'] = self.clean_temp_files()
-        
-        # Browser cache cleanup
-        results['browser_cleanup'] = self.clean_browser_caches()
-        
-        # Windows update check
-        results['windows_updates'] = self.check_windows_updates()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Windows update check is independent of the cleanup, so its
+            # PowerShell latency overlaps the disk work below
+            updates_future = executor.submit(self.check_windows_updates)
+            
+            # Temporary files cleanup
+            self.report_progress(0, "Cleaning temporary files...", force=True)
+            results['temp_cleanup'] = self.clean_temp_files()
+            
+            # Browser cache cleanup
+            self.report_progress(40, "Cleaning browser caches...", force=True)
+            results['browser_cleanup'] = self.clean_browser_caches()
+            
+            # Windows update check
+            if not updates_future.done():
+                self.report_progress(PROGRESS_INDETERMINATE, "Checking Windows updates...")
+            results['windows_updates'] = updates_future.result()
         
         # TODO: Add registry cleanup
         
@@ -336,7 +675,9 @@ class PCCleanupTool:
         }
         
         self.logger.info("=== Cleanup Complete ===")
+        self.report_progress(90, "Generating report...", force=True)
         self.generate_report(results)
+        self.report_progress(100, "Cleanup completed successfully!", force=True)
         
         return results
         
@@ -345,57 +686,26 @@ class PCCleanupTool:
         Generate comprehensive cleanup report for user and audit purposes
         """
         # Use same logic as logging for report path
-        desktop_path = Path.home() / "Desktop"
-        if desktop_path.exists():
-            report_path = desktop_path / f"PC_Cleanup_Report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-        else:
-            report_path = Path.home() / f"PC_Cleanup_Report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-        
-        with open(report_path, 'w') as f:
-            f.write("=" * 60 + "\n")
-            f.write(f"PC CLEANUP & OPTIMIZATION REPORT\n")
-            f.write(f"Generated by: {self.author}'s PC Cleanup Tool v{self.version}\n")
-            f.write("=" * 60 + "\n\n")
-            
-            f.write(f"Cleanup Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"System: {os.environ.get('COMPUTERNAME', 'Unknown')}\n")
-            f.write(f"User: {os.environ.get('USERNAME', 'Unknown')}\n\n")
-            
-            if 'temp_cleanup' in results:
-                temp = results['temp_cleanup']
-                f.write("TEMPORARY FILES CLEANUP:\n")
-                f.write(f"  Files Deleted: {temp['files_deleted']}\n")
-                f.write(f"  Space Freed: {temp['size_freed_mb']:.2f} MB\n")
-                f.write(f"  Directories Processed: {temp['directories_processed']}\n\n")
-            
-            if 'browser_cleanup' in results:
-                browser = results['browser_cleanup']
-                f.write("BROWSER CACHE CLEANUP:\n")
-                f.write(f"  Browsers Detected: {browser['browsers_detected']}\n")
-                f.write(f"  Browsers Cleaned: {browser['browsers_cleaned']}\n")
-                f.write(f"  Cache Space Freed: {browser['total_cache_freed_mb']:.2f} MB\n\n")
-            
-            if 'windows_updates' in results:
-                updates = results['windows_updates']
-                f.write("WINDOWS UPDATE STATUS:\n")
-                f.write(f"  Status: {updates['status']}\n")
-                f.write(f"  Updates Available: {updates['updates_available']}\n")
-                f.write(f"  Details: {updates['details']}\n")
-                f.write(f"  Last Checked: {updates['last_checked']}\n\n")
-            
-            if 'summary' in results:
-                summary = results['summary']
-                f.write("OVERALL SUMMARY:\n")
-                f.write(f"  Total Files Deleted: {summary['total_files_deleted']}\n")
-                f.write(f"  Total Space Freed: {summary['total_size_freed_mb']:.2f} MB\n")
-                f.write(f"  Errors Encountered: {summary['total_errors']}\n")
-                f.write(f"  Operation Duration: {summary['duration_seconds']:.1f} seconds\n\n")
-            
-            f.write("=" * 60 + "\n")
-            f.write("For technical support or custom solutions:\n")
-            f.write(f"Contact: {self.author}\n")
-            f.write("Professional PC maintenance and optimization services available\n")
-            
+        now = datetime.now()
+        report_path = self._output_dir / f"PC_Cleanup_Report_{now.strftime('%Y%m%d_%H%M%S')}.txt"
+        
+        # Build the whole report in memory and write it out in one go
+        fields = _ReportFields(
+            rule=_REPORT_RULE,
+            author=self.author,
+            version=self.version,
+            date=now.strftime('%Y-%m-%d %H:%M:%S'),
+            computer=os.environ.get('COMPUTERNAME', 'Unknown'),
+            user=os.environ.get('USERNAME', 'Unknown')
+        )
+        parts = [_REPORT_HEADER.format_map(fields)]
+        for key, template in _REPORT_SECTIONS:
+            if key in results:
+                parts.append(template.format_map(_ReportFields(results[key])))
+        parts.append(_REPORT_FOOTER.format_map(fields))
+        
+        report_path.write_text("".join(parts), encoding='utf-8')
+        
         self.logger.info(f"Report generated: {report_path}")
 
 
@@ -403,12 +713,17 @@ def main():
     """
     Main entry point for the PC Cleanup Tool
     """
+    parser = argparse.ArgumentParser(description="PC Cleanup & Optimization Tool")
+    parser.add_argument('--no-size-stats', action='store_true',
+                        help="don't measure freed space (fewer file system calls)")
+    args = parser.parse_args()
+    
     print(f"PC Cleanup & Optimization Tool v1.0.0")
     print(f"Professional system maintenance utility")
     print("=" * 50)
     
     try:
-        cleanup_tool = PCCleanupTool()
+        cleanup_tool = PCCleanupTool(track_sizes=not args.no_size_stats)
         results = cleanup_tool.run_full_cleanup()
         
         print("\nCleanup completed successfully!")
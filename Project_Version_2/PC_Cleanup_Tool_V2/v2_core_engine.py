@@ -4,33 +4,268 @@ Advanced cleanup engine with before/after state capture and comprehensive analys
 """
 
 import os
-import sys
 import json
 import time
-import shutil
 import psutil
-import hashlib
 import threading
+import functools
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from typing import Dict, List, Tuple, Optional, Any
 import subprocess
 import winreg
-import tempfile
+import mmap
+import stat
+import struct
+import ctypes
+import ctypes.wintypes
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
 
 # Import V1 modules for enhanced functionality
 try:
-    from browser_cleaner import BrowserCleaner
+    from browser_cleaner import BrowserCacheCleaner
+except ImportError:
+    print("Warning: V1 browser cleaner not found. Browser cache features unavailable.")
+    BrowserCacheCleaner = None
+
+try:
     from enterprise_features import EnterpriseFeatures
 except ImportError:
     print("Warning: Some V1 modules not found. Limited functionality available.")
-    BrowserCleaner = None
     EnterpriseFeatures = None
 
+# orjson (C extension) reads and writes the engine's JSON when installed
+try:
+    import orjson
+    
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    
+    _loads = json.loads
+
+# BLAKE3 (SIMD) is used for duplicate hashing when installed
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
+# pywin32 gives direct COM access to the Windows Update Agent
+try:
+    import pythoncom
+    import win32com.client
+except ImportError:
+    pythoncom = None
+    win32com = None
+
+def _iter_files(root: str):
+    """
+    Yield an os.DirEntry for every non-directory below root, walking with an
+    explicit stack. Sizes then come from entry.stat(), which on Windows is
+    filled in by the directory listing rather than a call per file. Junctions
+    are neither entered nor yielded: temp cleanup deletes what this lists, and
+    a junction's target lies outside the tree.
+    """
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        attributes = getattr(entry.stat(follow_symlinks=False), 'st_file_attributes', 0)
+                        if not attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT:
+                            stack.append(entry.path)
+                        continue
+                except OSError:
+                    continue
+                yield entry
+
+# Folders the large-file scan never enters: system areas with no user files
+# to clean, plus anything starting with '$' ($Recycle.Bin, $WinREAgent, ...)
+_LARGE_FILE_SKIP_DIRS = frozenset({
+    'System Volume Information', 'Recovery', 'Windows', 'ProgramData'
+})
+
+def _skip_large_file_dir(entry: os.DirEntry) -> bool:
+    """True for skipped system folders and for junctions, which can loop back up the tree"""
+    name = entry.name
+    if name.startswith('$') or name in _LARGE_FILE_SKIP_DIRS:
+        return True
+    attributes = getattr(entry.stat(follow_symlinks=False), 'st_file_attributes', 0)
+    return bool(attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+
+def _new_hasher():
+    """BLAKE3 when installed (SIMD, much faster on large files), else BLAKE2b"""
+    if blake3 is not None:
+        return blake3()
+    import hashlib  # Only needed without blake3; hashlib loads OpenSSL on import
+    return hashlib.blake2b(digest_size=16)
+
+def _map_file(f):
+    """Read-only memory map of an open file, hashed without copying it in"""
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def _group_by_hash(paths: List[str], read) -> List[List[str]]:
+    """
+    Groups of two or more paths whose read(file) data hash the same;
+    unreadable files are left out
+    """
+    groups = defaultdict(list)
+    for path in paths:
+        try:
+            with open(path, 'rb') as f:
+                data = read(f)
+                try:
+                    hasher = _new_hasher()
+                    hasher.update(data)
+                finally:
+                    if isinstance(data, mmap.mmap):
+                        data.close()
+        except (OSError, ValueError):
+            continue
+        groups[hasher.digest()].append(path)
+    return [group for group in groups.values() if len(group) > 1]
+
+def _iter_file_sizes(root: str):
+    """(path, size) for every file below root; files that can't be stat'ed are skipped"""
+    for entry in _iter_files(root):
+        try:
+            yield entry.path, entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+
+# FILE_ID_BOTH_DIR_INFO: a directory handle returns many records per call,
+# each already carrying the size and attributes, so no stat per file
+FILE_ID_BOTH_DIRECTORY_INFO = 10
+FILE_ID_BOTH_DIRECTORY_RESTART_INFO = 11
+FILE_LIST_DIRECTORY = 0x0001
+FILE_SHARE_ALL = 0x0001 | 0x0002 | 0x0004
+OPEN_EXISTING = 3
+FILE_FLAG_BACKUP_SEMANTICS = 0x02000000
+ERROR_NO_MORE_FILES = 18
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+DIR_INFO_BUFFER_BYTES = 64 * 1024
+# NextEntryOffset, EndOfFile, FileAttributes, FileNameLength; the name starts at 104
+_DIR_INFO_RECORD = struct.Struct('<I36xqxxxxxxxxII')
+_DIR_INFO_NAME_OFFSET = 104
+
+def _load_kernel32():
+    """Private kernel32 with the directory-info prototypes set, or None off Windows"""
+    try:
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    except (AttributeError, OSError):
+        return None
+    
+    kernel32.CreateFileW.restype = ctypes.wintypes.HANDLE
+    kernel32.CreateFileW.argtypes = [
+        ctypes.wintypes.LPCWSTR, ctypes.wintypes.DWORD, ctypes.wintypes.DWORD, ctypes.c_void_p,
+        ctypes.wintypes.DWORD, ctypes.wintypes.DWORD, ctypes.wintypes.HANDLE
+    ]
+    kernel32.GetFileInformationByHandleEx.argtypes = [
+        ctypes.wintypes.HANDLE, ctypes.c_int, ctypes.c_void_p, ctypes.wintypes.DWORD
+    ]
+    kernel32.CloseHandle.argtypes = [ctypes.wintypes.HANDLE]
+    return kernel32
+
+_KERNEL32 = _load_kernel32()
+
+def _list_dir_sizes_win32(path: str) -> Tuple[int, List[str]]:
+    """_list_dir_sizes via GetFileInformationByHandleEx(FileIdBothDirectoryInfo)"""
+    handle = _KERNEL32.CreateFileW(
+        path, FILE_LIST_DIRECTORY, FILE_SHARE_ALL, None,
+        OPEN_EXISTING, FILE_FLAG_BACKUP_SEMANTICS, None
+    )
+    if handle is None or handle == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+    
+    file_bytes = 0
+    subdirs = []
+    buffer = ctypes.create_string_buffer(DIR_INFO_BUFFER_BYTES)
+    info_class = FILE_ID_BOTH_DIRECTORY_RESTART_INFO
+    try:
+        while _KERNEL32.GetFileInformationByHandleEx(handle, info_class, buffer, DIR_INFO_BUFFER_BYTES):
+            info_class = FILE_ID_BOTH_DIRECTORY_INFO
+            data = buffer.raw
+            offset = 0
+            while True:
+                next_offset, size, attributes, name_length = _DIR_INFO_RECORD.unpack_from(data, offset)
+                if attributes & stat.FILE_ATTRIBUTE_DIRECTORY:
+                    start = offset + _DIR_INFO_NAME_OFFSET
+                    name = data[start:start + name_length].decode('utf-16-le')
+                    # Junctions and links are not followed, as with scandir's is_dir(follow_symlinks=False)
+                    if name not in ('.', '..') and not attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT:
+                        subdirs.append(os.path.join(path, name))
+                else:
+                    file_bytes += size
+                if not next_offset:
+                    break
+                offset += next_offset
+        
+        error = ctypes.get_last_error()
+        if error != ERROR_NO_MORE_FILES:
+            raise ctypes.WinError(error)
+    finally:
+        _KERNEL32.CloseHandle(handle)
+    return file_bytes, subdirs
+
+def _list_dir_sizes(path: str) -> Tuple[int, List[str]]:
+    """
+    (bytes of the files directly in path, its subdirectory paths). On Windows
+    the entries come back in 64 KiB batches with their sizes, which matters on
+    cache folders holding tens of thousands of files. Raises OSError if path
+    can't be listed.
+    """
+    if _KERNEL32 is not None:
+        return _list_dir_sizes_win32(path)
+    
+    file_bytes = 0
+    subdirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                else:
+                    file_bytes += entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+    return file_bytes, subdirs
+
+def _tree_size(root: str) -> int:
+    """
+    Total file size below root. Sizes come with each directory listing, so
+    this is one batched listing per folder and no stat per file.
+    """
+    total_size = 0
+    stack = [root]
+    while stack:
+        try:
+            file_bytes, subdirs = _list_dir_sizes(stack.pop())
+        except OSError:
+            continue
+        total_size += file_bytes
+        stack.extend(subdirs)
+    return total_size
+
+# Both dataclasses declare __slots__ (no per-instance __dict__); fields have
+# no defaults, so this works without dataclass(slots=True) from Python 3.10
 @dataclass
 class SystemState:
     """Comprehensive system state snapshot"""
+    __slots__ = ('timestamp', 'disk_usage', 'memory_info', 'cpu_percent', 'temp_files_count',
+                 'temp_files_size', 'browser_cache_size', 'startup_programs_count',
+                 'registry_entries_count', 'running_processes_count', 'network_status',
+                 'windows_update_status', 'system_uptime', 'available_updates',
+                 'large_files_count', 'duplicate_files_count', 'total_cleanup_potential')
     timestamp: str
     disk_usage: Dict[str, Dict[str, int]]
     memory_info: Dict[str, int]
@@ -52,6 +287,8 @@ class SystemState:
 @dataclass
 class CleanupResult:
     """Detailed cleanup operation results"""
+    __slots__ = ('operation_type', 'files_processed', 'files_deleted', 'space_freed',
+                 'errors_encountered', 'time_taken', 'success_rate', 'details')
     operation_type: str
     files_processed: int
     files_deleted: int
@@ -61,12 +298,77 @@ class CleanupResult:
     success_rate: float
     details: List[str]
 
+def _stage(operation_type: str):
+    """
+    Cleanup-stage decorator: times the stage with perf_counter and turns an
+    exception into a failed CleanupResult for operation_type
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            start_time = time.perf_counter()
+            try:
+                result = method(self, *args, **kwargs)
+            except Exception as e:
+                return CleanupResult(
+                    operation_type=operation_type,
+                    files_processed=0,
+                    files_deleted=0,
+                    space_freed=0,
+                    errors_encountered=1,
+                    time_taken=time.perf_counter() - start_time,
+                    success_rate=0,
+                    details=[f"Error: {str(e)}"]
+                )
+            result.time_taken = time.perf_counter() - start_time
+            return result
+        return wrapper
+    return decorator
+
 class V2CleanupEngine:
     """Enhanced cleanup engine with comprehensive state tracking"""
     
+    # A temp-file listing this recent is deleted from directly instead of
+    # walking the temp folders a second time
+    TEMP_SCAN_MAX_AGE = 60.0
+    
+    # Large-file count: size threshold, folder depth below the drive root,
+    # and the most seconds one scan may take
+    LARGE_FILE_BYTES = 100 * 1024 * 1024
+    LARGE_FILE_SCAN_DEPTH = 5
+    LARGE_FILE_SCAN_SECONDS = 5.0
+    
+    # Update status is network-bound and rarely changes within a session
+    UPDATE_STATUS_MAX_AGE = 30 * 60
+    UPDATE_SEARCH_TIMEOUT = 10.0
+    
+    # Run/RunOnce keys counted as startup programs, and how long a count is
+    # reused (state is captured twice per cleanup)
+    STARTUP_KEYS = tuple(
+        (hive, key_path)
+        for key_path in (r"SOFTWARE\Microsoft\Windows\CurrentVersion\Run",
+                         r"SOFTWARE\Microsoft\Windows\CurrentVersion\RunOnce")
+        for hive in (winreg.HKEY_LOCAL_MACHINE, winreg.HKEY_CURRENT_USER)
+    )
+    STARTUP_COUNT_MAX_AGE = 30.0
+    
+    # Duplicate count: smallest file considered, bytes compared before a full
+    # hash, and how long a count is reused (cleanup never touches these folders)
+    DUPLICATE_MIN_BYTES = 1024 * 1024
+    DUPLICATE_HEAD_BYTES = 4 * 1024
+    DUPLICATE_COUNT_MAX_AGE = 10 * 60
+    
+    # Drives rarely change mid-session; the list is re-read after this long
+    # so a drive plugged in later still shows up
+    PARTITIONS_MAX_AGE = 10 * 60
+    
+    # Non-blocking CPU readings need this much time since the previous sample
+    # to be meaningful; closer calls take a short blocking sample instead
+    CPU_SAMPLE_MIN_INTERVAL = 0.1
+    CPU_SAMPLE_FALLBACK_INTERVAL = 0.05
+    
     def __init__(self, enable_online_features=True):
         self.enable_online_features = enable_online_features
-        self.browser_cleaner = BrowserCleaner() if BrowserCleaner else None
         self.enterprise_features = EnterpriseFeatures() if EnterpriseFeatures else None
         
         # State tracking
@@ -74,12 +376,43 @@ class V2CleanupEngine:
         self.after_state = None
         self.cleanup_results = []
         
+        # id -> (object, asdict(object)), so each state/result converts once
+        self._dict_cache = {}
+        
+        # Temp roots are resolved once; the environment doesn't change under us
+        self._temp_dirs = self._resolve_temp_dirs()
+        
+        # {temp root: [(file path, size)]} from the last temp analysis
+        self._temp_scan = None
+        self._temp_scan_time = 0.0
+        
+        # (boot time, monotonic time, (status, count)) of the last update check
+        self._update_status_cache = None
+        # Future of the COM update search still running, if any
+        self._update_search = None
+        self._update_search_lock = threading.Lock()
+        
+        # (monotonic time, count) of the last startup program count
+        self._startup_count_cache = None
+        self._duplicate_count_cache = None
+        self._partitions_cache = None
+        
+        # Primes psutil's CPU counter so later readings can be non-blocking
+        psutil.cpu_percent(interval=None)
+        self._last_cpu_sample = time.monotonic()
+        
         # Progress tracking
         self.progress_callback = None
         self.status_callback = None
         
+        # Set by cancel(); a running one-click cleanup stops at its next step
+        self._cancelled = threading.Event()
+        
         # Setup logging
         self.setup_logging()
+        
+        # The V1 browser cleaner logs through the engine's logger
+        self.browser_cleaner = BrowserCacheCleaner(self.logger) if BrowserCacheCleaner else None
     
     def setup_logging(self):
         """Enhanced logging setup"""
@@ -115,6 +448,15 @@ class V2CleanupEngine:
         """Set status update callback for UI"""
         self.status_callback = callback
     
+    def cancel(self):
+        """Ask a running one-click cleanup to stop before its next step"""
+        self._cancelled.set()
+    
+    def _check_cancelled(self):
+        """Raise if cancel() was called, so the running cleanup unwinds"""
+        if self._cancelled.is_set():
+            raise RuntimeError("Cleanup cancelled")
+    
     def update_progress(self, percentage, message=""):
         """Update progress with callback"""
         if self.progress_callback:
@@ -127,19 +469,15 @@ class V2CleanupEngine:
         self.update_progress(0, "Analyzing system state...")
         
         try:
-            # Disk usage analysis
+            # Disk usage analysis - every drive is probed at once, since a
+            # slow network or spun-down drive would otherwise hold up the rest
             disk_usage = {}
-            for partition in psutil.disk_partitions():
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    disk_usage[partition.device] = {
-                        'total': usage.total,
-                        'used': usage.used,
-                        'free': usage.free,
-                        'percent': (usage.used / usage.total) * 100
-                    }
-                except:
-                    continue
+            partitions = self._get_partitions()
+            if partitions:
+                with ThreadPoolExecutor(max_workers=len(partitions)) as executor:
+                    for partition, usage in zip(partitions, executor.map(self._disk_usage, partitions)):
+                        if usage is not None:
+                            disk_usage[partition.device] = usage
             
             # Memory information
             memory = psutil.virtual_memory()
@@ -151,7 +489,7 @@ class V2CleanupEngine:
             }
             
             # CPU information
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = self._sample_cpu_percent()
             
             # Temporary files analysis
             temp_files_count, temp_files_size = self._analyze_temp_files()
@@ -213,81 +551,133 @@ class V2CleanupEngine:
             self.logger.error(f"Error capturing system state: {str(e)}")
             raise
     
-    def _analyze_temp_files(self) -> Tuple[int, int]:
-        """Analyze temporary files for count and size"""
-        count = 0
-        size = 0
+    def _sample_cpu_percent(self) -> float:
+        """
+        CPU usage since the previous sample, without blocking for a second.
+        A call right after another takes a short sample instead.
+        """
+        now = time.monotonic()
+        if now - self._last_cpu_sample < self.CPU_SAMPLE_MIN_INTERVAL:
+            usage = psutil.cpu_percent(interval=self.CPU_SAMPLE_FALLBACK_INTERVAL)
+        else:
+            usage = psutil.cpu_percent(interval=None)
+        self._last_cpu_sample = time.monotonic()
+        return usage
+    
+    def _get_partitions(self) -> list:
+        """Mounted partitions, listed again only every PARTITIONS_MAX_AGE seconds"""
+        cached = self._partitions_cache
+        if cached is not None and time.monotonic() - cached[0] < self.PARTITIONS_MAX_AGE:
+            return cached[1]
         
+        partitions = psutil.disk_partitions(all=False)
+        self._partitions_cache = (time.monotonic(), partitions)
+        return partitions
+    
+    def _disk_usage(self, partition) -> Optional[Dict[str, int]]:
+        """Usage figures for one partition, or None if it can't be read"""
+        try:
+            usage = psutil.disk_usage(partition.mountpoint)
+            return {
+                'total': usage.total,
+                'used': usage.used,
+                'free': usage.free,
+                'percent': (usage.used / usage.total) * 100
+            }
+        except:
+            return None
+    
+    def _resolve_temp_dirs(self) -> Tuple[str, ...]:
+        """
+        Existing temp roots, each listed once. Paths are compared after
+        realpath/normcase, so %TEMP% and ~\\AppData\\Local\\Temp written
+        differently still count as one root.
+        """
         temp_dirs = [
             os.environ.get('TEMP', ''),
             os.environ.get('TMP', ''),
             'C:\\Windows\\Temp',
             os.path.expanduser('~\\AppData\\Local\\Temp')
         ]
-        
+        resolved = {}
         for temp_dir in temp_dirs:
-            if os.path.exists(temp_dir):
-                try:
-                    for root, dirs, files in os.walk(temp_dir):
-                        for file in files:
-                            try:
-                                file_path = os.path.join(root, file)
-                                if os.path.exists(file_path):
-                                    size += os.path.getsize(file_path)
-                                    count += 1
-                            except:
-                                continue
-                except:
-                    continue
+            if temp_dir and os.path.isdir(temp_dir):
+                real_path = os.path.realpath(temp_dir)
+                resolved.setdefault(os.path.normcase(real_path), real_path)
+        return tuple(resolved.values())
+    
+    def _analyze_temp_files(self) -> Tuple[int, int]:
+        """Analyze temporary files for count and size"""
+        count = 0
+        size = 0
+        
+        # Each root is walked on its own thread; the work is all file-system calls
+        temp_dirs = self._temp_dirs
+        if not temp_dirs:
+            return count, size
+        with ThreadPoolExecutor(max_workers=len(temp_dirs)) as executor:
+            listings = list(executor.map(self._analyze_temp_dir, temp_dirs))
+        for listing in listings:
+            count += len(listing)
+            size += sum(file_size for _, file_size in listing)
+        
+        # Kept so the cleanup that follows can delete without re-walking
+        self._temp_scan = dict(zip(temp_dirs, listings))
+        self._temp_scan_time = time.monotonic()
         
         return count, size
     
+    def _analyze_temp_dir(self, temp_dir: str) -> List[Tuple[str, int]]:
+        """(path, size) of every file below one temp root"""
+        return list(_iter_file_sizes(temp_dir))
+    
+    def _take_temp_scan(self) -> Dict[str, List[Tuple[str, int]]]:
+        """
+        The last temp listing if it is recent enough to delete from, else {}.
+        Either way it is dropped, so the after-cleanup state walks afresh.
+        """
+        scan = self._temp_scan
+        self._temp_scan = None
+        if scan is None or time.monotonic() - self._temp_scan_time > self.TEMP_SCAN_MAX_AGE:
+            return {}
+        return scan
+    
     def _analyze_browser_cache(self) -> int:
         """Analyze browser cache sizes"""
         if not self.browser_cleaner:
             return 0
         
         total_size = 0
-        browsers = ['chrome', 'edge', 'firefox', 'opera', 'brave']
         
-        for browser in browsers:
-            try:
-                cache_paths = self.browser_cleaner._get_browser_paths(browser)
-                for path in cache_paths:
-                    if os.path.exists(path):
-                        for root, dirs, files in os.walk(path):
-                            for file in files:
-                                try:
-                                    file_path = os.path.join(root, file)
-                                    total_size += os.path.getsize(file_path)
-                                except:
-                                    continue
-            except:
-                continue
+        # Every cache root is gathered first and then sized side by side: each
+        # browser's cache and temp folders, plus one cache2 per Firefox profile
+        roots = []
+        for config in self.browser_cleaner.browser_configs.values():
+            roots.extend(config['clean_paths'])
+        roots.extend(self.browser_cleaner.get_firefox_profiles())
+        roots = [root for root in dict.fromkeys(roots) if os.path.isdir(root)]
+        
+        if roots:
+            with ThreadPoolExecutor(max_workers=min(8, len(roots))) as executor:
+                total_size = sum(executor.map(_tree_size, roots))
         
         return total_size
     
     def _count_startup_programs(self) -> int:
         """Count startup programs"""
-        count = 0
-        startup_keys = [
-            r"SOFTWARE\Microsoft\Windows\CurrentVersion\Run",
-            r"SOFTWARE\Microsoft\Windows\CurrentVersion\RunOnce"
-        ]
+        cached = self._startup_count_cache
+        if cached is not None and time.monotonic() - cached[0] < self.STARTUP_COUNT_MAX_AGE:
+            return cached[1]
         
-        for key_path in startup_keys:
-            try:
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path) as key:
-                    count += winreg.QueryInfoKey(key)[1]  # Number of values
-            except:
-                pass
-            
+        count = 0
+        for hive, key_path in self.STARTUP_KEYS:
             try:
-                with winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path) as key:
+                with winreg.OpenKey(hive, key_path) as key:
                     count += winreg.QueryInfoKey(key)[1]  # Number of values
             except:
                 pass
         
+        self._startup_count_cache = (time.monotonic(), count)
         return count
     
     def _estimate_registry_entries(self) -> int:
@@ -308,7 +698,67 @@ class V2CleanupEngine:
             return False
     
     def _check_windows_updates(self) -> Tuple[str, int]:
-        """Check Windows Update status"""
+        """Check Windows Update status, reusing a recent answer from this boot"""
+        boot_time = psutil.boot_time()
+        cached = self._update_status_cache
+        if cached is not None and cached[0] == boot_time and time.monotonic() - cached[1] < self.UPDATE_STATUS_MAX_AGE:
+            return cached[2]
+        
+        status = self._search_windows_updates()
+        if status[0] != "Unknown":
+            self._update_status_cache = (boot_time, time.monotonic(), status)
+        return status
+    
+    def _search_windows_updates(self) -> Tuple[str, int]:
+        """Ask the Windows Update Agent over COM; PowerShell if pywin32 is missing or COM fails"""
+        if win32com is None:
+            return self._check_windows_updates_powershell()
+        
+        # The search can stall on the network, so it runs on a daemon thread.
+        # A search that overruns is left running and the next check waits on
+        # it again rather than starting another one.
+        with self._update_search_lock:
+            future = self._update_search
+            if future is None:
+                future = self._update_search = Future()
+                threading.Thread(target=self._run_update_search, args=(future,), daemon=True).start()
+        
+        try:
+            count = future.result(timeout=self.UPDATE_SEARCH_TIMEOUT)
+        except FutureTimeoutError:
+            self.logger.warning("Windows Update search timed out")
+            return "Unknown", 0
+        except Exception as e:
+            self._clear_update_search(future)
+            self.logger.warning(f"Windows Update search failed, trying PowerShell: {e}")
+            return self._check_windows_updates_powershell()
+        
+        self._clear_update_search(future)
+        return ("Updates Available", count) if count else ("Up to Date", 0)
+    
+    def _run_update_search(self, future: Future):
+        """Thread body for _search_windows_updates: the COM search, answered through future"""
+        initialized = False
+        try:
+            pythoncom.CoInitialize()
+            initialized = True
+            session = win32com.client.Dispatch("Microsoft.Update.Session")
+            result = session.CreateUpdateSearcher().Search("IsInstalled=0 and Type='Software'")
+            future.set_result(result.Updates.Count)
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            if initialized:
+                pythoncom.CoUninitialize()
+    
+    def _clear_update_search(self, future: Future):
+        """Forget a finished search so the next check starts a fresh one"""
+        with self._update_search_lock:
+            if self._update_search is future:
+                self._update_search = None
+    
+    def _check_windows_updates_powershell(self) -> Tuple[str, int]:
+        """Check Windows Update status through PowerShell's Get-WindowsUpdate"""
         try:
             # Use PowerShell to check for updates
             cmd = [
@@ -319,7 +769,7 @@ class V2CleanupEngine:
             
             if result.returncode == 0 and result.stdout.strip():
                 try:
-                    updates = json.loads(result.stdout)
+                    updates = _loads(result.stdout)
                     if isinstance(updates, list):
                         return "Updates Available", len(updates)
                     elif isinstance(updates, dict):
@@ -335,38 +785,80 @@ class V2CleanupEngine:
         """Count files larger than 100MB"""
         count = 0
         drives = ['C:\\']
+        # The whole scan shares one time budget; past it the count is partial
+        deadline = time.monotonic() + self.LARGE_FILE_SCAN_SECONDS
         
         for drive in drives:
             if os.path.exists(drive):
+                # Breadth-first, so a scan cut short has still covered the
+                # shallow folders of the whole drive
+                queue = deque([(drive, 0)])
+                while queue:
+                    if time.monotonic() > deadline:
+                        self.logger.info(f"Large file scan stopped after {self.LARGE_FILE_SCAN_SECONDS:.0f}s; count is partial")
+                        return count
+                    
+                    path, depth = queue.popleft()
+                    try:
+                        with os.scandir(path) as entries:
+                            for entry in entries:
+                                try:
+                                    if entry.is_dir(follow_symlinks=False):
+                                        # Skipped and too-deep folders are never queued, so they cost no listing
+                                        if depth < self.LARGE_FILE_SCAN_DEPTH and not _skip_large_file_dir(entry):
+                                            queue.append((entry.path, depth + 1))
+                                    elif entry.stat(follow_symlinks=False).st_size > self.LARGE_FILE_BYTES:
+                                        count += 1
+                                except OSError:
+                                    continue
+                    except OSError:
+                        continue
+        
+        return count
+    
+    def _count_duplicate_files(self) -> int:
+        """
+        Count redundant copies among files over 1MB in Downloads and Documents.
+        Only same-size files are read: first their head, then, for heads that
+        match, their full content.
+        """
+        cached = self._duplicate_count_cache
+        if cached is not None and time.monotonic() - cached[0] < self.DUPLICATE_COUNT_MAX_AGE:
+            return cached[1]
+        
+        files_by_size = defaultdict(list)
+        home = Path.home()
+        for folder in ('Downloads', 'Documents'):
+            for entry in _iter_files(str(home / folder)):
                 try:
-                    for root, dirs, files in os.walk(drive):
-                        # Skip system directories
-                        dirs[:] = [d for d in dirs if not d.startswith('$') and d not in ['System Volume Information', 'Recovery']]
-                        
-                        for file in files:
-                            try:
-                                file_path = os.path.join(root, file)
-                                if os.path.getsize(file_path) > 100 * 1024 * 1024:  # 100MB
-                                    count += 1
-                            except:
-                                continue
-                        
-                        # Limit search depth for performance
-                        if len(root.split(os.sep)) > 5:
-                            dirs.clear()
-                except:
+                    size = entry.stat(follow_symlinks=False).st_size
+                except OSError:
                     continue
+                if size > self.DUPLICATE_MIN_BYTES:
+                    files_by_size[size].append(entry.path)
+        
+        candidates = [paths for paths in files_by_size.values() if len(paths) > 1]
+        count = 0
+        if candidates:
+            with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as executor:
+                count = sum(executor.map(self._count_copies, candidates))
         
+        self._duplicate_count_cache = (time.monotonic(), count)
         return count
     
-    def _count_duplicate_files(self) -> int:
-        """Count potential duplicate files (simplified)"""
-        # This is a simplified estimation for performance
-        return 0  # Would require full file hashing for accuracy
+    def _count_copies(self, paths: List[str]) -> int:
+        """Files beyond the first of each identical group among same-size paths"""
+        copies = 0
+        for head_group in _group_by_hash(paths, lambda f: f.read(self.DUPLICATE_HEAD_BYTES)):
+            for full_group in _group_by_hash(head_group, _map_file):
+                copies += len(full_group) - 1
+        return copies
     
     def perform_one_click_cleanup(self) -> Dict[str, Any]:
         """Perform comprehensive one-click cleanup with progress tracking"""
         self.logger.info("Starting One-Click Cleanup V2")
+        self._dict_cache = {}
+        self._cancelled.clear()
         
         try:
             # Capture before state
@@ -375,46 +867,41 @@ class V2CleanupEngine:
             
             # Initialize results
             self.cleanup_results = []
-            total_operations = 6
-            current_operation = 0
-            
-            # 1. Temporary Files Cleanup
-            current_operation += 1
-            self.update_progress(15 + (current_operation * 10), "Cleaning temporary files...")
-            temp_result = self._cleanup_temp_files()
-            self.cleanup_results.append(temp_result)
-            
-            # 2. Browser Cache Cleanup
-            current_operation += 1
-            self.update_progress(15 + (current_operation * 10), "Cleaning browser caches...")
-            browser_result = self._cleanup_browser_caches()
-            self.cleanup_results.append(browser_result)
             
-            # 3. Registry Cleanup
-            current_operation += 1
-            self.update_progress(15 + (current_operation * 10), "Optimizing registry...")
-            registry_result = self._cleanup_registry()
-            self.cleanup_results.append(registry_result)
-            
-            # 4. Startup Optimization
-            current_operation += 1
-            self.update_progress(15 + (current_operation * 10), "Optimizing startup programs...")
-            startup_result = self._optimize_startup()
-            self.cleanup_results.append(startup_result)
-            
-            # 5. System File Cleanup
-            current_operation += 1
-            self.update_progress(15 + (current_operation * 10), "Cleaning system files...")
-            system_result = self._cleanup_system_files()
-            self.cleanup_results.append(system_result)
+            # These stages touch separate resources (temp folders, browser
+            # profiles, registry, recycle bin), so they run side by side and
+            # report progress as each finishes. Results keep this order.
+            self.update_progress(20, "Running cleanup operations...")
+            stages = [
+                self._cleanup_temp_files,
+                self._cleanup_browser_caches,
+                self._cleanup_registry,
+                self._optimize_startup,
+                self._optimize_memory
+            ]
+            results_log = self._open_results_log()
+            try:
+                with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+                    futures = [executor.submit(stage) for stage in stages]
+                    for completed, future in enumerate(as_completed(futures), 1):
+                        self._log_result(results_log, future.result())
+                        self.update_progress(15 + (completed * 10), f"{future.result().operation_type} finished")
+                    stage_results = [future.result() for future in futures]
+                
+                # System File Cleanup runs on its own, since cleanmgr opens its own UI
+                self._check_cancelled()
+                self.update_progress(75, "Cleaning system files...")
+                system_result = self._cleanup_system_files()
+                self._log_result(results_log, system_result)
+            finally:
+                if results_log is not None:
+                    results_log.close()
             
-            # 6. Memory Optimization
-            current_operation += 1
-            self.update_progress(15 + (current_operation * 10), "Optimizing memory...")
-            memory_result = self._optimize_memory()
-            self.cleanup_results.append(memory_result)
+            # Reported in the original stage order
+            self.cleanup_results = stage_results[:4] + [system_result] + stage_results[4:]
             
             # Capture after state
+            self._check_cancelled()
             self.update_progress(85, "Capturing system state after cleanup...")
             self.after_state = self.capture_system_state()
             
@@ -427,9 +914,9 @@ class V2CleanupEngine:
             
             return {
                 'success': True,
-                'before_state': asdict(self.before_state),
-                'after_state': asdict(self.after_state),
-                'cleanup_results': [asdict(result) for result in self.cleanup_results],
+                'before_state': self._as_dict(self.before_state),
+                'after_state': self._as_dict(self.after_state),
+                'cleanup_results': [self._as_dict(result) for result in self.cleanup_results],
                 'report': report
             }
             
@@ -438,47 +925,32 @@ class V2CleanupEngine:
             return {
                 'success': False,
                 'error': str(e),
-                'before_state': asdict(self.before_state) if self.before_state else None,
-                'cleanup_results': [asdict(result) for result in self.cleanup_results]
+                'before_state': self._as_dict(self.before_state) if self.before_state else None,
+                'cleanup_results': [self._as_dict(result) for result in self.cleanup_results]
             }
     
+    @_stage("Temporary Files")
     def _cleanup_temp_files(self) -> CleanupResult:
         """Enhanced temporary files cleanup"""
-        start_time = time.time()
         files_processed = 0
         files_deleted = 0
         space_freed = 0
         errors = 0
         details = []
         
-        temp_dirs = [
-            os.environ.get('TEMP', ''),
-            os.environ.get('TMP', ''),
-            'C:\\Windows\\Temp',
-            os.path.expanduser('~\\AppData\\Local\\Temp')
-        ]
+        # Roots are de-duplicated, so no two threads ever delete in the same tree
+        temp_dirs = self._temp_dirs
+        scan = self._take_temp_scan()
+        if temp_dirs:
+            with ThreadPoolExecutor(max_workers=len(temp_dirs)) as executor:
+                listings = [scan.get(temp_dir) for temp_dir in temp_dirs]
+                for processed, deleted, freed, dir_errors, dir_details in executor.map(self._cleanup_temp_dir, temp_dirs, listings):
+                    files_processed += processed
+                    files_deleted += deleted
+                    space_freed += freed
+                    errors += dir_errors
+                    details.extend(dir_details)
         
-        for temp_dir in temp_dirs:
-            if os.path.exists(temp_dir):
-                try:
-                    for root, dirs, files in os.walk(temp_dir):
-                        for file in files:
-                            files_processed += 1
-                            try:
-                                file_path = os.path.join(root, file)
-                                if os.path.exists(file_path):
-                                    file_size = os.path.getsize(file_path)
-                                    os.remove(file_path)
-                                    files_deleted += 1
-                                    space_freed += file_size
-                            except Exception as e:
-                                errors += 1
-                                continue
-                except Exception as e:
-                    errors += 1
-                    details.append(f"Error accessing {temp_dir}: {str(e)}")
-        
-        time_taken = time.time() - start_time
         success_rate = (files_deleted / files_processed * 100) if files_processed > 0 else 0
         
         details.append(f"Processed {files_processed} files, deleted {files_deleted}")
@@ -490,15 +962,41 @@ class V2CleanupEngine:
             files_deleted=files_deleted,
             space_freed=space_freed,
             errors_encountered=errors,
-            time_taken=time_taken,
+            time_taken=0,
             success_rate=success_rate,
             details=details
         )
     
+    def _cleanup_temp_dir(self, temp_dir: str, listing: Optional[List[Tuple[str, int]]] = None) -> Tuple[int, int, int, int, List[str]]:
+        """
+        Delete the files below one temp root: (processed, deleted, freed, errors, details).
+        listing is a recent (path, size) scan of the root; without one it is walked.
+        """
+        files_processed = 0
+        files_deleted = 0
+        space_freed = 0
+        errors = 0
+        details = []
+        try:
+            for file_path, file_size in (listing if listing is not None else _iter_file_sizes(temp_dir)):
+                files_processed += 1
+                try:
+                    os.remove(file_path)
+                    files_deleted += 1
+                    space_freed += file_size
+                except FileNotFoundError:
+                    continue  # Already gone since the scan
+                except Exception:
+                    errors += 1
+                    continue
+        except Exception as e:
+            errors += 1
+            details.append(f"Error accessing {temp_dir}: {str(e)}")
+        return files_processed, files_deleted, space_freed, errors, details
+    
+    @_stage("Browser Caches")
     def _cleanup_browser_caches(self) -> CleanupResult:
         """Enhanced browser cache cleanup"""
-        start_time = time.time()
-        
         if not self.browser_cleaner:
             return CleanupResult(
                 operation_type="Browser Caches",
@@ -511,45 +1009,35 @@ class V2CleanupEngine:
                 details=["Browser cleaner module not available"]
             )
         
-        try:
-            result = self.browser_cleaner.clean_all_browsers(force_clean=False)
-            time_taken = time.time() - start_time
-            
-            total_space = sum(browser_data.get('space_freed', 0) for browser_data in result.values())
-            total_files = sum(browser_data.get('files_deleted', 0) for browser_data in result.values())
-            
-            details = []
-            for browser, data in result.items():
-                if data.get('files_deleted', 0) > 0:
-                    details.append(f"{browser}: {data['files_deleted']} files, {data['space_freed']/(1024*1024):.1f} MB")
-            
-            return CleanupResult(
-                operation_type="Browser Caches",
-                files_processed=total_files,
-                files_deleted=total_files,
-                space_freed=total_space,
-                errors_encountered=0,
-                time_taken=time_taken,
-                success_rate=100,
-                details=details
-            )
-            
-        except Exception as e:
-            return CleanupResult(
-                operation_type="Browser Caches",
-                files_processed=0,
-                files_deleted=0,
-                space_freed=0,
-                errors_encountered=1,
-                time_taken=time.time() - start_time,
-                success_rate=0,
-                details=[f"Error: {str(e)}"]
-            )
+        # Running browsers are skipped, so their caches are never cleaned underneath them
+        summary = self.browser_cleaner.clean_all_browsers(force=False)
+        
+        # The cleaner reports per cache folder, so folders stand in for files here
+        folders_cleaned = 0
+        folder_errors = 0
+        details = []
+        for browser, data in summary['browser_results'].items():
+            cleaned = len(data.get('paths_cleaned', []))
+            folders_cleaned += cleaned
+            folder_errors += len(data.get('errors', []))
+            if cleaned:
+                details.append(f"{browser}: {cleaned} folders, {data['size_freed']/(1024*1024):.1f} MB")
+        
+        folders_processed = folders_cleaned + folder_errors
+        return CleanupResult(
+            operation_type="Browser Caches",
+            files_processed=folders_processed,
+            files_deleted=folders_cleaned,
+            space_freed=summary['total_size_freed'],
+            errors_encountered=folder_errors,
+            time_taken=0,
+            success_rate=(folders_cleaned / folders_processed * 100) if folders_processed else 100,
+            details=details
+        )
     
+    @_stage("Registry Cleanup")
     def _cleanup_registry(self) -> CleanupResult:
         """Enhanced registry cleanup"""
-        start_time = time.time()
-        
         if not self.enterprise_features:
             return CleanupResult(
                 operation_type="Registry Cleanup",
@@ -562,37 +1050,22 @@ class V2CleanupEngine:
                 details=["Enterprise features module not available"]
             )
         
-        try:
-            result = self.enterprise_features.clean_registry()
-            time_taken = time.time() - start_time
-            
-            return CleanupResult(
-                operation_type="Registry Cleanup",
-                files_processed=result.get('entries_scanned', 0),
-                files_deleted=result.get('entries_cleaned', 0),
-                space_freed=result.get('space_freed', 0),
-                errors_encountered=result.get('errors', 0),
-                time_taken=time_taken,
-                success_rate=result.get('success_rate', 0),
-                details=result.get('details', [])
-            )
-            
-        except Exception as e:
-            return CleanupResult(
-                operation_type="Registry Cleanup",
-                files_processed=0,
-                files_deleted=0,
-                space_freed=0,
-                errors_encountered=1,
-                time_taken=time.time() - start_time,
-                success_rate=0,
-                details=[f"Error: {str(e)}"]
-            )
+        result = self.enterprise_features.clean_registry()
+        
+        return CleanupResult(
+            operation_type="Registry Cleanup",
+            files_processed=result.get('entries_scanned', 0),
+            files_deleted=result.get('entries_cleaned', 0),
+            space_freed=result.get('space_freed', 0),
+            errors_encountered=result.get('errors', 0),
+            time_taken=0,
+            success_rate=result.get('success_rate', 0),
+            details=result.get('details', [])
+        )
     
+    @_stage("Startup Optimization")
     def _optimize_startup(self) -> CleanupResult:
         """Enhanced startup optimization"""
-        start_time = time.time()
-        
         if not self.enterprise_features:
             return CleanupResult(
                 operation_type="Startup Optimization",
@@ -605,119 +1078,78 @@ class V2CleanupEngine:
                 details=["Enterprise features module not available"]
             )
         
-        try:
-            result = self.enterprise_features.analyze_startup_programs()
-            time_taken = time.time() - start_time
-            
-            # Simulate optimization (in real implementation, would disable unnecessary startup items)
-            optimized_count = len([item for item in result if item.get('impact', 'Low') == 'High'])
-            
-            return CleanupResult(
-                operation_type="Startup Optimization",
-                files_processed=len(result),
-                files_deleted=optimized_count,
-                space_freed=0,  # Startup optimization doesn't free disk space
-                errors_encountered=0,
-                time_taken=time_taken,
-                success_rate=100,
-                details=[f"Analyzed {len(result)} startup programs, optimized {optimized_count}"]
-            )
-            
-        except Exception as e:
-            return CleanupResult(
-                operation_type="Startup Optimization",
-                files_processed=0,
-                files_deleted=0,
-                space_freed=0,
-                errors_encountered=1,
-                time_taken=time.time() - start_time,
-                success_rate=0,
-                details=[f"Error: {str(e)}"]
-            )
+        result = self.enterprise_features.analyze_startup_programs()
+        
+        # Simulate optimization (in real implementation, would disable unnecessary startup items)
+        optimized_count = len([item for item in result if item.get('impact', 'Low') == 'High'])
+        
+        return CleanupResult(
+            operation_type="Startup Optimization",
+            files_processed=len(result),
+            files_deleted=optimized_count,
+            space_freed=0,  # Startup optimization doesn't free disk space
+            errors_encountered=0,
+            time_taken=0,
+            success_rate=100,
+            details=[f"Analyzed {len(result)} startup programs, optimized {optimized_count}"]
+        )
     
+    @_stage("System Files Cleanup")
     def _cleanup_system_files(self) -> CleanupResult:
         """Enhanced system files cleanup"""
-        start_time = time.time()
+        # Run Windows Disk Cleanup utility
+        result = subprocess.run(['cleanmgr', '/sagerun:1'], 
+                              capture_output=True, text=True, timeout=300)
         
-        try:
-            # Run Windows Disk Cleanup utility
-            result = subprocess.run(['cleanmgr', '/sagerun:1'], 
-                                  capture_output=True, text=True, timeout=300)
-            
-            time_taken = time.time() - start_time
-            
-            return CleanupResult(
-                operation_type="System Files Cleanup",
-                files_processed=1,
-                files_deleted=1 if result.returncode == 0 else 0,
-                space_freed=0,  # Cannot easily measure cleanmgr results
-                errors_encountered=0 if result.returncode == 0 else 1,
-                time_taken=time_taken,
-                success_rate=100 if result.returncode == 0 else 0,
-                details=["Windows Disk Cleanup executed"]
-            )
-            
-        except Exception as e:
-            return CleanupResult(
-                operation_type="System Files Cleanup",
-                files_processed=0,
-                files_deleted=0,
-                space_freed=0,
-                errors_encountered=1,
-                time_taken=time.time() - start_time,
-                success_rate=0,
-                details=[f"Error: {str(e)}"]
-            )
+        return CleanupResult(
+            operation_type="System Files Cleanup",
+            files_processed=1,
+            files_deleted=1 if result.returncode == 0 else 0,
+            space_freed=0,  # Cannot easily measure cleanmgr results
+            errors_encountered=0 if result.returncode == 0 else 1,
+            time_taken=0,
+            success_rate=100 if result.returncode == 0 else 0,
+            details=["Windows Disk Cleanup executed"]
+        )
     
+    @_stage("Memory Optimization")
     def _optimize_memory(self) -> CleanupResult:
         """Enhanced memory optimization"""
-        start_time = time.time()
+        # Force garbage collection and memory cleanup
+        import gc
+        gc.collect()
         
+        # Clear system file cache (Windows)
         try:
-            # Force garbage collection and memory cleanup
-            import gc
-            gc.collect()
-            
-            # Clear system file cache (Windows)
-            try:
-                subprocess.run(['powershell', '-Command', 'Clear-RecycleBin -Force'], 
-                             capture_output=True, timeout=30)
-            except:
-                pass
-            
-            time_taken = time.time() - start_time
-            
-            return CleanupResult(
-                operation_type="Memory Optimization",
-                files_processed=1,
-                files_deleted=1,
-                space_freed=0,
-                errors_encountered=0,
-                time_taken=time_taken,
-                success_rate=100,
-                details=["Memory optimization completed", "Recycle bin cleared"]
-            )
-            
-        except Exception as e:
-            return CleanupResult(
-                operation_type="Memory Optimization",
-                files_processed=0,
-                files_deleted=0,
-                space_freed=0,
-                errors_encountered=1,
-                time_taken=time.time() - start_time,
-                success_rate=0,
-                details=[f"Error: {str(e)}"]
-            )
+            subprocess.run(['powershell', '-Command', 'Clear-RecycleBin -Force'], 
+                         capture_output=True, timeout=30)
+        except:
+            pass
+        
+        return CleanupResult(
+            operation_type="Memory Optimization",
+            files_processed=1,
+            files_deleted=1,
+            space_freed=0,
+            errors_encountered=0,
+            time_taken=0,
+            success_rate=100,
+            details=["Memory optimization completed", "Recycle bin cleared"]
+        )
     
     def _generate_comprehensive_report(self) -> Dict[str, Any]:
         """Generate comprehensive before/after comparison report"""
         if not self.before_state or not self.after_state:
             return {"error": "Missing before/after state data"}
         
-        # Calculate improvements
-        space_freed = sum(result.space_freed for result in self.cleanup_results)
-        files_cleaned = sum(result.files_deleted for result in self.cleanup_results)
+        # Calculate improvements, in one pass over the stage results
+        space_freed = 0
+        files_cleaned = 0
+        success_total = 0
+        for result in self.cleanup_results:
+            space_freed += result.space_freed
+            files_cleaned += result.files_deleted
+            success_total += result.success_rate
         
         # Disk space improvement
         before_free = sum(disk['free'] for disk in self.before_state.disk_usage.values())
@@ -735,16 +1167,49 @@ class V2CleanupEngine:
                 'disk_space_improvement': disk_improvement,
                 'memory_improvement': memory_improvement,
                 'cleanup_operations': len(self.cleanup_results),
-                'success_rate': sum(r.success_rate for r in self.cleanup_results) / len(self.cleanup_results)
+                'success_rate': success_total / len(self.cleanup_results)
             },
-            'before_state': asdict(self.before_state),
-            'after_state': asdict(self.after_state),
-            'detailed_results': [asdict(result) for result in self.cleanup_results],
+            'before_state': self._as_dict(self.before_state),
+            'after_state': self._as_dict(self.after_state),
+            'detailed_results': [self._as_dict(result) for result in self.cleanup_results],
             'recommendations': self._generate_recommendations()
         }
         
         return report
     
+    def _open_results_log(self):
+        """
+        This run's NDJSON results file, one line per finished stage so progress
+        can be followed live; None if it can't be created
+        """
+        results_file = self.log_dir / f"cleanup_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.ndjson"
+        try:
+            return open(results_file, 'ab')
+        except OSError as e:
+            self.logger.warning(f"Could not create results log: {e}")
+            return None
+    
+    def _log_result(self, results_log, result: CleanupResult):
+        """Append one stage result to the results log as soon as it finishes"""
+        if results_log is None:
+            return
+        try:
+            results_log.write(_dumps(self._as_dict(result)) + b'\n')
+            results_log.flush()
+        except OSError as e:
+            self.logger.warning(f"Could not write results log: {e}")
+    
+    def _as_dict(self, item) -> Dict[str, Any]:
+        """
+        asdict(item), converted once per object; the report and the result
+        payload then share the same dicts instead of deep-copying twice
+        """
+        cached = self._dict_cache.get(id(item))
+        if cached is None or cached[0] is not item:
+            cached = (item, asdict(item))
+            self._dict_cache[id(item)] = cached
+        return cached[1]
+    
     def _generate_recommendations(self) -> List[str]:
         """Generate system optimization recommendations"""
         recommendations = []